@@ -13,13 +13,13 @@ class AssignOrdersJob(BaseBackgroundJob):
     ):
         self.use_case = use_case
 
-    async def execute(self):
-        await self.use_case.handle(AssignOrdersCommand())
+    async def execute(self) -> int:
+        return await self.use_case.handle(AssignOrdersCommand())
 
 
 @inject
 async def run_job(
     use_case: AssignOrdersUseCase = Provide[Container.assign_orders_use_case],
-):
+) -> int:
     job = AssignOrdersJob(use_case=use_case)
-    await job.execute()
+    return await job.execute()
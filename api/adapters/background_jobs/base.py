@@ -3,5 +3,6 @@ from abc import ABC, abstractmethod
 
 class BaseBackgroundJob(ABC):
     @abstractmethod
-    async def execute(self):
+    async def execute(self) -> int:
+        """Выполнить задачу. Возвращает количество обработанных записей."""
         pass
@@ -0,0 +1,31 @@
+import logging
+from datetime import datetime, timedelta, timezone
+
+from infrastructure.adapters.postgres.courier_position_store import PostgresCourierPositionStore
+
+from .base import BaseBackgroundJob
+
+
+class CourierPositionsPartitionsJob(BaseBackgroundJob):
+    """
+    Обслуживание секций courier_positions: создание дневных секций заранее и удаление устаревших.
+    Устаревшие строки секции по умолчанию удаляются по тому же сроку хранения.
+    """
+
+    def __init__(self, store: PostgresCourierPositionStore, partitions_ahead: int, retention_days: int):
+        self.store = store
+        self.partitions_ahead = partitions_ahead
+        self.retention_days = retention_days
+
+    async def execute(self) -> int:
+        today = datetime.now(timezone.utc).date()
+        created = await self.store.ensure_partitions(today, self.partitions_ahead)
+        expired_before = today - timedelta(days=self.retention_days)
+        dropped = await self.store.drop_partitions_before(expired_before)
+        deleted = await self.store.delete_default_before(expired_before)
+        if created or dropped or deleted:
+            logging.info(
+                f"[CourierPositions] partitions created: {created}, dropped: {dropped}, "
+                f"rows deleted from default partition: {deleted}"
+            )
+        return len(created) + len(dropped) + deleted
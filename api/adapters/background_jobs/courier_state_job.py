@@ -0,0 +1,65 @@
+import logging
+import time
+
+from infrastructure.adapters.in_process import InMemoryCourierState
+from infrastructure.adapters.postgres.leader_election import AdvisoryLockLeaderElection
+
+
+class CourierStateJob:
+    """
+    Перемещение курьеров в памяти (InMemoryCourierState) и отложенное сохранение позиций.
+
+    Состояние загружается при получении лидерства и сбрасывается при его потере: после смены лидера
+    позиции перечитываются из базы, движение с момента последнего flush прежнего лидера теряется.
+    """
+
+    def __init__(
+        self,
+        courier_state: InMemoryCourierState,
+        leader_election: AdvisoryLockLeaderElection | None = None,
+        resync_interval: float = 60.0,
+    ):
+        self.courier_state = courier_state
+        self.leader_election = leader_election
+        self.resync_interval = resync_interval
+        self._last_resync = 0.0
+
+    async def tick(self) -> int:
+        if not await self._is_leader():
+            return 0
+
+        if not self.courier_state.is_loaded or time.monotonic() - self._last_resync >= self.resync_interval:
+            await self.courier_state.load()
+            self._last_resync = time.monotonic()
+        return await self.courier_state.tick()
+
+    async def flush(self) -> int:
+        if not self.courier_state.is_loaded:
+            return 0
+        return await self.courier_state.flush()
+
+    async def shutdown(self) -> None:
+        """Сохранить оставшиеся позиции и отпустить лидерство."""
+        try:
+            if self.courier_state.is_loaded:
+                await self.courier_state.flush()
+        except Exception:
+            logging.exception("[CourierState] failed to flush positions on shutdown")
+        finally:
+            if self.leader_election is not None:
+                await self.leader_election.release()
+
+    async def _is_leader(self) -> bool:
+        if self.leader_election is None:
+            return True
+
+        try:
+            is_leader = await self.leader_election.is_leader()
+        except Exception:
+            logging.exception("[LeaderElection] failed to check leadership for courier state")
+            is_leader = False
+
+        if not is_leader and self.courier_state.is_loaded:
+            logging.warning("[CourierState] not a leader anymore, dropping in-memory state")
+            self.courier_state.reset()
+        return is_leader
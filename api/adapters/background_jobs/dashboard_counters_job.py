@@ -0,0 +1,28 @@
+import logging
+from typing import AsyncContextManager, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.adapters.postgres.projections import reconcile_counters
+from infrastructure.metrics import metrics
+
+from .base import BaseBackgroundJob
+
+
+class DashboardCountersReconcileJob(BaseBackgroundJob):
+    """Сверка счетчиков дашборда с проекциями. Исправляет расхождения после записей в обход репозиториев."""
+
+    def __init__(self, session_factory: Callable[[], AsyncContextManager[AsyncSession]]):
+        self._session_factory = session_factory
+
+    async def execute(self) -> int:
+        async with self._session_factory() as session:
+            # Согласованный снимок счетчиков и проекций без блокировки таблицы счетчиков
+            await session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+            drift = await reconcile_counters(session)
+            await session.commit()
+
+        if drift:
+            logging.warning(f"[DashboardCounters] corrected drift: {drift}")
+            metrics.counter("dashboard_counters_corrections_total").inc()
+        return len(drift)
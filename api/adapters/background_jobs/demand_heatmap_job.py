@@ -0,0 +1,22 @@
+import logging
+from datetime import datetime, timedelta, timezone
+
+from infrastructure.adapters.postgres.demand_heatmap_store import PostgresDemandHeatmapStore
+from infrastructure.adapters.postgres.projections import heatmap_bucket
+
+from .base import BaseBackgroundJob
+
+
+class DemandHeatmapCleanupJob(BaseBackgroundJob):
+    """Удаление минутных корзин demand_heatmap старше retention_minutes."""
+
+    def __init__(self, store: PostgresDemandHeatmapStore, retention_minutes: int):
+        self.store = store
+        self.retention_minutes = retention_minutes
+
+    async def execute(self) -> int:
+        before = heatmap_bucket(datetime.now(timezone.utc) - timedelta(minutes=self.retention_minutes))
+        deleted = await self.store.delete_before(before)
+        if deleted:
+            logging.info(f"[DemandHeatmap] deleted {deleted} buckets before {before}")
+        return deleted
@@ -0,0 +1,23 @@
+import logging
+from typing import Awaitable, Callable
+
+from api.adapters.background_jobs.runner import PeriodicJobRunner
+
+
+class PeriodicFlushJob:
+    """Периодическая запись буфера процесса в базу с последней записью при остановке."""
+
+    def __init__(self, name: str, flush: Callable[[], Awaitable[int]], interval: float):
+        self.name = name
+        self.flush = flush
+        self.runner = PeriodicJobRunner(name, flush, interval=interval)
+
+    def start(self) -> None:
+        self.runner.start()
+
+    async def shutdown(self) -> None:
+        await self.runner.stop()
+        try:
+            await self.flush()
+        except Exception:
+            logging.exception(f"[JobRunner] final {self.name} failed")
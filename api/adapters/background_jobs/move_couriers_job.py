@@ -1,6 +1,13 @@
+import asyncio
+import logging
+import math
+from typing import Callable
+
 from dependency_injector.wiring import Provide, inject
 
 from core.application.use_cases.commands.move_couriers import MoveCouriersCommand, MoveCouriersUseCase
+from infrastructure.adapters.postgres.leader_election import AdvisoryLockLeaderElection
+from infrastructure.adapters.postgres.worker_leases import PostgresWorkerLeases
 from infrastructure.di.container import Container
 
 from .base import BaseBackgroundJob
@@ -13,13 +20,76 @@ class MoveCouriersJob(BaseBackgroundJob):
     ):
         self.use_case = use_case
 
-    async def execute(self):
-        await self.use_case.handle(MoveCouriersCommand())
+    async def execute(self) -> int:
+        return await self.use_case.handle(MoveCouriersCommand())
+
+
+class ShardedMoveCouriersJob(BaseBackgroundJob):
+    """
+    Перемещение курьеров по шардам hash(courier_id) % shard_count.
+
+    Владение шардом - advisory lock на шард. Доля процесса - ceil(shard_count / живые воркеры),
+    живые воркеры считаются по арендам в worker_leases. При появлении воркера остальные отпускают
+    лишние шарды, при падении его аренда истекает, доля остальных растет, и они разбирают его шарды.
+    Каждый шард обрабатывается в своей транзакции.
+    """
+
+    def __init__(
+        self,
+        use_case_factory: Callable[[], MoveCouriersUseCase],
+        leader_election_factory: Callable[..., AdvisoryLockLeaderElection],
+        worker_leases: PostgresWorkerLeases,
+        shard_count: int,
+    ):
+        self.use_case_factory = use_case_factory
+        self.worker_leases = worker_leases
+        self.shard_count = shard_count
+        self.shard_elections = [leader_election_factory(name=f"move_couriers:{shard}") for shard in range(shard_count)]
+
+    async def acquire_shards(self) -> list[int]:
+        live_workers = await self.worker_leases.renew()
+        target = math.ceil(self.shard_count / max(live_workers, 1))
+
+        # Сначала подтверждаем уже занятые шарды, лишние сверх доли отпускаем для новых воркеров
+        held = [shard for shard, election in enumerate(self.shard_elections) if election.holds_lock]
+        for shard in held[target:]:
+            await self.shard_elections[shard].release()
+        held = held[:target]
+
+        owned = []
+        for shard in held + [shard for shard in range(self.shard_count) if shard not in held]:
+            if len(owned) >= target:
+                break
+            if await self.shard_elections[shard].is_leader():
+                owned.append(shard)
+        return owned
+
+    async def execute(self) -> int:
+        shards = await self.acquire_shards()
+        results = await asyncio.gather(
+            *(
+                self.use_case_factory().handle(MoveCouriersCommand(shard=shard, shard_count=self.shard_count))
+                for shard in shards
+            ),
+            return_exceptions=True,
+        )
+        moved = 0
+        for shard, result in zip(shards, results):
+            if isinstance(result, Exception):
+                logging.error(f"Failed to move couriers of shard {shard}", exc_info=result)
+            else:
+                moved += result
+        return moved
+
+    async def release(self):
+        for election in self.shard_elections:
+            await election.release()
+        await self.worker_leases.release()
 
 
 @inject
 async def run_job(
     use_case: MoveCouriersUseCase = Provide[Container.move_couriers_use_case],
-):
+) -> int:
     job = MoveCouriersJob(use_case=use_case)
-    await job.execute()
+    return await job.execute()
@@ -0,0 +1,36 @@
+from dependency_injector.wiring import Provide, inject
+
+from core.application.use_cases.commands.reposition_idle_couriers import (
+    RepositionIdleCouriersCommand,
+    RepositionIdleCouriersUseCase,
+)
+from infrastructure.config.settings import get_settings
+from infrastructure.di.container import Container
+
+from .base import BaseBackgroundJob
+
+
+class RepositionCouriersJob(BaseBackgroundJob):
+    def __init__(
+        self,
+        use_case: RepositionIdleCouriersUseCase,
+    ):
+        self.use_case = use_case
+
+    async def execute(self) -> int:
+        settings = get_settings().process
+        return await self.use_case.handle(
+            RepositionIdleCouriersCommand(
+                reserve_fraction=settings.REPOSITION_RESERVE_FRACTION,
+                window_minutes=settings.REPOSITION_WINDOW_MINUTES,
+                hotspots=settings.REPOSITION_HOTSPOTS,
+            )
+        )
+
+
+@inject
+async def run_job(
+    use_case: RepositionIdleCouriersUseCase = Provide[Container.reposition_idle_couriers_use_case],
+) -> int:
+    job = RepositionCouriersJob(use_case=use_case)
+    return await job.execute()
@@ -0,0 +1,102 @@
+import asyncio
+import contextlib
+import logging
+import time
+from typing import Awaitable, Callable
+
+from core.ports.assignment_trigger_interface import AssignmentTriggerInterface
+from infrastructure.metrics import metrics
+
+
+class PeriodicJobRunner:
+    """
+    Запускает периодическую задачу в собственной корутине: следующий запуск начинается только после
+    завершения предыдущего, поэтому запуски не накладываются.
+
+    Режимы:
+    - фиксированный темп (adaptive=False): запуски через interval от начала предыдущего, при переполнении
+      следующий запуск начинается сразу и учитывается в job_overruns_total;
+    - адаптивный (adaptive=True): пока задача что-то обработала, следующий запуск выполняется сразу,
+      без работы интервал удваивается до max_interval.
+    Если задан wake_trigger, пауза прерывается его уведомлением, а периодический запуск остается страховкой.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        job: Callable[[], Awaitable[int | None]],
+        interval: float,
+        adaptive: bool = False,
+        max_interval: float | None = None,
+        wake_trigger: AssignmentTriggerInterface | None = None,
+    ):
+        self.name = name
+        self.job = job
+        self.interval = interval
+        self.adaptive = adaptive
+        self.max_interval = max_interval or interval
+        self.wake_trigger = wake_trigger
+        self._current_interval = interval
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run_forever(), name=f"job:{self.name}")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run_forever(self) -> None:
+        while True:
+            started_at = time.monotonic()
+            processed = await self.run_once()
+            await self._pause(self._next_delay(processed, time.monotonic() - started_at))
+
+    async def _pause(self, delay: float) -> None:
+        if self.wake_trigger is None or delay <= 0:
+            # sleep(0) отдает управление циклу событий даже при работе без пауз
+            await asyncio.sleep(delay)
+            return
+
+        if await self.wake_trigger.wait(delay):
+            metrics.counter("job_wakeups_total", job=self.name).inc()
+            self._current_interval = self.interval
+
+    async def run_once(self) -> int | None:
+        """Выполнить задачу один раз. Возвращает количество обработанных записей или None при ошибке."""
+        started_at = time.perf_counter()
+        try:
+            processed = await self.job() or 0
+        except Exception:
+            logging.exception(f"[JobRunner] job {self.name} failed")
+            metrics.counter("job_errors_total", job=self.name).inc()
+            processed = None
+
+        duration = time.perf_counter() - started_at
+        metrics.histogram("job_duration_seconds", job=self.name).observe(duration)
+        metrics.counter("job_runs_total", job=self.name).inc()
+        if processed:
+            metrics.counter("job_processed_total", job=self.name).inc(processed)
+        if duration > self.interval:
+            metrics.counter("job_overruns_total", job=self.name).inc()
+            logging.warning(f"[JobRunner] job {self.name} took {duration:.3f}s, interval is {self.interval}s")
+        return processed
+
+    def _next_delay(self, processed: int | None, duration: float) -> float:
+        if not self.adaptive:
+            return max(0.0, self.interval - duration)
+
+        if processed:
+            # Есть бэклог: следующий запуск сразу
+            self._current_interval = self.interval
+            delay = 0.0
+        else:
+            delay = self._current_interval
+            self._current_interval = min(self._current_interval * 2, self.max_interval)
+
+        metrics.gauge("job_interval_seconds", job=self.name).set(delay)
+        return delay
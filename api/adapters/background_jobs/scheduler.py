@@ -0,0 +1,230 @@
+import logging
+from typing import Awaitable, Callable
+
+from api.adapters.background_jobs.assign_orders_job import run_job as run_assign_orders_job
+from api.adapters.background_jobs.courier_positions_job import CourierPositionsPartitionsJob
+from api.adapters.background_jobs.courier_state_job import CourierStateJob
+from api.adapters.background_jobs.dashboard_counters_job import DashboardCountersReconcileJob
+from api.adapters.background_jobs.demand_heatmap_job import DemandHeatmapCleanupJob
+from api.adapters.background_jobs.flush_job import PeriodicFlushJob
+from api.adapters.background_jobs.move_couriers_job import ShardedMoveCouriersJob
+from api.adapters.background_jobs.move_couriers_job import run_job as run_move_couriers_job
+from api.adapters.background_jobs.reposition_couriers_job import run_job as run_reposition_couriers_job
+from api.adapters.background_jobs.runner import PeriodicJobRunner
+from core.ports.assignment_trigger_interface import AssignmentTriggerInterface
+from infrastructure.adapters.in_process import CourierPositionHistory
+from infrastructure.adapters.postgres.leader_election import AdvisoryLockLeaderElection
+from infrastructure.config.settings import get_settings
+from infrastructure.di.container import Container
+
+
+class LeaderOnlyJob:
+    """Запускает задачу, только если текущая реплика - лидер по этой задаче."""
+
+    def __init__(self, job: Callable[[], Awaitable[int]], leader_election: AdvisoryLockLeaderElection):
+        self.job = job
+        self.leader_election = leader_election
+
+    async def __call__(self) -> int:
+        try:
+            is_leader = await self.leader_election.is_leader()
+        except Exception:
+            logging.exception(f"[LeaderElection] failed to check leadership for {self.leader_election.name}")
+            return 0
+
+        if not is_leader:
+            return 0
+        return await self.job()
+
+
+class DispatchScheduler:
+    """
+    Задачи диспетчеризации: назначение заказов и перемещение курьеров.
+
+    Назначение заказов выполняется адаптивно (подряд, пока есть заказы), перемещение курьеров - в фиксированном
+    темпе: это шаг симуляции, и ускорять его нельзя.
+    С courier_state_job курьеры перемещаются в памяти, а назначение, перемещение и сдвиг свободных курьеров
+    к спросу выполняет один лидер.
+    Здесь же пишется история позиций курьеров, обслуживаются ее секции и сверяются счетчики дашборда
+    и удаляются устаревшие корзины тепловой карты спроса.
+    """
+
+    # Секции courier_positions дневные, проверять их чаще раза в час незачем
+    COURIER_POSITIONS_PARTITIONS_INTERVAL = 3600.0
+    DEMAND_HEATMAP_CLEANUP_INTERVAL = 3600.0
+
+    def __init__(
+        self,
+        leader_election_factory: Callable[..., AdvisoryLockLeaderElection] | None = None,
+        sharded_move_couriers_job: ShardedMoveCouriersJob | None = None,
+        assignment_trigger: AssignmentTriggerInterface | None = None,
+        courier_state_job: CourierStateJob | None = None,
+        courier_position_history: CourierPositionHistory | None = None,
+        courier_positions_partitions_job: CourierPositionsPartitionsJob | None = None,
+        dashboard_counters_job: DashboardCountersReconcileJob | None = None,
+        demand_heatmap_cleanup_job: DemandHeatmapCleanupJob | None = None,
+    ):
+        settings = get_settings().process
+        self._leader_elections: list[AdvisoryLockLeaderElection] = []
+        self._sharded_move_couriers_job = sharded_move_couriers_job
+        self._courier_state_job = courier_state_job
+        self._assignment_trigger = assignment_trigger
+        self._flush_jobs: list[PeriodicFlushJob] = []
+
+        if courier_state_job is not None:
+            # Назначения должны попадать в состояние в памяти, поэтому лидер у задач общий
+            assign_orders_job: Callable[[], Awaitable[int]] = run_assign_orders_job
+            if courier_state_job.leader_election is not None:
+                assign_orders_job = LeaderOnlyJob(run_assign_orders_job, courier_state_job.leader_election)
+        else:
+            assign_orders_job = self._leader_only("assign_orders", run_assign_orders_job, leader_election_factory)
+
+        if courier_state_job is not None:
+            move_couriers_job = courier_state_job.tick
+        elif sharded_move_couriers_job is None:
+            move_couriers_job = self._leader_only("move_couriers", run_move_couriers_job, leader_election_factory)
+        else:
+            # Владение шардами задача координирует сама
+            move_couriers_job = sharded_move_couriers_job.execute
+
+        self.runners = [
+            PeriodicJobRunner(
+                "assign_orders",
+                assign_orders_job,
+                interval=settings.ASSIGN_ORDERS_INTERVAL,
+                adaptive=True,
+                max_interval=settings.ASSIGN_ORDERS_MAX_INTERVAL,
+                wake_trigger=assignment_trigger,
+            ),
+            PeriodicJobRunner("move_couriers", move_couriers_job, interval=settings.MOVE_COURIERS_INTERVAL),
+        ]
+        if settings.REPOSITION_IDLE_COURIERS_ENABLED:
+            # Свободные курьеры сдвигаются к спросу в темпе перемещения курьеров с заказами.
+            # С courier_state_job перемещение выполняет тот же лидер, что назначает заказы
+            reposition_job: Callable[[], Awaitable[int]]
+            if courier_state_job is not None:
+                reposition_job = run_reposition_couriers_job
+                if courier_state_job.leader_election is not None:
+                    reposition_job = LeaderOnlyJob(run_reposition_couriers_job, courier_state_job.leader_election)
+            else:
+                reposition_job = self._leader_only(
+                    "reposition_couriers", run_reposition_couriers_job, leader_election_factory
+                )
+            self.runners.append(
+                PeriodicJobRunner("reposition_couriers", reposition_job, interval=settings.MOVE_COURIERS_INTERVAL)
+            )
+        if courier_state_job is not None:
+            self.runners.append(
+                PeriodicJobRunner(
+                    "flush_courier_positions", courier_state_job.flush, interval=settings.COURIER_STATE_FLUSH_INTERVAL
+                )
+            )
+        if courier_positions_partitions_job is not None:
+            partitions_job = self._leader_only(
+                "courier_positions_partitions", courier_positions_partitions_job.execute, leader_election_factory
+            )
+            self.runners.append(
+                PeriodicJobRunner(
+                    "courier_positions_partitions", partitions_job, interval=self.COURIER_POSITIONS_PARTITIONS_INTERVAL
+                )
+            )
+        if dashboard_counters_job is not None:
+            reconcile_job = self._leader_only(
+                "dashboard_counters_reconcile", dashboard_counters_job.execute, leader_election_factory
+            )
+            self.runners.append(
+                PeriodicJobRunner(
+                    "dashboard_counters_reconcile",
+                    reconcile_job,
+                    interval=settings.DASHBOARD_COUNTERS_RECONCILE_INTERVAL,
+                )
+            )
+        if demand_heatmap_cleanup_job is not None:
+            cleanup_job = self._leader_only(
+                "demand_heatmap_cleanup", demand_heatmap_cleanup_job.execute, leader_election_factory
+            )
+            self.runners.append(
+                PeriodicJobRunner("demand_heatmap_cleanup", cleanup_job, interval=self.DEMAND_HEATMAP_CLEANUP_INTERVAL)
+            )
+        if courier_position_history is not None:
+            self._flush_jobs.append(
+                PeriodicFlushJob(
+                    "flush_courier_positions_history",
+                    courier_position_history.flush,
+                    interval=settings.COURIER_POSITIONS_FLUSH_INTERVAL_MS / 1000,
+                )
+            )
+
+    def _leader_only(
+        self,
+        name: str,
+        job: Callable[[], Awaitable[int]],
+        leader_election_factory: Callable[..., AdvisoryLockLeaderElection] | None,
+    ) -> Callable[[], Awaitable[int]]:
+        if leader_election_factory is None:
+            return job
+        leader_election = leader_election_factory(name=name)
+        self._leader_elections.append(leader_election)
+        return LeaderOnlyJob(job, leader_election)
+
+    def start(self) -> None:
+        for runner in self.runners:
+            runner.start()
+        for flush_job in self._flush_jobs:
+            flush_job.start()
+
+    async def shutdown(self) -> None:
+        for runner in self.runners:
+            await runner.stop()
+        if self._courier_state_job is not None:
+            await self._courier_state_job.shutdown()
+        for flush_job in self._flush_jobs:
+            await flush_job.shutdown()
+        for leader_election in self._leader_elections:
+            await leader_election.release()
+        if self._assignment_trigger is not None:
+            await self._assignment_trigger.close()
+        if self._sharded_move_couriers_job is not None:
+            await self._sharded_move_couriers_job.release()
+
+
+def create_dispatch_scheduler(container: Container) -> DispatchScheduler:
+    settings = get_settings().process
+    leader_election_factory = container.leader_election if settings.LEADER_ELECTION_ENABLED else None
+
+    courier_state_job = None
+    sharded_move_couriers_job = None
+    if settings.COURIER_STATE_ENGINE_ENABLED:
+        courier_state_job = CourierStateJob(
+            courier_state=container.courier_state(),
+            leader_election=leader_election_factory(name="dispatch") if leader_election_factory else None,
+            resync_interval=settings.COURIER_STATE_RESYNC_INTERVAL,
+        )
+    elif leader_election_factory is not None and settings.MOVE_COURIERS_SHARDS > 1:
+        sharded_move_couriers_job = ShardedMoveCouriersJob(
+            use_case_factory=container.move_couriers_use_case,
+            leader_election_factory=leader_election_factory,
+            worker_leases=container.worker_leases(group="move_couriers", ttl=settings.MOVE_COURIERS_WORKER_LEASE_TTL),
+            shard_count=settings.MOVE_COURIERS_SHARDS,
+        )
+
+    courier_positions_partitions_job = None
+    if settings.COURIER_POSITIONS_HISTORY_ENABLED:
+        courier_positions_partitions_job = CourierPositionsPartitionsJob(
+            store=container.courier_position_store(),
+            partitions_ahead=settings.COURIER_POSITIONS_PARTITIONS_AHEAD,
+            retention_days=settings.COURIER_POSITIONS_RETENTION_DAYS,
+        )
+
+    return DispatchScheduler(
+        leader_election_factory,
+        sharded_move_couriers_job,
+        container.assignment_trigger(),
+        courier_state_job,
+        container.courier_position_history(),
+        courier_positions_partitions_job,
+        DashboardCountersReconcileJob(session_factory=container.db_session_factory()),
+        DemandHeatmapCleanupJob(
+            store=container.demand_heatmap_store(), retention_minutes=settings.DEMAND_HEATMAP_RETENTION_MINUTES
+        ),
+    )
@@ -1,18 +1,42 @@
+import sys
 import uuid
-from typing import List, Optional, Union
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import List, Literal, Optional, Union
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response
+from pydantic import AwareDatetime
 
-from api.adapters.http.schemas import CourierTest, Error, NewCourierTest, Order
+from api.adapters.http.schemas import (
+    CourierLocationsAccepted,
+    CourierLocationsBatch,
+    CourierTest,
+    DashboardStats,
+    DemandHeatmap,
+    Error,
+    NewCourierTest,
+    Order,
+    TrackPoint,
+)
 from core.application.use_cases.commands.create_courier import CreateCourierCommand, CreateCourierUseCase
 from core.application.use_cases.commands.create_order import CreateOrderCommand, CreateOrderUseCase
+from core.application.use_cases.commands.ingest_courier_locations import (
+    CourierLocationPing,
+    IngestCourierLocationsCommand,
+    IngestCourierLocationsUseCase,
+)
 from core.application.use_cases.queries.get_all_couriers import GetAllCouriersQuery, GetAllCouriersUseCase
+from core.application.use_cases.queries.get_courier_track import GetCourierTrackQuery, GetCourierTrackUseCase
+from core.application.use_cases.queries.get_dashboard_stats import GetDashboardStatsQuery, GetDashboardStatsUseCase
+from core.application.use_cases.queries.get_demand_heatmap import GetDemandHeatmapQuery, GetDemandHeatmapUseCase
 from core.application.use_cases.queries.get_not_completed_orders import (
     GetNotCompletedOrdersQuery,
     GetNotCompletedOrdersUseCase,
 )
+from core.domain.shared_kernel.location import Location
 from infrastructure.di.container import Container
+from infrastructure.metrics import metrics
 
 router = APIRouter(prefix="/api/v1")
 
@@ -48,6 +72,57 @@ async def get_couriers(
     return await use_case.handle(query)
 
 
+@router.post(
+    "/couriers/locations",
+    status_code=202,
+    response_model=CourierLocationsAccepted,
+    responses={"default": {"model": Error}},
+)
+@inject
+async def ingest_courier_locations(
+    body: CourierLocationsBatch = Body(),
+    use_case: IngestCourierLocationsUseCase = Depends(Provide[Container.ingest_courier_locations_use_case]),
+) -> CourierLocationsAccepted:
+    """
+    Принять позиции курьеров. Позиции записываются в базу пачкой, а не по запросу
+    """
+    # Схема уже проверила значения, поэтому объекты собираются без повторной валидации
+    command = IngestCourierLocationsCommand.model_construct(
+        pings=[
+            CourierLocationPing.model_construct(
+                courier_id=update.courier_id,
+                location=Location.model_construct(x=update.x, y=update.y),
+                ts=update.ts,
+            )
+            for update in body.updates
+        ]
+    )
+    return CourierLocationsAccepted(accepted=await use_case.handle(command))
+
+
+@router.get(
+    "/couriers/{courier_id}/track",
+    response_model=List[TrackPoint],
+    responses={"default": {"model": Error}, "400": {"model": Error}},
+)
+@inject
+async def get_courier_track(
+    courier_id: uuid.UUID,
+    since: Optional[AwareDatetime] = Query(None, description="Начало периода, по умолчанию - час назад"),
+    until: Optional[AwareDatetime] = Query(None, description="Конец периода, по умолчанию - сейчас"),
+    use_case: GetCourierTrackUseCase = Depends(Provide[Container.get_courier_track_use_case]),
+) -> Union[List[TrackPoint], Error]:
+    """
+    Получить трек курьера за период
+    """
+    until = until or datetime.now(timezone.utc)
+    since = since or until - timedelta(hours=1)
+    if since >= until:
+        raise HTTPException(status_code=400, detail="since must be earlier than until")
+
+    return await use_case.handle(GetCourierTrackQuery(courier_id=courier_id, since=since, until=until))
+
+
 @router.post("/orders", response_model=None, responses={"default": {"model": Error}})
 @inject
 async def create_order(
@@ -74,3 +149,58 @@ async def get_orders(
     """
 
     return await use_case.handle(GetNotCompletedOrdersQuery())
+
+
+@router.get("/stats", response_model=DashboardStats, responses={"default": {"model": Error}})
+@inject
+async def get_stats(
+    use_case: GetDashboardStatsUseCase = Depends(Provide[Container.get_dashboard_stats_use_case]),
+) -> Union[DashboardStats, Error]:
+    """
+    Получить количество заказов по статусам и занятых/свободных курьеров
+    """
+
+    return await use_case.handle(GetDashboardStatsQuery())
+
+
+@router.get(
+    "/heatmap",
+    response_model=DemandHeatmap,
+    responses={
+        "default": {"model": Error},
+        "400": {"model": Error},
+        "200": {"content": {"application/octet-stream": {}}},
+    },
+)
+@inject
+async def get_demand_heatmap(
+    window_minutes: int = Query(15, description="Окно в минутах"),
+    format: Literal["json", "binary"] = Query("json", description="binary - 300 чисел uint32 little-endian"),
+    use_case: GetDemandHeatmapUseCase = Depends(Provide[Container.get_demand_heatmap_use_case]),
+) -> Union[DemandHeatmap, Response, Error]:
+    """
+    Получить тепловую карту спроса: созданные, назначенные и завершенные заказы по клеткам за окно
+    """
+    try:
+        grid = await use_case.handle(GetDemandHeatmapQuery(window_minutes=window_minutes))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if format == "json":
+        return grid
+
+    # Сетки created, assigned, completed подряд, каждая - 100 клеток по строкам
+    cells = array(
+        "I", (count for rows in (grid.created, grid.assigned, grid.completed) for row in rows for count in row)
+    )
+    if sys.byteorder == "big":
+        cells.byteswap()
+    return Response(content=cells.tobytes(), media_type="application/octet-stream")
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics() -> dict:
+    """
+    Получить метрики процесса
+    """
+    return metrics.snapshot()
@@ -7,7 +7,7 @@ from __future__ import annotations
 from typing import Annotated
 from uuid import UUID
 
-from pydantic import BaseModel, Field, NonNegativeInt, StringConstraints
+from pydantic import AwareDatetime, BaseModel, Field, NonNegativeInt, StringConstraints
 
 
 class Location(BaseModel):
@@ -57,6 +57,84 @@ class CourierTest(BaseModel):
     }
 
 
+class CourierLocationUpdate(BaseModel):
+    """Позиция курьера из телеметрии."""
+
+    courier_id: UUID = Field(description="Идентификатор курьера")
+    x: Annotated[int, Field(ge=1, le=10)] = Field(description="X координата")
+    y: Annotated[int, Field(ge=1, le=10)] = Field(description="Y координата")
+    ts: AwareDatetime = Field(description="Время снятия позиции")
+
+
+class CourierLocationsBatch(BaseModel):
+    """Пачка позиций курьеров."""
+
+    updates: Annotated[list[CourierLocationUpdate], Field(max_length=10000)] = Field(description="Позиции")
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "updates": [
+                        {
+                            "courier_id": "123e4567-e89b-12d3-a456-426614174000",
+                            "x": 3,
+                            "y": 7,
+                            "ts": "2025-07-06T06:25:06Z",
+                        }
+                    ]
+                }
+            ]
+        }
+    }
+
+
+class CourierLocationsAccepted(BaseModel):
+    """Результат приема позиций."""
+
+    accepted: int = Field(description="Количество принятых позиций, устаревшие позиции отбрасываются")
+
+
+class TrackPoint(BaseModel):
+    """Точка трека курьера."""
+
+    x: int = Field(description="X координата")
+    y: int = Field(description="Y координата")
+    recorded_at: AwareDatetime = Field(description="Время позиции")
+
+    model_config = {"json_schema_extra": {"examples": [{"x": 3, "y": 7, "recorded_at": "2025-07-06T06:25:06Z"}]}}
+
+
+class DashboardStats(BaseModel):
+    """Счетчики для дашборда."""
+
+    # Счетчики сходятся со сверкой и между сверками могут кратковременно уйти в минус: ответ не должен падать
+    orders_by_status: dict[str, int] = Field(description="Количество заказов по статусам")
+    busy_couriers: int = Field(description="Количество занятых курьеров")
+    free_couriers: int = Field(description="Количество свободных курьеров")
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "orders_by_status": {"CREATED": 3, "ASSIGNED": 5, "COMPLETED": 120},
+                    "busy_couriers": 5,
+                    "free_couriers": 2,
+                }
+            ]
+        }
+    }
+
+
+class DemandHeatmap(BaseModel):
+    """Тепловая карта спроса: сетки 10x10 по строкам, элемент [y - 1][x - 1] - клетка (x, y)."""
+
+    window_minutes: int = Field(description="Окно в минутах")
+    created: list[list[NonNegativeInt]] = Field(description="Созданные заказы")
+    assigned: list[list[NonNegativeInt]] = Field(description="Назначенные заказы")
+    completed: list[list[NonNegativeInt]] = Field(description="Завершенные заказы")
+
+
 class Error(BaseModel):
     """Модель ошибки."""
 
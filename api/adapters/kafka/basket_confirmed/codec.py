@@ -0,0 +1,65 @@
+import logging
+
+from aiokafka import ConsumerRecord
+from google.protobuf.message import DecodeError
+
+from core.application.use_cases.commands.create_order import CreateOrderCommand
+from infrastructure.adapters.kafka.codec import JSON_CONTENT_TYPE, PROTOBUF_CONTENT_TYPE, get_content_type
+from infrastructure.metrics import metrics
+
+from . import Contract_pb2
+from .schemas import BasketConfirmedEvent, BasketConfirmedProjection
+
+
+def to_create_order_command(msg: BasketConfirmedEvent | BasketConfirmedProjection) -> CreateOrderCommand:
+    return CreateOrderCommand(
+        basket_id=msg.basket_id,
+        street=msg.address.street,
+        volume=msg.volume,
+    )
+
+
+def decode_basket_confirmed(
+    body: bytes, content_type: str = JSON_CONTENT_TYPE, lean: bool = True
+) -> CreateOrderCommand:
+    """
+    Декодировать сообщение basket.confirmed в команду создания заказа.
+    lean=True валидирует только нужные заказу поля, lean=False - полную схему события.
+    """
+    if content_type == PROTOBUF_CONTENT_TYPE:
+        event = Contract_pb2.BasketConfirmedIntegrationEvent.FromString(body)
+        # Та же валидация, что и у JSON: идентификатор корзины и положительный объем
+        projection = BasketConfirmedProjection.model_validate(
+            {"basket_id": event.basketId, "address": {"street": event.address.street}, "volume": event.Volume}
+        )
+        return to_create_order_command(projection)
+
+    if content_type == JSON_CONTENT_TYPE:
+        schema = BasketConfirmedProjection if lean else BasketConfirmedEvent
+        return to_create_order_command(schema.model_validate_json(body))
+
+    raise ValueError(f"Unsupported content type {content_type}")
+
+
+def decode_basket_confirmed_record(
+    record: ConsumerRecord, default_content_type: str, lean: bool = True
+) -> CreateOrderCommand:
+    """Декодировать запись Kafka, выбрав формат по заголовку content-type."""
+    return decode_basket_confirmed(record.value, get_content_type(record.headers, default_content_type), lean)
+
+
+def decode_valid_basket_confirmed_record(
+    record: ConsumerRecord, default_content_type: str, lean: bool = True
+) -> CreateOrderCommand | None:
+    """
+    Декодировать запись Kafka. Некорректные записи пропускаются: с auto_commit=False ошибка пачки
+    возвращала бы ее в раздел снова и снова.
+    """
+    try:
+        return decode_basket_confirmed_record(record, default_content_type, lean)
+    except (ValueError, DecodeError):
+        logging.warning(
+            f"Invalid basket.confirmed record skipped: partition {record.partition}, offset {record.offset}"
+        )
+        metrics.counter("basket_confirmed_invalid_total").inc()
+        return None
@@ -1,37 +1,134 @@
+import logging
+from functools import partial
+from typing import Callable
+
+from aiokafka import ConsumerRecord
 from dependency_injector.wiring import Provide, inject
 from fastapi import Depends
-from faststream.kafka.fastapi import KafkaRouter
+from faststream.kafka.fastapi import KafkaMessage
 
-from core.application.use_cases.commands.create_order import CreateOrderCommand, CreateOrderUseCase
+from api.adapters.kafka.lanes import KeyedLanesExecutor
+from api.adapters.kafka.router import router
+from core.application.use_cases.commands.create_order import (
+    CreateOrderCommand,
+    CreateOrderUseCase,
+    OrderAlreadyExistsError,
+)
+from core.application.use_cases.commands.create_orders_batch import CreateOrdersBatchCommand, CreateOrdersBatchUseCase
+from core.ports.geo_service_interface import GeoServiceInterface
 from infrastructure.config.settings import get_settings
 from infrastructure.di.container import Container
 
-from .schemas import BasketConfirmedEvent
+from .codec import decode_valid_basket_confirmed_record
+from .pipeline import BasketConfirmedIngestionPipeline
 
 settings = get_settings()
 
+# Формат сообщения выбирается по заголовку content-type (JSON или protobuf), некорректные сообщения пропускаются
+decode_record = partial(
+    decode_valid_basket_confirmed_record,
+    default_content_type=settings.kafka.BASKET_CONFIRMED_DEFAULT_CONTENT_TYPE,
+    lean=settings.kafka.BASKET_CONFIRMED_LEAN_DECODING,
+)
 
-# Инициализация брокера
-router = KafkaRouter(settings.kafka.BROKERS.split(","), include_in_schema=False)
 
+def batch_subscriber():
+    return router.subscriber(
+        settings.kafka.BASKET_CONFIRMED_TOPIC,
+        group_id=settings.kafka.BASKET_CONFIRMED_GROUP_ID,
+        batch=True,
+        max_records=settings.kafka.BASKET_CONFIRMED_BATCH_SIZE,
+        batch_timeout_ms=settings.kafka.BASKET_CONFIRMED_BATCH_TIMEOUT_MS,
+        # Оффсеты коммитятся только после успешной обработки всей пачки (после коммита в БД)
+        auto_commit=False,
+    )
 
-@router.subscriber(
-    settings.kafka.BASKET_CONFIRMED_TOPIC,
-    group_id=settings.kafka.BASKET_CONFIRMED_GROUP_ID,
-)
-@inject
-async def process_basket_confirmed(
-    msg: BasketConfirmedEvent,
-    use_case: CreateOrderUseCase = Depends(Provide[Container.create_order_use_case]),
-) -> None:
-    """
-    Обработчик события подтверждения корзины.
-    """
-
-    await use_case.handle(
-        CreateOrderCommand(
-            basket_id=msg.basket_id,
-            street=msg.address.street,
-            volume=msg.volume,
+
+if settings.kafka.BASKET_CONFIRMED_CONSUMER_MODE == "batch":
+
+    @batch_subscriber()
+    @inject
+    async def process_basket_confirmed_batch(
+        message: KafkaMessage,
+        use_case: CreateOrdersBatchUseCase = Depends(Provide[Container.create_orders_batch_use_case]),
+    ) -> None:
+        """
+        Обработчик пачки событий подтверждения корзины.
+        """
+
+        commands = [decode_record(record) for record in message.raw_message]
+        await use_case.handle(CreateOrdersBatchCommand(orders=[command for command in commands if command is not None]))
+
+elif settings.kafka.BASKET_CONFIRMED_CONSUMER_MODE == "pipeline":
+
+    @batch_subscriber()
+    @inject
+    async def process_basket_confirmed_pipeline(
+        message: KafkaMessage,
+        geo_service: GeoServiceInterface = Depends(Provide[Container.geo_service]),
+        use_case_factory: Callable[[], CreateOrdersBatchUseCase] = Depends(
+            Provide[Container.create_orders_batch_use_case.provider]
+        ),
+    ) -> None:
+        """
+        Обработчик пачки событий подтверждения корзины через конвейер приема заказов.
+        """
+
+        pipeline = BasketConfirmedIngestionPipeline(
+            geo_service=geo_service,
+            create_orders_batch_use_case_factory=use_case_factory,
+            geocode_concurrency=settings.kafka.BASKET_CONFIRMED_GEOCODE_CONCURRENCY,
+            persist_batch_size=settings.kafka.BASKET_CONFIRMED_PERSIST_BATCH_SIZE,
+            persist_flush_interval=settings.kafka.BASKET_CONFIRMED_PERSIST_FLUSH_MS / 1000,
+            queue_size=settings.kafka.BASKET_CONFIRMED_PIPELINE_QUEUE_SIZE,
+            decoder=decode_record,
         )
+        await pipeline.process(list(message.raw_message))
+
+elif settings.kafka.BASKET_CONFIRMED_CONSUMER_MODE == "concurrent":
+
+    @batch_subscriber()
+    @inject
+    async def process_basket_confirmed_concurrently(
+        message: KafkaMessage,
+        use_case_factory: Callable[[], CreateOrderUseCase] = Depends(Provide[Container.create_order_use_case.provider]),
+    ) -> None:
+        """
+        Обработчик пачки событий подтверждения корзины с параллельными полосами по ключу.
+        Оффсеты пачки коммитятся после завершения всех полос.
+        """
+
+        def lane_key(item: tuple[ConsumerRecord, CreateOrderCommand]):
+            record, command = item
+            return record.key or command.basket_id
+
+        async def handle(item: tuple[ConsumerRecord, CreateOrderCommand]) -> None:
+            _, command = item
+            try:
+                # Отдельный use case (и UoW) на сообщение: полосы не делят сессию БД
+                await use_case_factory().handle(command)
+            except OrderAlreadyExistsError:
+                logging.info(f"Order {command.basket_id} already exists, skipping")
+
+        items = [(record, command) for record in message.raw_message if (command := decode_record(record)) is not None]
+        executor = KeyedLanesExecutor(max_concurrency=settings.kafka.BASKET_CONFIRMED_CONCURRENCY)
+        await executor.run(items, key=lane_key, handler=handle)
+
+else:
+
+    @router.subscriber(
+        settings.kafka.BASKET_CONFIRMED_TOPIC,
+        group_id=settings.kafka.BASKET_CONFIRMED_GROUP_ID,
     )
+    @inject
+    async def process_basket_confirmed(
+        message: KafkaMessage,
+        use_case: CreateOrderUseCase = Depends(Provide[Container.create_order_use_case]),
+    ) -> None:
+        """
+        Обработчик события подтверждения корзины.
+        """
+
+        command = decode_record(message.raw_message)
+        if command is not None:
+            await use_case.handle(command)
@@ -0,0 +1,112 @@
+import asyncio
+import logging
+from typing import Any, Callable
+
+from core.application.use_cases.commands.create_order import CreateOrderCommand
+from core.application.use_cases.commands.create_orders_batch import CreateOrdersBatchCommand, CreateOrdersBatchUseCase
+from core.ports.geo_service_interface import GeoServiceInterface
+
+from .codec import decode_basket_confirmed
+
+# Маркер окончания потока между стадиями
+_END = object()
+
+
+class BasketConfirmedIngestionPipeline:
+    """
+    Конвейер приема basket.confirmed: декодирование -> геокодирование -> пакетное сохранение.
+    Уже существующие заказы отбрасываются после декодирования, повторная доставка пачки не геокодируется.
+
+    Стадии работают конкурентно и связаны ограниченными очередями, поэтому медленная стадия
+    притормаживает предыдущие. Геокодирование выполняется несколькими воркерами одновременно
+    и вне транзакции БД, сохранение идет пачками. Каждое обращение к БД получает свой use case (и UoW).
+    Сообщения превращаются в команды через decoder (по умолчанию JSON-тело сообщения),
+    сообщения, для которых decoder вернул None, пропускаются.
+    """
+
+    def __init__(
+        self,
+        geo_service: GeoServiceInterface,
+        create_orders_batch_use_case_factory: Callable[[], CreateOrdersBatchUseCase],
+        geocode_concurrency: int = 16,
+        persist_batch_size: int = 50,
+        persist_flush_interval: float = 0.05,
+        queue_size: int = 100,
+        decoder: Callable[[Any], CreateOrderCommand | None] = decode_basket_confirmed,
+    ):
+        self.geo_service = geo_service
+        self.create_orders_batch_use_case_factory = create_orders_batch_use_case_factory
+        self.geocode_concurrency = geocode_concurrency
+        self.persist_batch_size = persist_batch_size
+        self.persist_flush_interval = persist_flush_interval
+        self.queue_size = queue_size
+        self.decoder = decoder
+
+    async def process(self, messages: list[Any]) -> int:
+        """Прогнать сообщения через конвейер и дождаться сохранения всех заказов."""
+        decoded: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        located: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        # При ошибке любой стадии TaskGroup отменяет остальные, и исключение уходит в консьюмер
+        async with asyncio.TaskGroup() as task_group:
+            task_group.create_task(self._decode(messages, decoded))
+            for _ in range(self.geocode_concurrency):
+                task_group.create_task(self._geocode(decoded, located))
+            persist_task = task_group.create_task(self._persist(located))
+
+        return persist_task.result()
+
+    async def _decode(self, messages: list[Any], output: asyncio.Queue) -> None:
+        commands: dict = {}
+        for message in messages:
+            command = self.decoder(message)
+            if command is None:
+                continue
+            # Повторы внутри пачки не геокодируем
+            commands.setdefault(command.basket_id, command)
+
+        existing_ids = await self.create_orders_batch_use_case_factory().get_existing_order_ids(list(commands))
+        if existing_ids:
+            logging.info(f"Ingestion pipeline skipped {len(existing_ids)} already existing orders")
+
+        for basket_id, command in commands.items():
+            if basket_id not in existing_ids:
+                await output.put(command)
+
+        for _ in range(self.geocode_concurrency):
+            await output.put(_END)
+
+    async def _geocode(self, input_: asyncio.Queue, output: asyncio.Queue) -> None:
+        while (command := await input_.get()) is not _END:
+            if command.location is None:
+                location = await self.geo_service.get_location(command.street)
+                command = command.model_copy(update={"location": location})
+            await output.put(command)
+
+        await output.put(_END)
+
+    async def _persist(self, input_: asyncio.Queue) -> int:
+        created = 0
+        batch: list[CreateOrderCommand] = []
+        active_geocoders = self.geocode_concurrency
+
+        while active_geocoders:
+            timed_out = False
+            try:
+                command = await asyncio.wait_for(input_.get(), timeout=self.persist_flush_interval)
+            except asyncio.TimeoutError:
+                timed_out = True
+            else:
+                if command is _END:
+                    active_geocoders -= 1
+                else:
+                    batch.append(command)
+
+            # Сбрасываем пачку, когда она заполнилась, поток затих или закончился
+            if batch and (len(batch) >= self.persist_batch_size or timed_out or not active_geocoders):
+                use_case = self.create_orders_batch_use_case_factory()
+                created += await use_case.handle(CreateOrdersBatchCommand(orders=batch))
+                batch = []
+
+        logging.info(f"Ingestion pipeline persisted {created} new orders")
+        return created
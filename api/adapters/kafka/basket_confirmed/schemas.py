@@ -67,3 +67,24 @@ class BasketConfirmedEvent(BaseModel):
                 "Volume": 4,
             }
         }
+
+
+class AddressProjection(BaseModel):
+    street: str = Field(alias="Street", description="Улица доставки")
+
+    class Config:
+        populate_by_name = True
+
+
+class BasketConfirmedProjection(BaseModel):
+    """
+    Проекция BasketConfirmedEvent с полями, нужными для создания заказа.
+    Остальные поля сообщения (позиции корзины, период доставки) пропускаются без валидации.
+    """
+
+    basket_id: UUID = Field(alias="BasketId", description="Уникальный идентификатор корзины")
+    address: AddressProjection = Field(alias="Address", description="Адрес доставки")
+    volume: int = Field(alias="Volume", description="Объем заказа", gt=0)
+
+    class Config:
+        populate_by_name = True
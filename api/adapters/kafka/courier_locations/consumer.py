@@ -0,0 +1,59 @@
+import logging
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import Depends
+from faststream.kafka.fastapi import KafkaMessage
+from pydantic import ValidationError
+
+from api.adapters.kafka.router import router
+from core.application.use_cases.commands.ingest_courier_locations import (
+    CourierLocationPing,
+    IngestCourierLocationsCommand,
+    IngestCourierLocationsUseCase,
+)
+from core.domain.shared_kernel.location import Location
+from infrastructure.config.settings import get_settings
+from infrastructure.di.container import Container
+from infrastructure.metrics import metrics
+
+from .schemas import CourierLocationMessage
+
+settings = get_settings()
+
+
+def decode_courier_location(value: bytes) -> CourierLocationPing | None:
+    """Разобрать сообщение телеметрии. Некорректные сообщения пропускаются."""
+    try:
+        message = CourierLocationMessage.model_validate_json(value)
+    except ValidationError:
+        logging.warning("Invalid courier location message skipped")
+        metrics.counter("courier_locations_invalid_total").inc()
+        return None
+
+    return CourierLocationPing.model_construct(
+        courier_id=message.courier_id,
+        location=Location.model_construct(x=message.x, y=message.y),
+        ts=message.ts,
+    )
+
+
+if settings.kafka.COURIER_LOCATIONS_ENABLED:
+    # Телеметрия допускает потери, поэтому оффсеты коммитятся автоматически
+    @router.subscriber(
+        settings.kafka.COURIER_LOCATIONS_TOPIC,
+        group_id=settings.kafka.COURIER_LOCATIONS_GROUP_ID,
+        batch=True,
+        max_records=settings.kafka.COURIER_LOCATIONS_BATCH_SIZE,
+        batch_timeout_ms=settings.kafka.COURIER_LOCATIONS_BATCH_TIMEOUT_MS,
+    )
+    @inject
+    async def process_courier_locations(
+        message: KafkaMessage,
+        use_case: IngestCourierLocationsUseCase = Depends(Provide[Container.ingest_courier_locations_use_case]),
+    ) -> None:
+        """
+        Обработчик пачки позиций курьеров.
+        """
+
+        pings = [decode_courier_location(record.value) for record in message.raw_message]
+        await use_case.handle(IngestCourierLocationsCommand.model_construct(pings=[p for p in pings if p is not None]))
@@ -0,0 +1,10 @@
+from uuid import UUID
+
+from pydantic import AwareDatetime, BaseModel, Field
+
+
+class CourierLocationMessage(BaseModel):
+    courier_id: UUID = Field(description="Идентификатор курьера")
+    x: int = Field(ge=1, le=10, description="X координата")
+    y: int = Field(ge=1, le=10, description="Y координата")
+    ts: AwareDatetime = Field(description="Время снятия позиции")
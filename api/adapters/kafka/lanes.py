@@ -0,0 +1,40 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class KeyedLanesExecutor(Generic[T]):
+    """
+    Конкурентная обработка сообщений с сохранением порядка внутри ключа.
+
+    Сообщения с одинаковым ключом попадают в одну полосу и обрабатываются последовательно,
+    полосы работают параллельно. Одновременно обрабатывается не более max_concurrency сообщений.
+    """
+
+    def __init__(self, max_concurrency: int):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than 0")
+        self.max_concurrency = max_concurrency
+
+    async def run(
+        self,
+        items: list[T],
+        key: Callable[[T], Hashable],
+        handler: Callable[[T], Awaitable[None]],
+    ) -> None:
+        """Обработать все сообщения. Возвращает управление, когда завершены все полосы."""
+        lanes: dict[Hashable, list[T]] = {}
+        for item in items:
+            lanes.setdefault(key(item), []).append(item)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_lane(lane: list[T]) -> None:
+            for item in lane:
+                async with semaphore:
+                    await handler(item)
+
+        async with asyncio.TaskGroup() as task_group:
+            for lane in lanes.values():
+                task_group.create_task(run_lane(lane))
@@ -0,0 +1,6 @@
+from faststream.kafka.fastapi import KafkaRouter
+
+from infrastructure.config.settings import get_settings
+
+# Общий брокер для всех подписчиков процесса API
+router = KafkaRouter(get_settings().kafka.bootstrap_servers, include_in_schema=False)
@@ -0,0 +1,50 @@
+import asyncio
+import json
+import logging
+import signal
+
+from infrastructure.metrics import metrics
+
+
+async def wait_for_shutdown() -> None:
+    """Дождаться SIGINT или SIGTERM."""
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await stop.wait()
+    logging.info("Shutdown signal received")
+
+
+async def start_metrics_server(host: str, port: int) -> asyncio.Server:
+    """
+    Отдавать метрики процесса по GET /metrics в том же виде, что и /api/v1/metrics в процессе API.
+    Нужен процессам без HTTP API: иначе их метрики не видны снаружи.
+    """
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await reader.readline()
+            # Заголовки запроса не нужны, но их надо дочитать до пустой строки
+            while await reader.readline() not in (b"\r\n", b"\n", b""):
+                pass
+
+            method, path, *_ = request_line.decode("latin-1").split() or ["", ""]
+            if method == "GET" and path.split("?")[0] == "/metrics":
+                status, body = "200 OK", json.dumps(metrics.snapshot()).encode("utf-8")
+            else:
+                status, body = "404 Not Found", b'{"detail": "Not Found"}'
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1") + body
+            )
+            await writer.drain()
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    logging.info(f"Metrics are served on {host}:{port}/metrics")
+    return server
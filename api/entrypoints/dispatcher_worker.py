@@ -0,0 +1,43 @@
+"""
+Воркер диспетчеризации: python -m api.entrypoints.dispatcher_worker
+Выполняет назначение заказов и перемещение курьеров. HTTP API и Kafka не поднимает, только GET /metrics.
+Реплик может быть несколько: каждую задачу выполняет только лидер по ней.
+"""
+
+import asyncio
+import logging
+
+from api.adapters.background_jobs.scheduler import create_dispatch_scheduler
+from api.entrypoints.base import start_metrics_server, wait_for_shutdown
+from infrastructure.config.settings import get_settings
+from infrastructure.di.container import Container
+
+
+async def run() -> None:
+    settings = get_settings().process
+    container = Container()
+    container.init_resources()
+    container.wire(modules=["api.adapters.background_jobs.scheduler"])
+
+    scheduler = create_dispatch_scheduler(container)
+    scheduler.start()
+    logging.info("Dispatcher worker started")
+    metrics_server = None
+    if settings.DISPATCHER_WORKER_METRICS_PORT is not None:
+        metrics_server = await start_metrics_server(settings.API_HOST, settings.DISPATCHER_WORKER_METRICS_PORT)
+    try:
+        await wait_for_shutdown()
+    finally:
+        if metrics_server is not None:
+            metrics_server.close()
+        await scheduler.shutdown()
+        logging.info("Dispatcher worker stopped")
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""
+HTTP API без фоновых задач: python -m api.entrypoints.http
+Процесс не хранит состояния, количество воркеров задается PROCESS_API_WORKERS.
+"""
+
+import uvicorn
+
+from infrastructure.config.settings import get_settings
+
+
+def main() -> None:
+    settings = get_settings().process
+    uvicorn.run(
+        "api.main:app",
+        host=settings.API_HOST,
+        port=settings.API_PORT,
+        workers=settings.API_WORKERS,
+    )
+
+
+if __name__ == "__main__":
+    main()
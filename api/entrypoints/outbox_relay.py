@@ -0,0 +1,48 @@
+"""
+Outbox relay: python -m api.entrypoints.outbox_relay
+Публикует события из outbox в Kafka. Несколько экземпляров безопасны: строки outbox берутся через SKIP LOCKED.
+Метрики процесса отдаются по GET /metrics.
+"""
+
+import asyncio
+import contextlib
+import logging
+
+from api.adapters.background_jobs.outbox_poller import run_outbox_poller
+from api.entrypoints.base import start_metrics_server, wait_for_shutdown
+from infrastructure.config.settings import get_settings
+from infrastructure.di.container import Container
+
+
+async def run() -> None:
+    settings = get_settings().process
+    container = Container()
+    container.init_resources()
+    container.wire(modules=["api.adapters.background_jobs.outbox_poller"])
+
+    kafka_producer = container.kafka_producer()
+    await kafka_producer.start()
+    poller = asyncio.create_task(run_outbox_poller())
+    logging.info("Outbox relay started")
+    metrics_server = None
+    if settings.OUTBOX_RELAY_METRICS_PORT is not None:
+        metrics_server = await start_metrics_server(settings.API_HOST, settings.OUTBOX_RELAY_METRICS_PORT)
+    try:
+        await wait_for_shutdown()
+    finally:
+        if metrics_server is not None:
+            metrics_server.close()
+        poller.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await poller
+        await kafka_producer.stop()
+        logging.info("Outbox relay stopped")
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
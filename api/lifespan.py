@@ -2,34 +2,67 @@ import asyncio
 import logging
 from contextlib import asynccontextmanager
 
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from fastapi import FastAPI
 
-from api.adapters.background_jobs.assign_orders_job import run_job as run_assign_orders_job
-from api.adapters.background_jobs.move_couriers_job import run_job as run_move_couriers_job
+from api.adapters.background_jobs.flush_job import PeriodicFlushJob
 from api.adapters.background_jobs.outbox_poller import run_outbox_poller
+from api.adapters.background_jobs.scheduler import create_dispatch_scheduler
+from infrastructure.config.settings import get_settings
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    scheduler = AsyncIOScheduler()
-    logging.info("Starting scheduler...")
-    scheduler.add_job(run_assign_orders_job, trigger="interval", seconds=2)
-    scheduler.add_job(run_move_couriers_job, trigger="interval", seconds=2)
-    scheduler.start()
+    # Фоновые задачи и outbox relay поднимаются здесь только в режиме "все в одном",
+    # в остальных случаях они работают в отдельных процессах (api/entrypoints)
+    run_background_jobs = get_settings().process.API_RUN_BACKGROUND_JOBS
+
     app.state.container.init_resources()
     app.state.container.wire(
         modules=[
             "api.adapters.kafka.basket_confirmed.consumer",
-            "api.adapters.background_jobs.assign_orders_job",
+            "api.adapters.kafka.courier_locations.consumer",
+            "api.adapters.background_jobs.scheduler",
             "api.adapters.http.controllers",
             __name__,
         ],
     )
-    kafka_producer = app.state.container.kafka_producer()
-    await kafka_producer.start()
-    asyncio.create_task(run_outbox_poller())
+
+    # Телеметрия курьеров принимается каждым процессом API и записывается из его буферов
+    process_settings = get_settings().process
+    flush_jobs = [
+        PeriodicFlushJob(
+            "flush_courier_locations",
+            app.state.container.courier_location_buffer().flush,
+            interval=process_settings.COURIER_LOCATIONS_FLUSH_INTERVAL_MS / 1000,
+        )
+    ]
+    courier_position_history = app.state.container.courier_position_history()
+    # В режиме "все в одном" историю позиций сбрасывает планировщик, второй сброс из того же буфера не нужен
+    if courier_position_history is not None and not run_background_jobs:
+        flush_jobs.append(
+            PeriodicFlushJob(
+                "flush_courier_positions_history",
+                courier_position_history.flush,
+                interval=process_settings.COURIER_POSITIONS_FLUSH_INTERVAL_MS / 1000,
+            )
+        )
+    for flush_job in flush_jobs:
+        flush_job.start()
+
+    if run_background_jobs:
+        scheduler = create_dispatch_scheduler(app.state.container)
+        logging.info("Starting scheduler...")
+        scheduler.start()
+        kafka_producer = app.state.container.kafka_producer()
+        await kafka_producer.start()
+        asyncio.create_task(run_outbox_poller())
+
     yield
-    scheduler.shutdown()
-    await kafka_producer.stop()
-    logging.info("Scheduler shutdown complete")
+
+    for flush_job in flush_jobs:
+        await flush_job.shutdown()
+    if run_background_jobs:
+        await scheduler.shutdown()
+        await kafka_producer.stop()
+        logging.info("Scheduler shutdown complete")
+    app.state.container.upstream_geo_service().close()
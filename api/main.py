@@ -4,9 +4,12 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from api.adapters.http.controllers import router
-from api.adapters.kafka.basket_confirmed.consumer import router as router_kafka
+from api.adapters.kafka.basket_confirmed import consumer as basket_confirmed_consumer  # noqa: F401
+from api.adapters.kafka.courier_locations import consumer as courier_locations_consumer  # noqa: F401
+from api.adapters.kafka.router import router as router_kafka
 from api.config import get_settings
 from api.lifespan import lifespan
+from infrastructure.config.settings import get_settings as get_infrastructure_settings
 from infrastructure.di.container import Container
 
 
@@ -18,7 +21,8 @@ def get_application() -> FastAPI:
     container.wire(
         modules=[
             "api.adapters.kafka.basket_confirmed.consumer",
-            "api.adapters.background_jobs.assign_orders_job",
+            "api.adapters.kafka.courier_locations.consumer",
+            "api.adapters.background_jobs.scheduler",
             "api.adapters.http.controllers",
             __name__,
         ],
@@ -36,7 +40,8 @@ def get_application() -> FastAPI:
     application.state.container = container
 
     application.include_router(router)
-    application.include_router(router_kafka)
+    if get_infrastructure_settings().process.API_CONSUME_KAFKA:
+        application.include_router(router_kafka)
 
     return application
 
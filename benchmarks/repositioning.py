@@ -0,0 +1,169 @@
+"""
+Симуляция диспетчеризации с перемещением свободных курьеров к спросу и без него:
+
+    python -m benchmarks.repositioning
+
+Спрос проходит тот же путь, что и в сервисе: минутные корзины demand_heatmap (хранилище в памяти),
+DemandHeatmap.hotspots и RepositionIdleCouriersUseCase с окном и числом клеток из команды.
+Один тик симуляции - одна минута.
+"""
+
+import asyncio
+import random
+from collections import Counter
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from core.application.use_cases.commands.reposition_idle_couriers import (
+    RepositionIdleCouriersCommand,
+    RepositionIdleCouriersUseCase,
+)
+from core.domain.model.courier_aggregate.courier_aggregate import Courier
+from core.domain.model.order_aggregate.order_aggregate import Order
+from core.domain.services.dispatch_service import Dispatcher
+from core.domain.services.repositioning_service import RepositioningPlanner
+from core.domain.shared_kernel.location import Location
+from infrastructure.adapters.in_process import DemandHeatmap
+from infrastructure.adapters.in_process.demand_heatmap import from_minute, to_minute
+from infrastructure.adapters.postgres.projections import cell_index
+
+# Первая минута симуляции
+START_MINUTE = 29_000_000
+
+
+class SimulatedDemandHeatmapStore:
+    """Минутные корзины созданных заказов в памяти, в формате PostgresDemandHeatmapStore.read_since."""
+
+    def __init__(self):
+        self.created: Counter[tuple[int, int]] = Counter()
+
+    def add(self, minute: int, location: Location) -> None:
+        self.created[minute, cell_index(location)] += 1
+
+    async def read_since(self, bucket: datetime) -> list[tuple[datetime, int, int, int, int]]:
+        since = to_minute(bucket)
+        return [
+            (from_minute(minute), cell, created, 0, 0)
+            for (minute, cell), created in self.created.items()
+            if minute >= since
+        ]
+
+
+class SimulatedDemandHeatmap(DemandHeatmap):
+    """Тепловая карта с часами симуляции вместо системного времени."""
+
+    def __init__(self, store: SimulatedDemandHeatmapStore):
+        super().__init__(store, refresh_interval=0)
+        self.minute = START_MINUTE
+
+    def _current_minute(self) -> int:
+        return self.minute
+
+
+class SimulatedCourierRepository:
+    def __init__(self, couriers: list[Courier], orders: dict[UUID, Order]):
+        self.couriers = couriers
+        self.orders = orders
+
+    async def get_all_free_couriers(self) -> list[Courier]:
+        return [courier for courier in self.couriers if courier.id not in self.orders]
+
+    async def update_free_courier_locations(self, locations: dict) -> set[UUID]:
+        # Курьеры сдвинуты на месте, use case получил те же объекты
+        return set(locations)
+
+
+class SimulatedUnitOfWork:
+    def __init__(self, courier_repository: SimulatedCourierRepository):
+        self.courier_repository = courier_repository
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+async def simulate(reserve_fraction: float | None, seed: int, ticks: int = 600, couriers_count: int = 6) -> float:
+    """
+    Симуляция на сетке 10x10: 70% заказов появляется в двух клетках спроса,
+    которые каждые 100 тиков меняются, остальные - в случайных клетках.
+    Возвращает среднее время до заказа (calculate_time_to_location) в момент назначения.
+    reserve_fraction=None - без перемещения свободных курьеров.
+    """
+    rng = random.Random(seed)
+    dispatcher = Dispatcher()
+    phases = [
+        [Location.create(2, 8), Location.create(8, 3)],
+        [Location.create(9, 9), Location.create(5, 2)],
+        [Location.create(1, 1), Location.create(6, 7)],
+    ]
+    couriers = [
+        Courier.create(name=f"Courier {i}", speed=1, location=Location.create(rng.randint(1, 10), rng.randint(1, 10)))
+        for i in range(couriers_count)
+    ]
+    orders: dict[UUID, Order] = {}
+    pending: list[Order] = []
+    etas: list[int] = []
+
+    store = SimulatedDemandHeatmapStore()
+    heatmap = SimulatedDemandHeatmap(store)
+    reposition = RepositionIdleCouriersUseCase(
+        uow=SimulatedUnitOfWork(SimulatedCourierRepository(couriers, orders)),
+        heatmap=heatmap,
+        planner=RepositioningPlanner(),
+    )
+
+    for tick in range(ticks):
+        heatmap.minute = START_MINUTE + tick
+        hot_cells = phases[tick // 100 % len(phases)]
+        for _ in range(rng.choice((0, 0, 1, 1, 2))):
+            if rng.random() < 0.7:
+                location = rng.choice(hot_cells)
+            else:
+                location = Location.create(rng.randint(1, 10), rng.randint(1, 10))
+            store.add(heatmap.minute, location)
+            pending.append(Order.create(order_id=uuid4(), location=location, volume=10))
+
+        # Назначение: ближайший свободный курьер
+        while pending:
+            free = [courier for courier in couriers if courier.id not in orders]
+            if not free:
+                break
+            order = pending.pop(0)
+            courier = dispatcher.dispatch(free, order)
+            etas.append(courier.calculate_time_to_location(order.location))
+            orders[courier.id] = order
+
+        # Перемещение курьеров с заказами
+        for courier in couriers:
+            order = orders.get(courier.id)
+            if order is not None:
+                courier.move_towards(order.location)
+                if courier.location == order.location:
+                    courier.complete_order(order)
+                    del orders[courier.id]
+
+        # Перемещение свободных курьеров к спросу
+        if reserve_fraction is not None:
+            await reposition.handle(RepositionIdleCouriersCommand(reserve_fraction=reserve_fraction))
+
+    return sum(etas) / len(etas)
+
+
+async def average_time_to_pickup(reserve_fraction: float | None, seeds: range = range(4)) -> float:
+    return sum([await simulate(reserve_fraction, seed) for seed in seeds]) / len(seeds)
+
+
+async def run() -> None:
+    print(f"no repositioning: average time to pickup {await average_time_to_pickup(None):.2f}")
+    for fraction in (0.0, 0.3, 0.5, 0.8):
+        print(f"reserve {fraction:.1f}: average time to pickup {await average_time_to_pickup(fraction):.2f}")
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ import logging
 
 from core.application.use_cases.commands.base import Command, CommandHandler
 from core.domain.services.dispatch_service_interface import DispatcherInterface
+from core.ports.courier_state_interface import CourierStateInterface
 from core.ports.unit_of_work import UnitOfWork
 
 
@@ -14,23 +15,30 @@ class AssignOrdersUseCase(CommandHandler):
         self,
         uow: UnitOfWork,
         dispatcher: DispatcherInterface,
+        courier_state: CourierStateInterface | None = None,
     ):
         self.uow = uow
         self.dispatcher = dispatcher
+        self.courier_state = courier_state
 
-    async def handle(self, command: AssignOrdersCommand):
+    async def handle(self, command: AssignOrdersCommand) -> int:
+        """Назначить один заказ. Возвращает количество назначенных заказов."""
         async with self.uow:
             order = await self.uow.order_repository.get_one_created_order()
             if order is None:
                 logging.error("No created order found")
-                return
+                return 0
 
             couriers = await self.uow.courier_repository.get_all_free_couriers()
             if len(couriers) == 0:
                 logging.error("No free couriers found")
-                return
+                return 0
 
             closest_courier = self.dispatcher.dispatch(couriers, order)
 
             await self.uow.order_repository.update_order(order)
             await self.uow.courier_repository.update_courier(closest_courier)
+
+        if self.courier_state is not None:
+            self.courier_state.track_assignment(closest_courier, order)
+        return 1
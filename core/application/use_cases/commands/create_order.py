@@ -2,6 +2,8 @@ from uuid import UUID
 
 from core.application.use_cases.commands.base import Command, CommandHandler
 from core.domain.model.order_aggregate.order_aggregate import Order
+from core.domain.shared_kernel.location import Location
+from core.ports.assignment_trigger_interface import AssignmentTriggerInterface
 from core.ports.geo_service_interface import GeoServiceInterface
 from core.ports.unit_of_work import UnitOfWork
 
@@ -10,20 +12,37 @@ class CreateOrderCommand(Command):
     basket_id: UUID
     street: str
     volume: int
+    # Уже известная геолокация адреса, если None - определяется через гео-сервис
+    location: Location | None = None
+
+
+class OrderAlreadyExistsError(ValueError):
+    pass
 
 
 class CreateOrderUseCase(CommandHandler):
-    def __init__(self, uow: UnitOfWork, geo_service: GeoServiceInterface):
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        geo_service: GeoServiceInterface,
+        assignment_trigger: AssignmentTriggerInterface | None = None,
+    ):
         self.uow = uow
         self.geo_service = geo_service
+        self.assignment_trigger = assignment_trigger
 
     async def handle(self, command: CreateOrderCommand) -> None:
+        # Гео-сервис вызывается до открытия транзакции, чтобы не держать соединение с БД во время RPC
+        location = command.location or await self.geo_service.get_location(command.street)
+
         async with self.uow:
             order = await self.uow.order_repository.get_order(command.basket_id)
             if order:
-                raise ValueError("Order already exists")
-
-            location = await self.geo_service.get_location(command.street)
+                raise OrderAlreadyExistsError("Order already exists")
 
             order = Order.create(command.basket_id, location, command.volume)
             await self.uow.order_repository.add_order(order)
+
+        # Заказ закоммичен: будим назначение, не дожидаясь периодического запуска
+        if self.assignment_trigger is not None:
+            self.assignment_trigger.notify()
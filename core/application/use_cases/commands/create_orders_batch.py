@@ -0,0 +1,81 @@
+import asyncio
+import logging
+from uuid import UUID
+
+from core.application.use_cases.commands.base import Command, CommandHandler
+from core.application.use_cases.commands.create_order import CreateOrderCommand
+from core.domain.model.order_aggregate.order_aggregate import Order
+from core.domain.shared_kernel.location import Location
+from core.ports.assignment_trigger_interface import AssignmentTriggerInterface
+from core.ports.geo_service_interface import GeoServiceInterface
+from core.ports.unit_of_work import UnitOfWork
+
+
+class CreateOrdersBatchCommand(Command):
+    orders: list[CreateOrderCommand]
+
+
+class CreateOrdersBatchUseCase(CommandHandler):
+    """
+    Создание пачки заказов в одной транзакции. Уже существующие заказы пропускаются.
+    Геолокации определяются до открытия транзакции, не больше geocode_concurrency запросов одновременно.
+    """
+
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        geo_service: GeoServiceInterface,
+        assignment_trigger: AssignmentTriggerInterface | None = None,
+        geocode_concurrency: int = 16,
+    ):
+        self.uow = uow
+        self.geo_service = geo_service
+        self.assignment_trigger = assignment_trigger
+        self.geocode_concurrency = geocode_concurrency
+
+    async def handle(self, command: CreateOrdersBatchCommand) -> int:
+        # Дедупликация по basket_id: повторные доставки сообщения в пачке обрабатываются один раз
+        unique_commands: dict = {}
+        for order_command in command.orders:
+            unique_commands.setdefault(order_command.basket_id, order_command)
+
+        if not unique_commands:
+            return 0
+
+        existing_ids = await self.get_existing_order_ids(list(unique_commands))
+        new_commands = [
+            order_command for basket_id, order_command in unique_commands.items() if basket_id not in existing_ids
+        ]
+        if existing_ids:
+            logging.info(f"Skipped {len(existing_ids)} already existing orders")
+        if not new_commands:
+            return 0
+
+        # Транзакция не держится открытой на время запросов к гео-сервису
+        semaphore = asyncio.Semaphore(self.geocode_concurrency)
+        locations = await asyncio.gather(
+            *(self._resolve_location(order_command, semaphore) for order_command in new_commands)
+        )
+        orders = [
+            Order.create(order_command.basket_id, location, order_command.volume)
+            for order_command, location in zip(new_commands, locations)
+        ]
+
+        async with self.uow:
+            # Заказы, созданные другим обработчиком после проверки, пропускаются при вставке
+            added_orders = await self.uow.order_repository.add_orders(orders)
+
+        if added_orders and self.assignment_trigger is not None:
+            self.assignment_trigger.notify()
+        return len(added_orders)
+
+    async def get_existing_order_ids(self, basket_ids: list[UUID]) -> set[UUID]:
+        """Заказы, которые уже созданы: их не нужно геокодировать до сохранения."""
+        async with self.uow:
+            return await self.uow.order_repository.get_existing_order_ids(basket_ids)
+
+    async def _resolve_location(self, command: CreateOrderCommand, semaphore: asyncio.Semaphore) -> Location:
+        if command.location is not None:
+            return command.location
+        async with semaphore:
+            return await self.geo_service.get_location(command.street)
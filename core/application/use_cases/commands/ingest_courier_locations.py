@@ -0,0 +1,40 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from core.application.use_cases.commands.base import Command, CommandHandler
+from core.domain.shared_kernel.location import Location
+from core.ports.courier_location_buffer_interface import CourierLocationBufferInterface
+from core.ports.courier_position_history_interface import CourierPositionHistoryInterface
+
+
+class CourierLocationPing(BaseModel):
+    courier_id: UUID
+    location: Location
+    ts: datetime
+
+
+class IngestCourierLocationsCommand(Command):
+    pings: list[CourierLocationPing]
+
+
+class IngestCourierLocationsUseCase(CommandHandler):
+    def __init__(
+        self,
+        location_buffer: CourierLocationBufferInterface,
+        position_history: CourierPositionHistoryInterface | None = None,
+    ):
+        self.location_buffer = location_buffer
+        self.position_history = position_history
+
+    async def handle(self, command: IngestCourierLocationsCommand) -> int:
+        """Принять позиции курьеров в буфер. Возвращает количество принятых позиций."""
+        accepted = 0
+        for ping in command.pings:
+            if not self.location_buffer.add(ping.courier_id, ping.location, ping.ts):
+                continue
+            accepted += 1
+            if self.position_history is not None:
+                self.position_history.record(ping.courier_id, ping.location, ping.ts)
+        return accepted
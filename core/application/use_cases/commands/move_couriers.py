@@ -1,23 +1,31 @@
 import logging
+from datetime import datetime, timezone
 
 from core.application.use_cases.commands.base import Command, CommandHandler
+from core.ports.courier_position_history_interface import CourierPositionHistoryInterface
 from core.ports.unit_of_work import UnitOfWork
 
 
 class MoveCouriersCommand(Command):
-    pass
+    # Шард курьеров, который перемещается в этом запуске. По умолчанию - все курьеры
+    shard: int = 0
+    shard_count: int = 1
 
 
 class MoveCouriersUseCase(CommandHandler):
     def __init__(
         self,
         uow: UnitOfWork,
+        position_history: CourierPositionHistoryInterface | None = None,
     ):
         self.uow = uow
+        self.position_history = position_history
 
-    async def handle(self, command: MoveCouriersCommand) -> None:
+    async def handle(self, command: MoveCouriersCommand) -> int:
+        """Переместить курьеров назначенных заказов на один шаг. Возвращает количество перемещенных курьеров."""
+        moved = []
         async with self.uow:
-            orders = await self.uow.order_repository.get_all_assigned_orders()
+            orders = await self.uow.order_repository.get_all_assigned_orders(command.shard, command.shard_count)
             for order in orders:
                 if not order.courier_id:
                     logging.info(f"Order {order.id} has no courier")
@@ -39,4 +47,12 @@ class MoveCouriersUseCase(CommandHandler):
 
                 await self.uow.courier_repository.update_courier(courier)
 
+                moved.append(courier)
                 logging.info(f"Courier {courier.id} moved to {courier.location}")
+
+        # История пишется после коммита и отдельно от транзакции перемещения
+        if self.position_history is not None:
+            recorded_at = datetime.now(timezone.utc)
+            for courier in moved:
+                self.position_history.record(courier.id, courier.location, recorded_at)
+        return len(moved)
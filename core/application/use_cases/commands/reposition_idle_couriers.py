@@ -0,0 +1,59 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+from pydantic import Field
+
+from core.application.use_cases.commands.base import Command, CommandHandler
+from core.domain.services.repositioning_service import RepositioningPlanner
+from core.domain.shared_kernel.location import Location
+from core.ports.courier_position_history_interface import CourierPositionHistoryInterface
+from core.ports.demand_heatmap_interface import DemandHeatmapInterface
+from core.ports.unit_of_work import UnitOfWork
+
+
+class RepositionIdleCouriersCommand(Command):
+    # Доля свободных курьеров, которые остаются на месте
+    reserve_fraction: float = Field(0.3, ge=0, le=1)
+    # Спрос считается по созданным заказам за окно в минутах, в hotspots самых загруженных клетках
+    window_minutes: int = 15
+    hotspots: int = 5
+
+
+class RepositionIdleCouriersUseCase(CommandHandler):
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        heatmap: DemandHeatmapInterface,
+        planner: RepositioningPlanner,
+        position_history: CourierPositionHistoryInterface | None = None,
+    ):
+        self.uow = uow
+        self.heatmap = heatmap
+        self.planner = planner
+        self.position_history = position_history
+
+    async def handle(self, command: RepositionIdleCouriersCommand) -> int:
+        """Сдвинуть свободных курьеров на один шаг к клеткам спроса. Возвращает количество перемещенных курьеров."""
+        hotspots = await self.heatmap.hotspots(command.window_minutes, command.hotspots)
+        if not hotspots:
+            return 0
+
+        moved: dict[UUID, Location] = {}
+        async with self.uow:
+            couriers = await self.uow.courier_repository.get_all_free_couriers()
+            for courier, target in self.planner.plan(couriers, hotspots, command.reserve_fraction):
+                if courier.location == target:
+                    continue
+                courier.move_towards(target)
+                moved[courier.id] = courier.location
+
+            # Занятость курьеров не меняется, поэтому достаточно обновить позиции одним запросом.
+            # Курьеры, получившие заказ после чтения, остаются на месте
+            updated = await self.uow.courier_repository.update_free_courier_locations(moved)
+            moved = {courier_id: location for courier_id, location in moved.items() if courier_id in updated}
+
+        if self.position_history is not None:
+            recorded_at = datetime.now(timezone.utc)
+            for courier_id, location in moved.items():
+                self.position_history.record(courier_id, location, recorded_at)
+        return len(moved)
@@ -1,11 +1,11 @@
 from uuid import UUID
 
 from pydantic import BaseModel
-from sqlalchemy import func, select
+from sqlalchemy import select
 
 from core.application.use_cases.queries.base import Query, QueryHandler
 from core.domain.shared_kernel.location import Location
-from infrastructure.adapters.postgres.models.courier_aggregate import CourierModel, StoragePlaceModel
+from infrastructure.adapters.postgres.models.projections import CourierViewModel
 from infrastructure.adapters.postgres.uow import UnitOfWork
 
 
@@ -25,15 +25,10 @@ class GetAllBusyCouriersUseCase(QueryHandler):
 
     async def handle(self, query: GetAllBusyCouriersQuery) -> list[BusyCourier]:
         async with self.uow:
-            sql_query = (
-                select(CourierModel.id, CourierModel.name, CourierModel.location)
-                .outerjoin(CourierModel.storage_places)
-                .group_by(CourierModel.id)
-                .having(func.count(StoragePlaceModel.order_id) != 0)
-                .execution_options(populate_existing=True)
-            )
+            # Чтение из проекции courier_view по индексу is_busy вместо подсчета мест хранения
+            sql_query = select(
+                CourierViewModel.id, CourierViewModel.name, CourierViewModel.x, CourierViewModel.y
+            ).where(CourierViewModel.is_busy.is_(True))
 
             result = await self.uow.session.execute(sql_query)
-            busy_couriers = result.all()
-            # TODO: здесь сделать правильную валдиацию
-            return [BusyCourier.model_validate(courier, from_attributes=True) for courier in busy_couriers]
+            return [BusyCourier(id=id_, name=name, location=Location(x=x, y=y)) for id_, name, x, y in result.all()]
@@ -6,7 +6,7 @@ from sqlalchemy import select
 
 from core.application.use_cases.queries.base import Query, QueryHandler
 from core.domain.shared_kernel.location import Location
-from infrastructure.adapters.postgres.models.courier_aggregate import CourierModel
+from infrastructure.adapters.postgres.models.projections import CourierViewModel
 from infrastructure.adapters.postgres.uow import UnitOfWork
 
 
@@ -26,13 +26,8 @@ class GetAllCouriersUseCase(QueryHandler):
 
     async def handle(self, query: GetAllCouriersQuery) -> Sequence[Courier]:
         async with self.uow:
-            sql_query = (
-                select(CourierModel.id, CourierModel.name, CourierModel.location)
-                .outerjoin(CourierModel.storage_places)
-                .execution_options(populate_existing=True)
-            )
+            # Чтение из проекции courier_view без join с местами хранения
+            sql_query = select(CourierViewModel.id, CourierViewModel.name, CourierViewModel.x, CourierViewModel.y)
 
             result = await self.uow.session.execute(sql_query)
-            couriers = result.all()
-            # TODO: здесь сделать правильную валдиацию
-            return [Courier.model_validate(courier, from_attributes=True) for courier in couriers]
+            return [Courier(id=id_, name=name, location=Location(x=x, y=y)) for id_, name, x, y in result.all()]
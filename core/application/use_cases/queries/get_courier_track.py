@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy import select
+
+from core.application.use_cases.queries.base import Query, QueryHandler
+from infrastructure.adapters.postgres.models.courier_position import CourierPositionModel
+from infrastructure.adapters.postgres.uow import UnitOfWork
+
+
+@dataclass(frozen=True)
+class GetCourierTrackQuery(Query):
+    courier_id: UUID
+    since: datetime
+    until: datetime
+    limit: int = 10000
+
+
+class TrackPoint(BaseModel):
+    x: int
+    y: int
+    recorded_at: datetime
+
+
+def to_utc_naive(value: datetime) -> datetime:
+    """Время в courier_positions хранится в UTC без часового пояса."""
+    return value.astimezone(timezone.utc).replace(tzinfo=None) if value.tzinfo else value
+
+
+class GetCourierTrackUseCase(QueryHandler):
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    async def handle(self, query: GetCourierTrackQuery) -> list[TrackPoint]:
+        async with self.uow:
+            # Условие по recorded_at отсекает секции и блоки по BRIN-индексу
+            sql_query = (
+                select(CourierPositionModel.x, CourierPositionModel.y, CourierPositionModel.recorded_at)
+                .where(
+                    CourierPositionModel.courier_id == query.courier_id,
+                    CourierPositionModel.recorded_at >= to_utc_naive(query.since),
+                    CourierPositionModel.recorded_at < to_utc_naive(query.until),
+                )
+                .order_by(CourierPositionModel.recorded_at)
+                .limit(query.limit)
+            )
+            result = await self.uow.session.execute(sql_query)
+            return [
+                TrackPoint(x=x, y=y, recorded_at=recorded_at.replace(tzinfo=timezone.utc))
+                for x, y, recorded_at in result.all()
+            ]
@@ -0,0 +1,39 @@
+from pydantic import BaseModel
+
+from core.application.use_cases.queries.base import Query, QueryHandler
+from core.domain.model.order_aggregate.order_status import OrderStatus, OrderStatusEnum
+from infrastructure.adapters.postgres.projections.counters import (
+    COURIERS_BUSY,
+    COURIERS_FREE,
+    order_status_counter,
+    read_counters,
+)
+from infrastructure.adapters.postgres.uow import UnitOfWork
+
+
+class GetDashboardStatsQuery(Query):
+    pass
+
+
+class DashboardStats(BaseModel):
+    orders_by_status: dict[OrderStatusEnum, int]
+    busy_couriers: int
+    free_couriers: int
+
+
+class GetDashboardStatsUseCase(QueryHandler):
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    async def handle(self, query: GetDashboardStatsQuery) -> DashboardStats:
+        async with self.uow:
+            # Счетчики поддерживаются при записи, чтение не зависит от количества заказов и курьеров
+            counters = await read_counters(self.uow.session)
+            return DashboardStats(
+                orders_by_status={
+                    status: counters.get(order_status_counter(OrderStatus(name=status)), 0)
+                    for status in OrderStatusEnum
+                },
+                busy_couriers=counters.get(COURIERS_BUSY, 0),
+                free_couriers=counters.get(COURIERS_FREE, 0),
+            )
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+
+from pydantic import BaseModel
+
+from core.application.use_cases.queries.base import Query, QueryHandler
+from core.ports.demand_heatmap_interface import DemandHeatmapInterface
+
+
+@dataclass(frozen=True)
+class GetDemandHeatmapQuery(Query):
+    window_minutes: int = 15
+
+
+class DemandHeatmapGrid(BaseModel):
+    """Сетки 10x10 по строкам: элемент [y - 1][x - 1] - количество заказов в клетке (x, y)."""
+
+    window_minutes: int
+    created: list[list[int]]
+    assigned: list[list[int]]
+    completed: list[list[int]]
+
+
+def to_rows(cells: list[int], size: int = 10) -> list[list[int]]:
+    return [cells[row * size : (row + 1) * size] for row in range(size)]
+
+
+class GetDemandHeatmapUseCase(QueryHandler):
+    def __init__(self, heatmap: DemandHeatmapInterface):
+        self.heatmap = heatmap
+
+    async def handle(self, query: GetDemandHeatmapQuery) -> DemandHeatmapGrid:
+        return DemandHeatmapGrid(
+            window_minutes=query.window_minutes,
+            created=to_rows(await self.heatmap.grid("created", query.window_minutes)),
+            assigned=to_rows(await self.heatmap.grid("assigned", query.window_minutes)),
+            completed=to_rows(await self.heatmap.grid("completed", query.window_minutes)),
+        )
@@ -4,9 +4,8 @@ from pydantic import BaseModel
 from sqlalchemy import select
 
 from core.application.use_cases.queries.base import Query, QueryHandler
-from core.domain.model.order_aggregate.order_status import OrderStatusEnum
 from core.domain.shared_kernel.location import Location
-from infrastructure.adapters.postgres.models.order_aggregate import OrderModel
+from infrastructure.adapters.postgres.models.projections import ActiveOrderViewModel
 from infrastructure.adapters.postgres.uow import UnitOfWork
 
 
@@ -25,9 +24,7 @@ class GetNotCompletedOrdersUseCase(QueryHandler):
 
     async def handle(self, query: GetNotCompletedOrdersQuery) -> list[NotCompletedOrder]:
         async with self.uow:
-            sql_query = select(OrderModel.id, OrderModel.location).where(
-                OrderModel.order_status.in_((OrderStatusEnum.ASSIGNED, OrderStatusEnum.CREATED))
-            )
+            # В проекции active_order_view только незавершенные заказы
+            sql_query = select(ActiveOrderViewModel.id, ActiveOrderViewModel.x, ActiveOrderViewModel.y)
             result = await self.uow.session.execute(sql_query)
-            not_completed_orders = result.all()
-            return [NotCompletedOrder.model_validate(order, from_attributes=True) for order in not_completed_orders]
+            return [NotCompletedOrder(id=id_, location=Location(x=x, y=y)) for id_, x, y in result.all()]
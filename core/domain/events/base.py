@@ -1,3 +1,4 @@
+from typing import Hashable
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -10,7 +11,30 @@ class BaseDomainEvent(BaseModel):
     def get_event_type(cls) -> str:
         return cls.__name__
 
+    def get_coalesce_key(self) -> Hashable | None:
+        """Ключ для схлопывания событий в пределах транзакции. None - событие не схлопывается."""
+        return None
+
+    def merge(self, newer: "BaseDomainEvent") -> "BaseDomainEvent":
+        """Объединить событие с более поздним событием с тем же ключом."""
+        return newer
+
+    def is_noop(self) -> bool:
+        """Событие не описывает реального изменения и может быть отброшено."""
+        return False
+
 
 class OrderStatusChangedEvent(BaseDomainEvent):
     order_id: UUID = Field(..., description="ID заказа")
     order_status: OrderStatus = Field(..., description="Статус заказа")
+    previous_status: OrderStatus | None = Field(None, description="Статус заказа до изменения")
+
+    def get_coalesce_key(self) -> Hashable | None:
+        return self.get_event_type(), self.order_id
+
+    def merge(self, newer: BaseDomainEvent) -> BaseDomainEvent:
+        # Переход считается от состояния до транзакции к последнему состоянию в ней
+        return newer.model_copy(update={"previous_status": self.previous_status})
+
+    def is_noop(self) -> bool:
+        return self.previous_status == self.order_status
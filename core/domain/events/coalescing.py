@@ -0,0 +1,23 @@
+from typing import Hashable
+
+from core.domain.events.base import BaseDomainEvent
+
+
+def coalesce_events(events: list[BaseDomainEvent]) -> list[BaseDomainEvent]:
+    """
+    Схлопнуть события одной транзакции.
+
+    События с одинаковым ключом объединяются в одно, которое занимает позицию последнего из них,
+    поэтому порядок между разными агрегатами сохраняется. События без реального изменения отбрасываются.
+    """
+    coalesced: dict[Hashable, BaseDomainEvent] = {}
+    for event in events:
+        key = event.get_coalesce_key()
+        if key is None:
+            coalesced[object()] = event
+            continue
+
+        previous = coalesced.pop(key, None)
+        coalesced[key] = previous.merge(event) if previous is not None else event
+
+    return [event for event in coalesced.values() if not event.is_noop()]
@@ -0,0 +1,54 @@
+import math
+
+from core.domain.model.courier_aggregate.courier_aggregate import Courier
+from core.domain.shared_kernel.location import Location
+
+
+class RepositioningPlanner:
+    """
+    Распределение свободных курьеров по клеткам с высоким спросом.
+
+    Доля reserve_fraction свободных курьеров остается на месте. Остальные делятся между клетками
+    пропорционально спросу, и каждую клетку по очереди занимают ближайшие по calculate_time_to_location курьеры.
+    Лишние курьеры в одной клетке простаивают, пока заказы в других клетках ждут дальних курьеров,
+    поэтому клетке достается не больше одного курьера на ORDERS_PER_COURIER заказов.
+    """
+
+    ORDERS_PER_COURIER = 4
+
+    def plan(
+        self, couriers: list[Courier], hotspots: list[tuple[Location, int]], reserve_fraction: float
+    ) -> list[tuple[Courier, Location]]:
+        """Пары (курьер, целевая клетка). Курьер уже может стоять в своей клетке."""
+        if not 0 <= reserve_fraction <= 1:
+            raise ValueError("reserve_fraction must be between 0 and 1")
+
+        movable = len(couriers) - math.ceil(len(couriers) * reserve_fraction)
+        if movable <= 0 or not hotspots:
+            return []
+
+        available = list(couriers)
+        plan = []
+        for target, quota in zip((location for location, _ in hotspots), self._quotas(movable, hotspots)):
+            for _ in range(quota):
+                courier = min(available, key=lambda c: c.calculate_time_to_location(target))
+                available.remove(courier)
+                plan.append((courier, target))
+        return plan
+
+    @staticmethod
+    def _quotas(movable: int, hotspots: list[tuple[Location, int]]) -> list[int]:
+        """Квоты клеток пропорционально спросу, остаток - клеткам с наибольшей дробной частью."""
+        total = sum(weight for _, weight in hotspots)
+        if total <= 0:
+            return [0] * len(hotspots)
+
+        shares = [movable * weight / total for _, weight in hotspots]
+        quotas = [math.floor(share) for share in shares]
+        by_remainder = sorted(range(len(hotspots)), key=lambda i: quotas[i] - shares[i])
+        for i in by_remainder[: movable - sum(quotas)]:
+            quotas[i] += 1
+        return [
+            min(quota, math.ceil(weight / RepositioningPlanner.ORDERS_PER_COURIER))
+            for quota, (_, weight) in zip(quotas, hotspots)
+        ]
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+
+class AssignmentTriggerInterface(ABC):
+    @abstractmethod
+    def notify(self) -> None:
+        """Сообщить, что появились заказы для назначения."""
+        pass
+
+    @abstractmethod
+    async def wait(self, timeout: float) -> bool:
+        """Ждать уведомления не дольше timeout. Возвращает True, если было уведомление."""
+        pass
+
+    async def close(self) -> None:
+        """Освободить соединения. Реализациям внутри процесса закрывать нечего."""
+        pass
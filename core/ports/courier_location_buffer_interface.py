@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
+
+from core.domain.shared_kernel.location import Location
+
+
+class CourierLocationBufferInterface(ABC):
+    @abstractmethod
+    def add(self, courier_id: UUID, location: Location, ts: datetime) -> bool:
+        """Принять позицию курьера. Возвращает False, если позиция старее уже принятой."""
+        pass
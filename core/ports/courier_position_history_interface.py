@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
+
+from core.domain.shared_kernel.location import Location
+
+
+class CourierPositionHistoryInterface(ABC):
+    @abstractmethod
+    def record(self, courier_id: UUID, location: Location, recorded_at: datetime) -> None:
+        """Запомнить позицию курьера для истории. Запись в хранилище выполняется отдельно, пачками."""
+        pass
@@ -2,6 +2,7 @@ from abc import abstractmethod
 from uuid import UUID
 
 from core.domain.model.courier_aggregate.courier_aggregate import Courier
+from core.domain.shared_kernel.location import Location
 from core.ports.base_repository_interface import BaseRepository
 
 
@@ -18,6 +19,20 @@ class CourierRepositoryInterface(BaseRepository):
     async def get_courier(self, courier_id: UUID) -> Courier | None:
         pass
 
+    @abstractmethod
+    async def get_couriers(self, courier_ids: list[UUID]) -> list[Courier]:
+        pass
+
     @abstractmethod
     async def get_all_free_couriers(self) -> list[Courier]:
         pass
+
+    @abstractmethod
+    async def update_locations(self, locations: dict[UUID, Location]) -> None:
+        """Обновить местоположения курьеров одним запросом."""
+        pass
+
+    @abstractmethod
+    async def update_free_courier_locations(self, locations: dict[UUID, Location]) -> set[UUID]:
+        """Обновить местоположения курьеров, которые все еще свободны. Возвращает идентификаторы обновленных."""
+        pass
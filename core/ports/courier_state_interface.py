@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+from core.domain.model.courier_aggregate.courier_aggregate import Courier
+from core.domain.model.order_aggregate.order_aggregate import Order
+
+
+class CourierStateInterface(ABC):
+    @abstractmethod
+    def track_assignment(self, courier: Courier, order: Order) -> None:
+        """Сообщить о закоммиченном назначении заказа курьеру."""
+        pass
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from core.domain.shared_kernel.location import Location
+
+
+class DemandHeatmapInterface(ABC):
+    @abstractmethod
+    async def grid(self, kind: str, window_minutes: int) -> list[int]:
+        """Количество заказов вида kind (created, assigned, completed) по клеткам 10x10 за последние window_minutes."""
+        pass
+
+    @abstractmethod
+    async def hotspots(self, window_minutes: int, limit: int) -> list[tuple[Location, int]]:
+        """Клетки с наибольшим числом созданных заказов за окно, по убыванию."""
+        pass
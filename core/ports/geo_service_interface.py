@@ -3,7 +3,17 @@ from abc import ABC, abstractmethod
 from core.domain.shared_kernel.location import Location
 
 
+class StreetNotFoundError(ValueError):
+    """Гео-сервис не знает такую улицу."""
+
+    pass
+
+
 class GeoServiceInterface(ABC):
     @abstractmethod
     async def get_location(self, street: str) -> Location:
         pass
+
+    def close(self) -> None:
+        """Освободить соединения с гео-сервисом. Реализациям без соединений закрывать нечего."""
+        pass
@@ -10,6 +10,11 @@ class OrderRepositoryInterface(BaseRepository):
     async def add_order(self, order: Order) -> Order:
         pass
 
+    @abstractmethod
+    async def add_orders(self, orders: list[Order]) -> list[Order]:
+        """Добавить заказы пачкой, пропуская уже существующие. Возвращает добавленные заказы."""
+        pass
+
     @abstractmethod
     async def update_order(self, order: Order) -> None:
         pass
@@ -18,10 +23,15 @@ class OrderRepositoryInterface(BaseRepository):
     async def get_order(self, order_id: UUID) -> Order | None:
         pass
 
+    @abstractmethod
+    async def get_existing_order_ids(self, order_ids: list[UUID]) -> set[UUID]:
+        pass
+
     @abstractmethod
     async def get_one_created_order(self) -> Order | None:
         pass
 
     @abstractmethod
-    async def get_all_assigned_orders(self) -> list[Order]:
+    async def get_all_assigned_orders(self, shard: int = 0, shard_count: int = 1) -> list[Order]:
+        """Назначенные заказы. При shard_count > 1 - только заказы курьеров из шарда shard."""
         pass
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from core.domain.events.base import BaseDomainEvent
+from core.domain.events.coalescing import coalesce_events
 from core.ports.base_repository_interface import BaseRepository
 from core.ports.courier_repository_interface import CourierRepositoryInterface
 from core.ports.event_publisher_interface import EventPublisherInterface
@@ -36,3 +38,10 @@ class UnitOfWork(ABC):
 
     def register_repository(self, repo: BaseRepository):
         self._repositories.append(repo)
+
+    def collect_events(self) -> list[BaseDomainEvent]:
+        """Собрать события репозиториев, схлопнув их в пределах транзакции."""
+        events: list[BaseDomainEvent] = []
+        for repo in self._repositories:
+            events.extend(repo.get_events())
+        return coalesce_events(events)
@@ -0,0 +1,3 @@
+from .cached_geo_service import CachedGeoService, GeoCacheEntry, GeoCacheStore, normalize_street
+
+__all__ = ["CachedGeoService", "GeoCacheEntry", "GeoCacheStore", "normalize_street"]
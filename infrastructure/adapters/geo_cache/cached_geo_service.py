@@ -0,0 +1,158 @@
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import NamedTuple
+
+from core.domain.shared_kernel.location import Location
+from core.ports.geo_service_interface import GeoServiceInterface, StreetNotFoundError
+from infrastructure.metrics import metrics
+
+
+class GeoCacheEntry(NamedTuple):
+    # None - улица не найдена (негативное кэширование)
+    location: Location | None
+    # Время истечения записи, unix timestamp
+    expires_at: float
+
+
+class GeoCacheStore(ABC):
+    """Разделяемое хранилище кэша геокодирования (переживает рестарты, общее для реплик)."""
+
+    @abstractmethod
+    async def get(self, street: str) -> GeoCacheEntry | None:
+        pass
+
+    @abstractmethod
+    async def put(self, street: str, entry: GeoCacheEntry) -> None:
+        pass
+
+
+def normalize_street(street: str) -> str:
+    """Привести улицу к ключу кэша: без лишних пробелов и без учета регистра."""
+    return " ".join(street.split()).casefold()
+
+
+class CachedGeoService(GeoServiceInterface):
+    """
+    Кэширующий декоратор гео-сервиса.
+
+    Сначала проверяется LRU кэш процесса, затем (если задано) разделяемое хранилище,
+    и только при промахе выполняется запрос к гео-сервису.
+    Неизвестные улицы кэшируются на negative_ttl, чтобы не повторять заведомо неуспешные запросы.
+    Одновременные промахи локального кэша по одной улице объединяются в один запрос к хранилищу
+    и гео-сервису (single-flight), результат или ошибка которого достается всем ожидающим.
+    Прочие ошибки не кэшируются.
+    """
+
+    def __init__(
+        self,
+        geo_service: GeoServiceInterface,
+        store: GeoCacheStore | None = None,
+        max_size: int = 10000,
+        ttl: float = 86400,
+        negative_ttl: float = 300,
+    ):
+        self._geo_service = geo_service
+        self._store = store
+        self._max_size = max_size
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._entries: OrderedDict[str, GeoCacheEntry] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Task] = {}
+
+    async def get_location(self, street: str) -> Location:
+        key = normalize_street(street)
+
+        entry = self._get_local(key)
+        if entry is None:
+            return await self._resolve_once(key, street)
+        return self._from_entry(entry, street)
+
+    async def _resolve_once(self, key: str, street: str) -> Location:
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._resolve(key, street))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            metrics.counter("geo_cache_coalesced_total").inc()
+
+        # shield: отмена одного ожидающего не отменяет общий запрос для остальных
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Помечаем ошибку полученной, даже если все ожидающие были отменены
+        if not task.cancelled():
+            task.exception()
+
+    async def _resolve(self, key: str, street: str) -> Location:
+        # Разделяемое хранилище читается внутри single-flight: одновременные промахи дают один запрос к нему
+        if self._store is not None:
+            entry = await self._get_shared(key)
+            if entry is not None:
+                return self._from_entry(entry, street)
+
+        metrics.counter("geo_cache_misses_total").inc()
+        try:
+            location = await self._geo_service.get_location(street)
+        except StreetNotFoundError:
+            await self._remember(key, GeoCacheEntry(None, time.time() + self._negative_ttl))
+            raise
+
+        await self._remember(key, GeoCacheEntry(location, time.time() + self._ttl))
+        return location
+
+    @staticmethod
+    def _from_entry(entry: GeoCacheEntry, street: str) -> Location:
+        if entry.location is None:
+            metrics.counter("geo_cache_hits_total", result="not_found").inc()
+            raise StreetNotFoundError(f"Street {street} not found")
+
+        metrics.counter("geo_cache_hits_total", result="found").inc()
+        return entry.location
+
+    def _get_local(self, key: str) -> GeoCacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.expires_at <= time.time():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def _put_local(self, key: str, entry: GeoCacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    async def _get_shared(self, key: str) -> GeoCacheEntry | None:
+        try:
+            entry = await self._store.get(key)
+        except Exception:
+            # Недоступность хранилища не должна ломать геокодирование
+            logging.exception("[GeoCache] failed to read shared cache")
+            return None
+
+        if entry is None or entry.expires_at <= time.time():
+            return None
+
+        self._put_local(key, entry)
+        return entry
+
+    async def _remember(self, key: str, entry: GeoCacheEntry) -> None:
+        self._put_local(key, entry)
+        if self._store is None:
+            return
+
+        try:
+            await self._store.put(key, entry)
+        except Exception:
+            logging.exception("[GeoCache] failed to write shared cache")
@@ -0,0 +1,4 @@
+from .geo_service import LocalTableGeoService
+from .table import GeoTable, build_geo_table
+
+__all__ = ["GeoTable", "LocalTableGeoService", "build_geo_table"]
@@ -0,0 +1,27 @@
+"""
+Сборка локальной таблицы геокодирования из CSV (колонки street, x, y):
+
+    python -m infrastructure.adapters.geo_table streets.csv geo_table.bin
+"""
+
+import argparse
+import csv
+
+from infrastructure.adapters.geo_table.table import build_geo_table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build local geocode table from CSV export")
+    parser.add_argument("csv_path", help="CSV с колонками street, x, y")
+    parser.add_argument("table_path", help="Путь к собираемому файлу таблицы")
+    args = parser.parse_args()
+
+    with open(args.csv_path, newline="", encoding="utf-8") as file:
+        rows = ((row["street"], int(row["x"]), int(row["y"])) for row in csv.DictReader(file))
+        count = build_geo_table(rows, args.table_path)
+
+    print(f"{count} streets written to {args.table_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+from core.domain.shared_kernel.location import Location
+from core.ports.geo_service_interface import GeoServiceInterface
+from infrastructure.adapters.geo_table.table import GeoTable
+from infrastructure.metrics import metrics
+
+
+class LocalTableGeoService(GeoServiceInterface):
+    """Геокодирование по локальной таблице улиц. Улицы, которых нет в таблице, определяются через fallback."""
+
+    def __init__(self, table: GeoTable, fallback: GeoServiceInterface):
+        self._table = table
+        self._fallback = fallback
+
+    async def get_location(self, street: str) -> Location:
+        location = self._table.lookup(street)
+        if location is not None:
+            metrics.counter("geo_table_lookups_total", result="hit").inc()
+            return location
+
+        metrics.counter("geo_table_lookups_total", result="miss").inc()
+        return await self._fallback.get_location(street)
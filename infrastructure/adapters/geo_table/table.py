@@ -0,0 +1,83 @@
+import hashlib
+import mmap
+import os
+import struct
+from typing import Iterable
+
+from core.domain.shared_kernel.location import Location
+from infrastructure.adapters.geo_cache import normalize_street
+
+# Формат файла: заголовок (магия, версия, число записей) и записи (хэш улицы, x, y), отсортированные по хэшу
+MAGIC = b"GEOT"
+VERSION = 1
+HEADER = struct.Struct("<4sIQ")
+RECORD = struct.Struct("<Qhh")
+
+
+def street_hash(street: str) -> int:
+    """64-битный хэш нормализованной улицы."""
+    digest = hashlib.blake2b(normalize_street(street).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def build_geo_table(rows: Iterable[tuple[str, int, int]], path: str) -> int:
+    """
+    Собрать файл таблицы из строк (улица, x, y). Повторная улица перезаписывает предыдущую.
+    Координаты проверяются при сборке, поиск по таблице их уже не валидирует.
+    Файл заменяется атомарно: процессы, уже отобразившие старую версию, продолжают читать ее.
+    """
+    records: dict[int, tuple[str, int, int]] = {}
+    for street, x, y in rows:
+        try:
+            Location.create(x, y)
+        except ValueError as error:
+            raise ValueError(f"Invalid location ({x}, {y}) for street {street}: {error}") from error
+
+        key = street_hash(street)
+        previous = records.get(key)
+        if previous is not None and normalize_street(previous[0]) != normalize_street(street):
+            raise ValueError(f"Hash collision between streets {previous[0]} and {street}")
+        records[key] = (street, x, y)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(records)))
+        for key in sorted(records):
+            _, x, y = records[key]
+            file.write(RECORD.pack(key, x, y))
+    os.replace(tmp_path, path)
+    return len(records)
+
+
+class GeoTable:
+    """Таблица улица -> координаты в файле, отображенном в память. Страницы файла общие для всех воркеров."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self._size = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a geo table of version {VERSION}")
+
+    def __len__(self) -> int:
+        return self._size
+
+    def lookup(self, street: str) -> Location | None:
+        key = street_hash(street)
+        low, high = 0, self._size
+        # Бинарный поиск по отсортированным хэшам
+        while low < high:
+            middle = (low + high) // 2
+            middle_key, x, y = RECORD.unpack_from(self._mmap, HEADER.size + middle * RECORD.size)
+            if middle_key < key:
+                low = middle + 1
+            elif middle_key > key:
+                high = middle
+            else:
+                return Location(x=x, y=y)
+        return None
+
+    def close(self) -> None:
+        self._mmap.close()
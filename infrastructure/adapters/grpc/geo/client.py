@@ -1,20 +1,53 @@
+import itertools
+
 from grpclib.client import Channel
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
 
 from core.domain.shared_kernel.location import Location
-from core.ports.geo_service_interface import GeoServiceInterface
+from core.ports.geo_service_interface import GeoServiceInterface, StreetNotFoundError
 from infrastructure.adapters.grpc.geo import Contract_pb2
 from infrastructure.adapters.grpc.geo.Contract_grpc import GeoStub
 
 
 class GRPCGeoService(GeoServiceInterface):
-    def __init__(self, host: str = "localhost", port: int = 5004):
+    """
+    Клиент Geo сервиса с пулом долгоживущих каналов.
+
+    Каналы создаются при первом вызове, подключаются лениво и переподключаются сами после разрыва.
+    Запросы распределяются по каналам round-robin, чтобы не упираться в лимит потоков одного HTTP/2 соединения.
+    """
+
+    def __init__(self, host: str = "localhost", port: int = 5004, pool_size: int = 2, timeout: float | None = 1.0):
         self._host = host
         self._port = port
+        self._pool_size = pool_size
+        self._timeout = timeout
+        self._stubs: list[GeoStub] = []
+        self._channels: list[Channel] = []
+        self._round_robin = None
+
+    def _next_stub(self) -> GeoStub:
+        if not self._stubs:
+            self._channels = [Channel(self._host, self._port) for _ in range(self._pool_size)]
+            self._stubs = [GeoStub(channel) for channel in self._channels]
+            self._round_robin = itertools.cycle(self._stubs)
+        return next(self._round_robin)
 
     async def get_location(self, street: str) -> Location:
-        async with Channel(self._host, self._port) as channel:
-            stub = GeoStub(channel)
-            request = Contract_pb2.GetGeolocationRequest(Street=street)
-            response = await stub.GetGeolocation(request)
-            loc = response.Location
-            return Location(x=loc.x, y=loc.y)
+        request = Contract_pb2.GetGeolocationRequest(Street=street)
+        try:
+            response = await self._next_stub().GetGeolocation(request, timeout=self._timeout)
+        except GRPCError as error:
+            if error.status == Status.NOT_FOUND:
+                raise StreetNotFoundError(f"Street {street} not found") from error
+            raise
+        loc = response.Location
+        return Location(x=loc.x, y=loc.y)
+
+    def close(self) -> None:
+        for channel in self._channels:
+            channel.close()
+        self._channels = []
+        self._stubs = []
+        self._round_robin = None
@@ -0,0 +1,144 @@
+import asyncio
+import time
+from collections import deque
+
+from core.domain.shared_kernel.location import Location
+from core.ports.geo_service_interface import GeoServiceInterface, StreetNotFoundError
+from infrastructure.metrics import metrics
+
+
+class CircuitOpenError(ConnectionError):
+    """Гео-сервис признан недоступным, запрос отклонен без обращения к нему."""
+
+    pass
+
+
+class CircuitBreaker:
+    """
+    Предохранитель: после failure_threshold ошибок подряд запросы отклоняются сразу.
+    Через reset_timeout пропускается один пробный запрос: успех закрывает предохранитель, ошибка - снова открывает.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 10.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_progress = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def before_call(self) -> None:
+        if self._opened_at is None:
+            return
+
+        if self._trial_in_progress or time.monotonic() - self._opened_at < self.reset_timeout:
+            metrics.counter("geo_circuit_rejected_total").inc()
+            raise CircuitOpenError("Geo service circuit is open")
+
+        self._trial_in_progress = True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_progress = False
+        metrics.gauge("geo_circuit_open").set(0)
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._trial_in_progress or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            metrics.gauge("geo_circuit_open").set(1)
+        self._trial_in_progress = False
+
+    def record_cancelled(self) -> None:
+        # Отмененный запрос ничего не говорит о состоянии сервиса, пробный запрос можно повторить
+        self._trial_in_progress = False
+
+
+class ResilientGeoService(GeoServiceInterface):
+    """
+    Обращение к гео-сервису с хеджированием и предохранителем.
+
+    Если основной запрос не ответил за время, равное quantile наблюдаемых задержек,
+    такой же запрос отправляется на hedge-эндпоинт и берется первый успешный ответ.
+    """
+
+    def __init__(
+        self,
+        primary: GeoServiceInterface,
+        hedge: GeoServiceInterface | None = None,
+        breaker: CircuitBreaker | None = None,
+        hedge_delay: float = 0.05,
+        hedge_quantile: float = 0.95,
+        latency_window: int = 256,
+    ):
+        self._primary = primary
+        self._hedge = hedge
+        self._breaker = breaker or CircuitBreaker()
+        self._initial_hedge_delay = hedge_delay
+        self._hedge_quantile = hedge_quantile
+        self._latencies: deque[float] = deque(maxlen=latency_window)
+
+    def hedge_delay(self) -> float:
+        """Задержка перед хеджирующим запросом: quantile задержек последних успешных вызовов."""
+        # Пока наблюдений мало, квантиль неустойчив
+        if len(self._latencies) < 20:
+            return self._initial_hedge_delay
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * self._hedge_quantile))]
+
+    async def get_location(self, street: str) -> Location:
+        self._breaker.before_call()
+
+        try:
+            location = await self._hedged_call(street)
+        except StreetNotFoundError:
+            # Ответ "не найдено" - штатный ответ здорового сервиса
+            self._breaker.record_success()
+            raise
+        except asyncio.CancelledError:
+            self._breaker.record_cancelled()
+            raise
+        except Exception:
+            self._breaker.record_failure()
+            raise
+
+        self._breaker.record_success()
+        return location
+
+    async def _timed_call(self, geo_service: GeoServiceInterface, street: str) -> Location:
+        started_at = time.perf_counter()
+        location = await geo_service.get_location(street)
+        self._latencies.append(time.perf_counter() - started_at)
+        return location
+
+    async def _hedged_call(self, street: str) -> Location:
+        pending = {asyncio.ensure_future(self._timed_call(self._primary, street))}
+        try:
+            if self._hedge is not None:
+                done, _ = await asyncio.wait(pending, timeout=self.hedge_delay())
+                if not done:
+                    metrics.counter("geo_hedged_requests_total").inc()
+                    pending.add(asyncio.ensure_future(self._timed_call(self._hedge, street)))
+
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+                    if isinstance(error, StreetNotFoundError):
+                        raise error
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def close(self) -> None:
+        for geo_service in (self._primary, self._hedge):
+            if geo_service is not None:
+                geo_service.close()
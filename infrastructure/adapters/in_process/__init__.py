@@ -0,0 +1,13 @@
+from .assignment_trigger import InProcessAssignmentTrigger
+from .courier_state import InMemoryCourierState
+from .demand_heatmap import DemandHeatmap
+from .location_buffer import CourierLocationBuffer
+from .position_history import CourierPositionHistory
+
+__all__ = [
+    "InProcessAssignmentTrigger",
+    "InMemoryCourierState",
+    "CourierLocationBuffer",
+    "CourierPositionHistory",
+    "DemandHeatmap",
+]
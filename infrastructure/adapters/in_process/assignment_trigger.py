@@ -0,0 +1,29 @@
+import asyncio
+
+from core.ports.assignment_trigger_interface import AssignmentTriggerInterface
+
+
+class InProcessAssignmentTrigger(AssignmentTriggerInterface):
+    """
+    Сигнал задаче назначения заказов внутри процесса.
+    Уведомления, пришедшие за время debounce, схлопываются в одно пробуждение.
+    """
+
+    def __init__(self, debounce: float = 0.01):
+        self.debounce = debounce
+        self._event = asyncio.Event()
+
+    def notify(self) -> None:
+        self._event.set()
+
+    async def wait(self, timeout: float) -> bool:
+        """Ждать уведомления не дольше timeout. Возвращает True, если было уведомление."""
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+
+        # Даем закоммититься остальным заказам пачки и схлопываем их уведомления в один запуск
+        await asyncio.sleep(self.debounce)
+        self._event.clear()
+        return True
@@ -0,0 +1,247 @@
+import asyncio
+import logging
+from array import array
+from collections import deque
+from datetime import datetime, timezone
+from typing import Callable
+from uuid import UUID
+
+from core.domain.model.courier_aggregate.courier_aggregate import Courier
+from core.domain.model.order_aggregate.order_aggregate import Order
+from core.domain.shared_kernel.location import Location
+from core.ports.courier_position_history_interface import CourierPositionHistoryInterface
+from core.ports.courier_state_interface import CourierStateInterface
+from core.ports.unit_of_work import UnitOfWork
+from infrastructure.metrics import metrics
+
+
+class InMemoryCourierState(CourierStateInterface):
+    """
+    Авторитетное состояние перемещения курьеров внутри процесса.
+
+    Позиции, цели и скорости курьеров хранятся в компактных массивах и сдвигаются каждый тик в памяти,
+    без чтения из базы. Измененные позиции сохраняются отложенно (flush) одним запросом на пачку,
+    несколько тиков одного курьера схлопываются в одну запись. Доставка заказа фиксируется сразу
+    и транзакционно вместе с позицией курьера.
+
+    Позиции свободных курьеров в базе всегда актуальны: при доставке позиция записывается в той же транзакции,
+    а перемещение свободных курьеров к спросу пишет позиции в базу сразу. Поэтому назначение заказов читает
+    курьеров из базы, а отставание на интервал flush видно только в позициях занятых курьеров.
+
+    Назначения приходят через track_assignment и периодический load(), который добирает заказы,
+    назначенные в других процессах. Состоянием должен владеть один процесс.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], UnitOfWork],
+        position_history: CourierPositionHistoryInterface | None = None,
+    ):
+        self.uow_factory = uow_factory
+        self.position_history = position_history
+        # Все операции с базой выполняются по очереди, чтобы flush не перезаписал позицию доставки
+        self._lock = asyncio.Lock()
+        self.reset()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    def reset(self) -> None:
+        """Забыть состояние, например при потере лидерства."""
+        self._loaded = False
+        self._slots: dict[UUID, int] = {}
+        self._courier_ids: list[UUID] = []
+        self._x = array("h")
+        self._y = array("h")
+        self._target_x = array("h")
+        self._target_y = array("h")
+        self._speed = array("i")
+        # Текущий заказ курьера, None - курьер свободен
+        self._order_ids: list[UUID | None] = []
+        # Следующие заказы курьера с несколькими местами хранения
+        self._queued: dict[int, deque[tuple[UUID, int, int]]] = {}
+        self._tracked_orders: set[UUID] = set()
+        self._dirty: set[int] = set()
+        # Заказы, которые курьер не смог доставить: в базе они остаются назначенными, но load() их не подхватывает,
+        # иначе доставка повторялась бы на каждой сверке. Требуют разбора вручную
+        self._stuck_orders: set[UUID] = set()
+
+    def track_assignment(self, courier: Courier, order: Order) -> None:
+        if order.id in self._tracked_orders:
+            return
+        self._tracked_orders.add(order.id)
+
+        slot = self._slots.get(courier.id)
+        if slot is None:
+            slot = self._add_slot(courier)
+        elif self._order_ids[slot] is None:
+            # Позиция свободного курьера в базе актуальна
+            self._x[slot], self._y[slot] = courier.location.x, courier.location.y
+
+        if self._order_ids[slot] is None:
+            self._set_target(slot, order.id, order.location.x, order.location.y)
+        else:
+            self._queued.setdefault(slot, deque()).append((order.id, order.location.x, order.location.y))
+
+    async def load(self) -> None:
+        """Добрать назначенные заказы из базы. Позиции уже отслеживаемых курьеров не перечитываются."""
+        async with self._lock:
+            known_orders = set(self._tracked_orders)
+            async with self.uow_factory() as uow:
+                orders = await uow.order_repository.get_all_assigned_orders()
+                new_courier_ids = {o.courier_id for o in orders if o.courier_id and o.courier_id not in self._slots}
+                couriers = {c.id: c for c in await uow.courier_repository.get_couriers(list(new_courier_ids))}
+
+            assigned_ids = {order.id for order in orders}
+            # Заказ, снятый с курьера вне процесса, больше не считается зависшим
+            self._stuck_orders &= assigned_ids
+            for order_id in known_orders - assigned_ids:
+                # Заказ больше не назначен: его завершили или переназначили вне этого процесса
+                self._untrack(order_id)
+
+            for order in orders:
+                if order.courier_id is None or order.id in self._tracked_orders or order.id in self._stuck_orders:
+                    continue
+                slot = self._slots.get(order.courier_id)
+                courier = couriers.get(order.courier_id) if slot is None else self._courier_at(slot)
+                if courier is None:
+                    logging.info(f"Courier {order.courier_id} not found")
+                    continue
+                self.track_assignment(courier, order)
+
+            self._loaded = True
+        metrics.gauge("courier_state_couriers").set(len(self._courier_ids))
+        metrics.gauge("courier_state_stuck_orders").set(len(self._stuck_orders))
+
+    async def tick(self) -> int:
+        """Сдвинуть курьеров с заказами на один шаг. Возвращает количество перемещенных курьеров."""
+        x, y, target_x, target_y, speed = self._x, self._y, self._target_x, self._target_y, self._speed
+        moved = 0
+        arrived = []
+        recorded_at = datetime.now(timezone.utc)
+        for slot, order_id in enumerate(self._order_ids):
+            if order_id is None:
+                continue
+
+            # То же правило, что Courier.move_towards: сначала по x, остаток хода - по y
+            cruising_range = speed[slot]
+            move_x = max(-cruising_range, min(target_x[slot] - x[slot], cruising_range))
+            cruising_range -= abs(move_x)
+            move_y = max(-cruising_range, min(target_y[slot] - y[slot], cruising_range))
+            if move_x or move_y:
+                x[slot] += move_x
+                y[slot] += move_y
+                self._dirty.add(slot)
+                if self.position_history is not None:
+                    self.position_history.record(
+                        self._courier_ids[slot], Location.model_construct(x=x[slot], y=y[slot]), recorded_at
+                    )
+
+            if x[slot] == target_x[slot] and y[slot] == target_y[slot]:
+                arrived.append(slot)
+            moved += 1
+
+        if arrived:
+            await self._complete_orders(arrived)
+        metrics.gauge("courier_state_dirty").set(len(self._dirty))
+        return moved
+
+    async def flush(self) -> int:
+        """Сохранить измененные позиции одним запросом. Возвращает количество записанных курьеров."""
+        async with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            if not dirty:
+                return 0
+
+            locations = {self._courier_ids[slot]: Location(x=self._x[slot], y=self._y[slot]) for slot in dirty}
+            try:
+                async with self.uow_factory() as uow:
+                    await uow.courier_repository.update_locations(locations)
+            except Exception:
+                self._dirty |= dirty
+                raise
+
+        metrics.counter("courier_state_flushed_total").inc(len(locations))
+        return len(locations)
+
+    async def _complete_orders(self, slots: list[int]) -> None:
+        """Доставить заказы прибывших курьеров в одной транзакции. При ошибке доставка повторится на следующем тике."""
+        async with self._lock:
+            completed = []
+            async with self.uow_factory() as uow:
+                for slot in slots:
+                    order_id = self._order_ids[slot]
+                    if order_id is None or not self._at_target(slot):
+                        # Пока ждали блокировку, load() снял заказ с курьера
+                        continue
+
+                    courier = await uow.courier_repository.get_courier(self._courier_ids[slot])
+                    order = await uow.order_repository.get_order(order_id)
+                    if courier is None or order is None:
+                        logging.info(f"Order {order_id} or its courier not found")
+                        completed.append(slot)
+                        continue
+
+                    courier.location = Location(x=self._x[slot], y=self._y[slot])
+                    try:
+                        courier.complete_order(order)
+                    except ValueError:
+                        logging.exception(f"Courier {courier.id} cant complete order {order_id}, order is skipped")
+                        self._stuck_orders.add(order_id)
+                        metrics.gauge("courier_state_stuck_orders").set(len(self._stuck_orders))
+                        completed.append(slot)
+                        continue
+
+                    await uow.order_repository.update_order(order)
+                    await uow.courier_repository.update_courier(courier)
+                    completed.append(slot)
+                    logging.info(f"Courier {courier.id} completed order {order_id}")
+
+            for slot in completed:
+                # Позиция записана вместе с доставкой
+                self._dirty.discard(slot)
+                self._tracked_orders.discard(self._order_ids[slot])
+                self._next_order(slot)
+
+    def _add_slot(self, courier: Courier) -> int:
+        slot = len(self._courier_ids)
+        self._slots[courier.id] = slot
+        self._courier_ids.append(courier.id)
+        self._x.append(courier.location.x)
+        self._y.append(courier.location.y)
+        self._target_x.append(0)
+        self._target_y.append(0)
+        self._speed.append(courier.speed)
+        self._order_ids.append(None)
+        return slot
+
+    def _courier_at(self, slot: int) -> Courier:
+        return Courier.model_construct(
+            id=self._courier_ids[slot],
+            speed=self._speed[slot],
+            location=Location(x=self._x[slot], y=self._y[slot]),
+        )
+
+    def _at_target(self, slot: int) -> bool:
+        return self._x[slot] == self._target_x[slot] and self._y[slot] == self._target_y[slot]
+
+    def _set_target(self, slot: int, order_id: UUID, x: int, y: int) -> None:
+        self._order_ids[slot] = order_id
+        self._target_x[slot], self._target_y[slot] = x, y
+
+    def _next_order(self, slot: int) -> None:
+        queued = self._queued.get(slot)
+        if queued:
+            self._set_target(slot, *queued.popleft())
+        else:
+            self._queued.pop(slot, None)
+            self._order_ids[slot] = None
+
+    def _untrack(self, order_id: UUID) -> None:
+        self._tracked_orders.discard(order_id)
+        for slot, queued in list(self._queued.items()):
+            self._queued[slot] = deque(item for item in queued if item[0] != order_id)
+        for slot, current in enumerate(self._order_ids):
+            if current == order_id:
+                self._next_order(slot)
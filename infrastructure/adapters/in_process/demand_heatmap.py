@@ -0,0 +1,112 @@
+import asyncio
+import time
+from array import array
+from datetime import datetime, timedelta, timezone
+
+from core.domain.shared_kernel.location import Location
+from core.ports.demand_heatmap_interface import DemandHeatmapInterface
+from infrastructure.adapters.postgres.demand_heatmap_store import PostgresDemandHeatmapStore
+from infrastructure.adapters.postgres.projections import HEATMAP_CELLS, HEATMAP_KINDS, cell_location
+from infrastructure.metrics import metrics
+
+EPOCH = datetime(1970, 1, 1)
+# Корзину UoW выбирает до фиксации, поэтому транзакция может зафиксироваться в уже синхронизированной минуте
+# позже чтения: несколько последних минут перечитываются при каждом обновлении
+REFRESH_GRACE_MINUTES = 2
+
+
+def to_minute(bucket: datetime) -> int:
+    """Номер минуты от начала эпохи для корзины demand_heatmap (UTC без часового пояса)."""
+    return (bucket - EPOCH) // timedelta(minutes=1)
+
+
+def from_minute(minute: int) -> datetime:
+    return EPOCH + timedelta(minutes=minute)
+
+
+class DemandHeatmap(DemandHeatmapInterface):
+    """
+    Тепловая карта спроса в памяти процесса: кольцо из buckets минутных корзин,
+    в каждой по HEATMAP_CELLS счетчиков на каждый вид перехода заказа, все в одном массиве.
+
+    Корзины копит UoW в demand_heatmap. Обновление дочитывает новые корзины и перечитывает последние
+    REFRESH_GRACE_MINUTES синхронизированных минут, таблица заказов не читается никогда.
+    Данные отстают не больше чем на refresh_interval.
+    """
+
+    def __init__(self, store: PostgresDemandHeatmapStore, buckets: int = 60, refresh_interval: float = 5.0):
+        self.store = store
+        self.buckets = buckets
+        self.refresh_interval = refresh_interval
+        # Корзина slot: counts[(slot * len(HEATMAP_KINDS) + kind) * HEATMAP_CELLS + cell]
+        self._counts = array("I", bytes(4 * buckets * len(HEATMAP_KINDS) * HEATMAP_CELLS))
+        # Минута, которая сейчас лежит в корзине, -1 - пустая корзина
+        self._minutes = array("q", [-1]) * buckets
+        self._synced_minute: int | None = None
+        self._refreshed_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def grid(self, kind: str, window_minutes: int) -> list[int]:
+        await self.ensure_fresh()
+        return self.window(kind, window_minutes, self._current_minute())
+
+    async def hotspots(self, window_minutes: int, limit: int) -> list[tuple[Location, int]]:
+        created = await self.grid("created", window_minutes)
+        cells = sorted((cell for cell in range(HEATMAP_CELLS) if created[cell]), key=lambda c: -created[c])
+        return [(cell_location(cell), created[cell]) for cell in cells[:limit]]
+
+    async def ensure_fresh(self) -> None:
+        if self._refreshed_at is not None and time.monotonic() - self._refreshed_at < self.refresh_interval:
+            return
+        async with self._lock:
+            if self._refreshed_at is None or time.monotonic() - self._refreshed_at >= self.refresh_interval:
+                await self.refresh(self._current_minute())
+                self._refreshed_at = time.monotonic()
+
+    async def refresh(self, now_minute: int) -> int:
+        """Дочитать корзины с последней синхронизированной минуты. Возвращает количество прочитанных строк."""
+        since = now_minute - self.buckets + 1
+        if self._synced_minute is not None:
+            # Последние синхронизированные минуты могли пополниться после чтения
+            since = max(since, self._synced_minute - REFRESH_GRACE_MINUTES)
+
+        rows = await self.store.read_since(from_minute(since))
+        for bucket, cell, *values in rows:
+            minute = to_minute(bucket)
+            if minute > now_minute:
+                continue
+            slot = self._slot(minute)
+            for kind, value in enumerate(values):
+                self._counts[(slot * len(HEATMAP_KINDS) + kind) * HEATMAP_CELLS + cell] = value
+
+        self._synced_minute = now_minute
+        metrics.counter("demand_heatmap_rows_read_total").inc(len(rows))
+        return len(rows)
+
+    def window(self, kind: str, window_minutes: int, now_minute: int) -> list[int]:
+        """Сумма корзин за последние window_minutes минут по клеткам."""
+        if not 0 < window_minutes <= self.buckets:
+            raise ValueError(f"window_minutes must be between 1 and {self.buckets}")
+
+        kind_index = HEATMAP_KINDS.index(kind)
+        totals = [0] * HEATMAP_CELLS
+        for minute in range(now_minute - window_minutes + 1, now_minute + 1):
+            slot = minute % self.buckets
+            if self._minutes[slot] != minute:
+                continue
+            offset = (slot * len(HEATMAP_KINDS) + kind_index) * HEATMAP_CELLS
+            totals = [total + count for total, count in zip(totals, self._counts[offset : offset + HEATMAP_CELLS])]
+        return totals
+
+    def _slot(self, minute: int) -> int:
+        slot = minute % self.buckets
+        if self._minutes[slot] != minute:
+            # Корзина занята минутой, вышедшей из окна
+            size = len(HEATMAP_KINDS) * HEATMAP_CELLS
+            self._counts[slot * size : (slot + 1) * size] = array("I", bytes(4 * size))
+            self._minutes[slot] = minute
+        return slot
+
+    @staticmethod
+    def _current_minute() -> int:
+        return to_minute(datetime.now(timezone.utc).replace(tzinfo=None))
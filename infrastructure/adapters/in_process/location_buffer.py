@@ -0,0 +1,69 @@
+import asyncio
+from datetime import datetime
+from typing import Callable
+from uuid import UUID
+
+from core.domain.shared_kernel.location import Location
+from core.ports.courier_location_buffer_interface import CourierLocationBufferInterface
+from core.ports.unit_of_work import UnitOfWork
+from infrastructure.metrics import metrics
+
+
+class CourierLocationBuffer(CourierLocationBufferInterface):
+    """
+    Буфер телеметрии курьеров внутри процесса.
+
+    Хранит только последнюю по ts позицию каждого курьера, flush() записывает буфер одним UPDATE,
+    поэтому частота записи в базу не зависит от частоты пингов. Позиции старее уже записанных отбрасываются.
+    Порядок между процессами не гарантируется: пинги одного курьера должны приходить в один процесс
+    (ключ сообщения Kafka - courier_id).
+    """
+
+    def __init__(self, uow_factory: Callable[[], UnitOfWork]):
+        self.uow_factory = uow_factory
+        self._latest: dict[UUID, tuple[Location, datetime]] = {}
+        # Пачка, которая сейчас записывается
+        self._in_flight: dict[UUID, tuple[Location, datetime]] = {}
+        self._flushed_ts: dict[UUID, datetime] = {}
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._latest)
+
+    def add(self, courier_id: UUID, location: Location, ts: datetime) -> bool:
+        metrics.counter("courier_locations_received_total").inc()
+        buffered = self._latest.get(courier_id) or self._in_flight.get(courier_id)
+        newest_ts = buffered[1] if buffered else self._flushed_ts.get(courier_id)
+        if newest_ts is not None and ts <= newest_ts:
+            metrics.counter("courier_locations_dropped_total").inc()
+            return False
+
+        self._latest[courier_id] = (location, ts)
+        return True
+
+    async def flush(self) -> int:
+        """Записать накопленные позиции. Возвращает количество обновленных курьеров."""
+        async with self._lock:
+            batch, self._latest = self._latest, {}
+            if not batch:
+                return 0
+
+            self._in_flight = batch
+            try:
+                async with self.uow_factory() as uow:
+                    await uow.courier_repository.update_locations(
+                        {courier_id: location for courier_id, (location, _) in batch.items()}
+                    )
+            except Exception:
+                # Возвращаем пачку в буфер, не затирая пришедшие за время записи позиции
+                self._latest = batch | self._latest
+                raise
+            finally:
+                self._in_flight = {}
+
+            for courier_id, (_, ts) in batch.items():
+                self._flushed_ts[courier_id] = ts
+
+        metrics.counter("courier_locations_flushed_total").inc(len(batch))
+        metrics.gauge("courier_locations_buffered").set(len(self._latest))
+        return len(batch)
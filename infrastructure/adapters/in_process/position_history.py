@@ -0,0 +1,53 @@
+import logging
+from datetime import datetime, timezone
+from uuid import UUID
+
+from core.domain.shared_kernel.location import Location
+from core.ports.courier_position_history_interface import CourierPositionHistoryInterface
+from infrastructure.adapters.postgres.courier_position_store import PostgresCourierPositionStore
+from infrastructure.metrics import metrics
+
+
+class CourierPositionHistory(CourierPositionHistoryInterface):
+    """
+    Буфер истории позиций курьеров. record() только дописывает в память, flush() сохраняет буфер
+    пачкой в courier_positions, вне транзакций перемещения курьеров.
+    При недоступной базе буфер ограничен max_buffer позициями, самые старые отбрасываются.
+    """
+
+    def __init__(self, store: PostgresCourierPositionStore, max_buffer: int = 100_000):
+        self.store = store
+        self.max_buffer = max_buffer
+        self._rows: list[tuple[UUID, int, int, datetime]] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def record(self, courier_id: UUID, location: Location, recorded_at: datetime) -> None:
+        # В базе время хранится в UTC без часового пояса, как в остальных таблицах
+        if recorded_at.tzinfo is not None:
+            recorded_at = recorded_at.astimezone(timezone.utc).replace(tzinfo=None)
+        self._rows.append((courier_id, location.x, location.y, recorded_at))
+
+    async def flush(self) -> int:
+        """Сохранить накопленные позиции. Возвращает количество записанных позиций."""
+        rows, self._rows = self._rows, []
+        if not rows:
+            return 0
+
+        try:
+            await self.store.append(rows)
+        except Exception:
+            self._rows = rows + self._rows
+            self._trim()
+            raise
+
+        metrics.counter("courier_positions_recorded_total").inc(len(rows))
+        return len(rows)
+
+    def _trim(self) -> None:
+        overflow = len(self._rows) - self.max_buffer
+        if overflow > 0:
+            logging.warning(f"[CourierPositions] buffer is full, {overflow} positions dropped")
+            metrics.counter("courier_positions_dropped_total").inc(overflow)
+            del self._rows[:overflow]
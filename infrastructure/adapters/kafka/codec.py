@@ -0,0 +1,30 @@
+from typing import Sequence
+
+from core.domain.events.base import BaseDomainEvent
+
+JSON_CONTENT_TYPE = "application/json"
+PROTOBUF_CONTENT_TYPE = "application/x-protobuf"
+
+CONTENT_TYPE_HEADER = "content-type"
+
+
+def get_content_type(headers: Sequence[tuple[str, bytes]] | None, default: str) -> str:
+    """Получить тип содержимого сообщения из заголовков Kafka."""
+    for name, value in headers or ():
+        if name.lower() == CONTENT_TYPE_HEADER and value:
+            return value.decode("utf-8").split(";")[0].strip()
+    return default
+
+
+def encode_integration_event(event: BaseDomainEvent, content_type: str) -> bytes:
+    """Сериализовать интеграционное событие в заданном формате."""
+    if content_type == JSON_CONTENT_TYPE:
+        return event.model_dump_json().encode("utf-8")
+
+    if content_type == PROTOBUF_CONTENT_TYPE:
+        to_protobuf = getattr(event, "to_protobuf", None)
+        if to_protobuf is None:
+            raise ValueError(f"No protobuf contract for event {event.get_event_type()}")
+        return to_protobuf().SerializeToString()
+
+    raise ValueError(f"Unsupported content type {content_type}")
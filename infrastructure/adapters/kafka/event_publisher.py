@@ -1,12 +1,24 @@
+import asyncio
+import logging
+
 from aiokafka import AIOKafkaProducer
+from aiokafka.codec import has_gzip, has_lz4, has_snappy, has_zstd
 
 from core.domain.events.base import BaseDomainEvent
 from core.ports.event_publisher_interface import EventPublisherInterface
+from infrastructure.adapters.kafka.codec import CONTENT_TYPE_HEADER, encode_integration_event
 from infrastructure.config.settings import get_settings
 from infrastructure.events.integration_event_registry import event_registry
 
 settings = get_settings()
 
+COMPRESSION_CODECS = {
+    "gzip": has_gzip,
+    "snappy": has_snappy,
+    "lz4": has_lz4,
+    "zstd": has_zstd,
+}
+
 
 class KafkaEventPublisher(EventPublisherInterface):
     requires_commit_after_publish = False
@@ -15,6 +27,7 @@ class KafkaEventPublisher(EventPublisherInterface):
         self.kafka_producer = kafka_producer
 
     async def publish(self, events: list[BaseDomainEvent]):
+        deliveries = []
         for event in events:
             event_name = event.get_event_type()
             integration_event = event_registry.get(event_name)
@@ -24,10 +37,29 @@ class KafkaEventPublisher(EventPublisherInterface):
             integration_event_model, topic = integration_event["model"], integration_event["topic"]
             integration_event_data = integration_event_model.model_validate(event, from_attributes=True)
 
-            await self.kafka_producer.send(topic, integration_event_data.model_dump_json().encode("utf-8"))
+            key = None
+            if integration_event["key"]:
+                key = str(getattr(integration_event_data, integration_event["key"])).encode("utf-8")
+
+            content_type = integration_event["content_type"]
+            value = encode_integration_event(integration_event_data, content_type)
+
+            # send только кладет сообщение в батч продюсера, поэтому пачка событий уходит вместе
+            delivery = await self.kafka_producer.send(
+                topic, value, key=key, headers=[(CONTENT_TYPE_HEADER, content_type.encode("utf-8"))]
+            )
+            deliveries.append(delivery)
+
+        # Ждем подтверждения брокера для всей пачки
+        await asyncio.gather(*deliveries)
 
 
 def get_kafka_producer():
-    return AIOKafkaProducer(
-        bootstrap_servers="localhost:9092",
-    )
+    producer_config = settings.kafka.get_producer_config()
+
+    compression_type = producer_config["compression_type"]
+    if compression_type and not COMPRESSION_CODECS.get(compression_type, lambda: False)():
+        logging.warning(f"Compression library for {compression_type} not found, falling back to gzip")
+        producer_config["compression_type"] = "gzip"
+
+    return AIOKafkaProducer(**producer_config)
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: infrastructure/adapters/kafka/order_status_changed/Contract.proto
+# Protobuf Python Version: 6.31.0
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    0,
+    '',
+    'infrastructure/adapters/kafka/order_status_changed/Contract.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nAinfrastructure/adapters/kafka/order_status_changed/Contract.proto\x12\x12OrderStatusChanged\"k\n\"OrderStatusChangedIntegrationEvent\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12\x34\n\x0borderStatus\x18\x02 \x01(\x0e\x32\x1f.OrderStatusChanged.OrderStatus*|\n\x0bOrderStatus\x12\x1c\n\x18ORDER_STATUS_UNSPECIFIED\x10\x00\x12\x18\n\x14ORDER_STATUS_CREATED\x10\x01\x12\x19\n\x15ORDER_STATUS_ASSIGNED\x10\x02\x12\x1a\n\x16ORDER_STATUS_COMPLETED\x10\x03\x42\x1dZ\x1bqueues/orderstatuschangedpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'infrastructure.adapters.kafka.order_status_changed.Contract_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z\033queues/orderstatuschangedpb'
+  _globals['_ORDERSTATUS']._serialized_start=198
+  _globals['_ORDERSTATUS']._serialized_end=322
+  _globals['_ORDERSTATUSCHANGEDINTEGRATIONEVENT']._serialized_start=89
+  _globals['_ORDERSTATUSCHANGEDINTEGRATIONEVENT']._serialized_end=196
+# @@protoc_insertion_point(module_scope)
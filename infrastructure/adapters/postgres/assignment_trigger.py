@@ -0,0 +1,68 @@
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from core.ports.assignment_trigger_interface import AssignmentTriggerInterface
+from infrastructure.adapters.in_process import InProcessAssignmentTrigger
+
+# Канал, в который пишет триггер orders_created_notify при фиксации вставки в orders
+ORDERS_CREATED_CHANNEL = "orders_created"
+
+
+class PostgresAssignmentTrigger(AssignmentTriggerInterface):
+    """
+    Сигнал задаче назначения заказов, в том числе из других процессов.
+
+    Вставка заказов шлет NOTIFY orders_created при фиксации (триггер в базе), поэтому заказы,
+    созданные процессами API, будят назначение в dispatcher_worker. Процесс, который ждет сигнала,
+    слушает канал на выделенном соединении: оно открывается при первом ожидании и переоткрывается после обрыва.
+    Уведомления внутри процесса доставляются сразу, без базы.
+    """
+
+    def __init__(self, engine: AsyncEngine, debounce: float = 0.01):
+        self._engine = engine
+        self._local = InProcessAssignmentTrigger(debounce=debounce)
+        self._connection: AsyncConnection | None = None
+        self._driver_connection = None
+
+    def notify(self) -> None:
+        self._local.notify()
+
+    async def wait(self, timeout: float) -> bool:
+        await self._listen()
+        return await self._local.wait(timeout)
+
+    async def close(self) -> None:
+        if self._connection is None:
+            return
+        # Соединение со слушателем не возвращается в пул
+        connection, self._connection, self._driver_connection = self._connection, None, None
+        try:
+            await connection.invalidate()
+        except Exception:
+            logging.exception("[AssignmentTrigger] failed to close connection")
+
+    async def _listen(self) -> None:
+        if self._driver_connection is not None and not self._driver_connection.is_closed():
+            return
+        if self._connection is not None:
+            logging.warning("[AssignmentTrigger] lost listen connection, reconnecting")
+            await self.close()
+
+        connection = None
+        try:
+            connection = await self._engine.connect()
+            await connection.execution_options(isolation_level="AUTOCOMMIT")
+            driver_connection = (await connection.get_raw_connection()).driver_connection
+            await driver_connection.add_listener(ORDERS_CREATED_CHANNEL, self._on_notification)
+        except Exception:
+            # До следующей попытки назначение работает по интервалу
+            logging.exception(f"[AssignmentTrigger] failed to listen on {ORDERS_CREATED_CHANNEL}")
+            if connection is not None:
+                await connection.invalidate()
+            return
+
+        self._connection, self._driver_connection = connection, driver_connection
+
+    def _on_notification(self, connection, pid: int, channel: str, payload: str) -> None:
+        self._local.notify()
@@ -0,0 +1,110 @@
+import logging
+import re
+from datetime import date, datetime, time, timedelta
+from typing import AsyncContextManager, Callable
+from uuid import UUID
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.adapters.postgres.models.courier_position import CourierPositionModel
+
+PARTITION_NAME_RE = re.compile(r"^courier_positions_p(\d{8})$")
+
+
+def partition_name(day: date) -> str:
+    return f"courier_positions_p{day:%Y%m%d}"
+
+
+class PostgresCourierPositionStore:
+    """
+    Запись истории позиций курьеров и обслуживание дневных секций courier_positions.
+    Работает в собственных коротких сессиях, вне UoW: запись истории не входит в транзакции перемещения.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncContextManager[AsyncSession]]):
+        self._session_factory = session_factory
+
+    async def append(self, rows: list[tuple[UUID, int, int, datetime]]) -> None:
+        """Дописать позиции (courier_id, x, y, recorded_at) многострочными INSERT."""
+        if not rows:
+            return
+
+        values = [{"courier_id": c, "x": x, "y": y, "recorded_at": recorded_at} for c, x, y, recorded_at in rows]
+        async with self._session_factory() as session:
+            await session.execute(insert(CourierPositionModel), values)
+            await session.commit()
+
+    async def ensure_partitions(self, today: date, days_ahead: int) -> list[str]:
+        """Создать дневные секции с today по today + days_ahead. Возвращает имена созданных секций."""
+        created = []
+        async with self._session_factory() as session:
+            existing = await self._partitions(session)
+            for offset in range(days_ahead + 1):
+                day = today + timedelta(days=offset)
+                name = partition_name(day)
+                if name in existing:
+                    continue
+                try:
+                    async with session.begin_nested():
+                        await self._create_partition(session, day)
+                except Exception:
+                    logging.exception(f"[CourierPositions] failed to create partition {name}")
+                    continue
+                created.append(name)
+            await session.commit()
+        return created
+
+    @staticmethod
+    async def _create_partition(session: AsyncSession, day: date) -> None:
+        # Строки за этот день, попавшие в секцию по умолчанию до создания секции, мешают ее создать:
+        # переносим их во временную таблицу и возвращаем уже в новую секцию
+        bounds = {"since": datetime.combine(day, time()), "until": datetime.combine(day + timedelta(days=1), time())}
+        await session.execute(text("CREATE TEMP TABLE courier_positions_moved (LIKE courier_positions)"))
+        await session.execute(
+            text(
+                "WITH moved AS (DELETE FROM courier_positions_default "
+                "WHERE recorded_at >= :since AND recorded_at < :until RETURNING *) "
+                "INSERT INTO courier_positions_moved SELECT * FROM moved"
+            ),
+            bounds,
+        )
+        await session.execute(
+            text(
+                f"CREATE TABLE {partition_name(day)} PARTITION OF courier_positions "
+                f"FOR VALUES FROM ('{day.isoformat()}') TO ('{(day + timedelta(days=1)).isoformat()}')"
+            )
+        )
+        await session.execute(text("INSERT INTO courier_positions SELECT * FROM courier_positions_moved"))
+        await session.execute(text("DROP TABLE courier_positions_moved"))
+
+    async def drop_partitions_before(self, day: date) -> list[str]:
+        """Удалить дневные секции за дни раньше day. Возвращает имена удаленных секций."""
+        dropped = []
+        async with self._session_factory() as session:
+            for name in sorted(await self._partitions(session)):
+                match = PARTITION_NAME_RE.match(name)
+                if match and datetime.strptime(match.group(1), "%Y%m%d").date() < day:
+                    await session.execute(text(f"DROP TABLE {name}"))
+                    dropped.append(name)
+            await session.commit()
+        return dropped
+
+    async def delete_default_before(self, day: date) -> int:
+        """Удалить из секции по умолчанию строки за дни раньше day. Возвращает количество удаленных строк."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                text("DELETE FROM courier_positions_default WHERE recorded_at < :until"),
+                {"until": datetime.combine(day, time())},
+            )
+            await session.commit()
+        return result.rowcount
+
+    async def _partitions(self, session: AsyncSession) -> set[str]:
+        result = await session.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'courier_positions'::regclass"
+            )
+        )
+        return set(result.scalars().all())
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import AsyncContextManager, Callable
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.adapters.postgres.models.projections import DemandHeatmapModel
+
+
+class PostgresDemandHeatmapStore:
+    """Чтение минутных корзин demand_heatmap и удаление устаревших. Корзины пишет UoW при фиксации."""
+
+    def __init__(self, session_factory: Callable[[], AsyncContextManager[AsyncSession]]):
+        self._session_factory = session_factory
+
+    async def read_since(self, bucket: datetime) -> list[tuple[datetime, int, int, int, int]]:
+        """Корзины (bucket, cell, created, assigned, completed) начиная с минуты bucket, слоты корзины просуммированы."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(
+                    DemandHeatmapModel.bucket,
+                    DemandHeatmapModel.cell,
+                    func.sum(DemandHeatmapModel.created),
+                    func.sum(DemandHeatmapModel.assigned),
+                    func.sum(DemandHeatmapModel.completed),
+                )
+                .where(DemandHeatmapModel.bucket >= bucket)
+                .group_by(DemandHeatmapModel.bucket, DemandHeatmapModel.cell)
+            )
+            return [tuple(row) for row in result.all()]
+
+    async def delete_before(self, bucket: datetime) -> int:
+        """Удалить корзины раньше минуты bucket. Возвращает количество удаленных строк."""
+        async with self._session_factory() as session:
+            result = await session.execute(delete(DemandHeatmapModel).where(DemandHeatmapModel.bucket < bucket))
+            await session.commit()
+            return result.rowcount
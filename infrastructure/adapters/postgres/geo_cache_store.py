@@ -0,0 +1,43 @@
+from datetime import datetime, timezone
+from typing import AsyncContextManager, Callable
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.domain.shared_kernel.location import Location
+from infrastructure.adapters.geo_cache import GeoCacheEntry, GeoCacheStore
+from infrastructure.adapters.postgres.models.geo_cache import GeoCacheModel
+
+
+class PostgresGeoCacheStore(GeoCacheStore):
+    """Кэш геокодирования в таблице geo_cache. Работает в собственной короткой сессии, вне UoW."""
+
+    def __init__(self, session_factory: Callable[[], AsyncContextManager[AsyncSession]]):
+        self._session_factory = session_factory
+
+    async def get(self, street: str) -> GeoCacheEntry | None:
+        async with self._session_factory() as session:
+            model = (
+                await session.execute(select(GeoCacheModel).where(GeoCacheModel.street == street))
+            ).scalar_one_or_none()
+
+        if model is None:
+            return None
+
+        location = Location(x=model.x, y=model.y) if model.x is not None else None
+        return GeoCacheEntry(location, model.expires_at.replace(tzinfo=timezone.utc).timestamp())
+
+    async def put(self, street: str, entry: GeoCacheEntry) -> None:
+        values = {
+            "street": street,
+            "x": entry.location.x if entry.location else None,
+            "y": entry.location.y if entry.location else None,
+            "expires_at": datetime.fromtimestamp(entry.expires_at, tz=timezone.utc).replace(tzinfo=None),
+        }
+        stmt = pg_insert(GeoCacheModel).values(**values)
+        stmt = stmt.on_conflict_do_update(index_elements=[GeoCacheModel.street], set_=values)
+
+        async with self._session_factory() as session:
+            await session.execute(stmt)
+            await session.commit()
@@ -0,0 +1,82 @@
+import hashlib
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+
+def advisory_lock_key(name: str) -> int:
+    """Ключ advisory lock (signed bigint) по имени."""
+    return int.from_bytes(hashlib.blake2b(name.encode("utf-8"), digest_size=8).digest(), "big", signed=True)
+
+
+class AdvisoryLockLeaderElection:
+    """
+    Выбор лидера через pg_try_advisory_lock.
+
+    Лидер держит сессионную блокировку на выделенном соединении. Если процесс или соединение
+    падает, Postgres снимает блокировку сам, и лидером становится следующая реплика, вызвавшая is_leader().
+    """
+
+    def __init__(self, engine: AsyncEngine, name: str):
+        self.name = name
+        self._engine = engine
+        self._key = advisory_lock_key(name)
+        self._connection: AsyncConnection | None = None
+
+    @property
+    def holds_lock(self) -> bool:
+        """Блокировка была получена и еще не потеряна (по последней проверке)."""
+        return self._connection is not None
+
+    async def is_leader(self) -> bool:
+        if self._connection is not None:
+            if await self._is_alive():
+                return True
+            logging.warning(f"[LeaderElection] lost leadership for {self.name}")
+            await self._drop_connection()
+
+        return await self._try_acquire()
+
+    async def release(self) -> None:
+        if self._connection is None:
+            return
+        try:
+            await self._connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self._key})
+        finally:
+            await self._drop_connection()
+
+    async def _try_acquire(self) -> bool:
+        # AUTOCOMMIT: соединение лидера не держит открытую транзакцию
+        connection = await self._engine.connect()
+        try:
+            await connection.execution_options(isolation_level="AUTOCOMMIT")
+            acquired = (
+                await connection.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": self._key})
+            ).scalar_one()
+        except Exception:
+            await connection.close()
+            raise
+
+        if not acquired:
+            await connection.close()
+            return False
+
+        self._connection = connection
+        logging.info(f"[LeaderElection] became leader for {self.name}")
+        return True
+
+    async def _is_alive(self) -> bool:
+        try:
+            await self._connection.execute(text("SELECT 1"))
+        except Exception:
+            return False
+        return True
+
+    async def _drop_connection(self) -> None:
+        # Соединение закрывается, а не возвращается в пул: иначе блокировка осталась бы у соединения в пуле
+        connection, self._connection = self._connection, None
+        try:
+            await connection.invalidate()
+        except Exception:
+            logging.exception("[LeaderElection] failed to close connection")
@@ -0,0 +1,29 @@
+"""add outbox unsent index
+
+Revision ID: 5b2e9c1d7a43
+Revises: 17f0db3e0a1e
+Create Date: 2026-10-19 10:12:41.204518
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5b2e9c1d7a43"
+down_revision = "17f0db3e0a1e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_outbox_events_unsent_created_at",
+        "outbox_events",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("is_sent = false"),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_outbox_events_unsent_created_at", table_name="outbox_events")
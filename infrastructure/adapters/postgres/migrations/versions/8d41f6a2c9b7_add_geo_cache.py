@@ -0,0 +1,30 @@
+"""add geo cache
+
+Revision ID: 8d41f6a2c9b7
+Revises: 5b2e9c1d7a43
+Create Date: 2026-10-19 15:20:07.318204
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8d41f6a2c9b7"
+down_revision = "5b2e9c1d7a43"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "geo_cache",
+        sa.Column("street", sa.String(), nullable=False),
+        sa.Column("x", sa.Integer(), nullable=True),
+        sa.Column("y", sa.Integer(), nullable=True),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("street"),
+    )
+
+
+def downgrade():
+    op.drop_table("geo_cache")
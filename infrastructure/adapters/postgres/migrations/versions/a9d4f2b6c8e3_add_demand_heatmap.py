@@ -0,0 +1,31 @@
+"""add demand heatmap
+
+Revision ID: a9d4f2b6c8e3
+Revises: f1c3a5e7b9d2
+Create Date: 2026-10-19 23:17:54.271846
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a9d4f2b6c8e3"
+down_revision = "f1c3a5e7b9d2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "demand_heatmap",
+        sa.Column("bucket", sa.DateTime(), nullable=False),
+        sa.Column("cell", sa.SmallInteger(), nullable=False),
+        sa.Column("created", sa.Integer(), nullable=False),
+        sa.Column("assigned", sa.Integer(), nullable=False),
+        sa.Column("completed", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("bucket", "cell"),
+    )
+
+
+def downgrade():
+    op.drop_table("demand_heatmap")
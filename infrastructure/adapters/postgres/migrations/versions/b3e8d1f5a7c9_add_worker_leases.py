@@ -0,0 +1,29 @@
+"""add worker leases
+
+Revision ID: b3e8d1f5a7c9
+Revises: a9d4f2b6c8e3
+Create Date: 2026-10-20 10:42:18.530917
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b3e8d1f5a7c9"
+down_revision = "a9d4f2b6c8e3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "worker_leases",
+        sa.Column("group_name", sa.String(), nullable=False),
+        sa.Column("worker_id", sa.UUID(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("group_name", "worker_id"),
+    )
+
+
+def downgrade():
+    op.drop_table("worker_leases")
@@ -0,0 +1,35 @@
+"""add courier positions
+
+Revision ID: c4e1b7a9d2f3
+Revises: 8d41f6a2c9b7
+Create Date: 2026-10-19 19:42:11.804512
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c4e1b7a9d2f3"
+down_revision = "8d41f6a2c9b7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Секционированная таблица: op.create_table не поддерживает PARTITION BY
+    op.execute(
+        """
+        CREATE TABLE courier_positions (
+            courier_id UUID NOT NULL,
+            x SMALLINT NOT NULL,
+            y SMALLINT NOT NULL,
+            recorded_at TIMESTAMP WITHOUT TIME ZONE NOT NULL
+        ) PARTITION BY RANGE (recorded_at)
+        """
+    )
+    # Дневные секции создает задача обслуживания, секция по умолчанию принимает строки вне них
+    op.execute("CREATE TABLE courier_positions_default PARTITION OF courier_positions DEFAULT")
+    op.execute("CREATE INDEX ix_courier_positions_recorded_at ON courier_positions USING brin (recorded_at)")
+
+
+def downgrade():
+    op.execute("DROP TABLE courier_positions")
@@ -0,0 +1,51 @@
+"""add courier positions initial partitions
+
+Revision ID: d6f2a8c4e1b5
+Revises: b3e8d1f5a7c9
+Create Date: 2026-10-20 11:18:36.204715
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d6f2a8c4e1b5"
+down_revision = "b3e8d1f5a7c9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Секции на сегодня и два дня вперед (UTC), чтобы история не попадала в секцию по умолчанию
+    # до первого запуска задачи обслуживания. Уже попавшие туда строки переносятся в новые секции
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            partition_day date;
+            partition_table text;
+        BEGIN
+            FOR day_offset IN 0..2 LOOP
+                partition_day := (now() AT TIME ZONE 'utc')::date + day_offset;
+                partition_table := 'courier_positions_p' || to_char(partition_day, 'YYYYMMDD');
+                CONTINUE WHEN to_regclass(partition_table) IS NOT NULL;
+
+                CREATE TEMP TABLE courier_positions_moved (LIKE courier_positions);
+                EXECUTE 'WITH moved AS (DELETE FROM courier_positions_default '
+                    'WHERE recorded_at >= $1 AND recorded_at < $2 RETURNING *) '
+                    'INSERT INTO courier_positions_moved SELECT * FROM moved'
+                    USING partition_day::timestamp, (partition_day + 1)::timestamp;
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF courier_positions FOR VALUES FROM (%L) TO (%L)',
+                    partition_table, partition_day, partition_day + 1
+                );
+                INSERT INTO courier_positions SELECT * FROM courier_positions_moved;
+                DROP TABLE courier_positions_moved;
+            END LOOP;
+        END $$
+        """
+    )
+
+
+def downgrade():
+    # Дневные секции удаляются задачей обслуживания по сроку хранения или вместе с таблицей
+    pass
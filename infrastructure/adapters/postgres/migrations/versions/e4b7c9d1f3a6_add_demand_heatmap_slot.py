@@ -0,0 +1,42 @@
+"""add demand heatmap slot
+
+Revision ID: e4b7c9d1f3a6
+Revises: d6f2a8c4e1b5
+Create Date: 2026-10-20 13:42:08.517390
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e4b7c9d1f3a6"
+down_revision = "d6f2a8c4e1b5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("demand_heatmap", sa.Column("slot", sa.SmallInteger(), server_default="0", nullable=False))
+    op.alter_column("demand_heatmap", "slot", server_default=None)
+    op.drop_constraint("demand_heatmap_pkey", "demand_heatmap", type_="primary")
+    op.create_primary_key("demand_heatmap_pkey", "demand_heatmap", ["bucket", "cell", "slot"])
+
+
+def downgrade():
+    # Схлопываем слоты в нулевой
+    op.execute(
+        """
+        WITH collapsed AS (
+            DELETE FROM demand_heatmap WHERE slot <> 0 RETURNING bucket, cell, created, assigned, completed
+        )
+        INSERT INTO demand_heatmap (bucket, cell, slot, created, assigned, completed)
+        SELECT bucket, cell, 0, SUM(created), SUM(assigned), SUM(completed) FROM collapsed GROUP BY bucket, cell
+        ON CONFLICT (bucket, cell, slot) DO UPDATE SET
+            created = demand_heatmap.created + excluded.created,
+            assigned = demand_heatmap.assigned + excluded.assigned,
+            completed = demand_heatmap.completed + excluded.completed
+        """
+    )
+    op.drop_constraint("demand_heatmap_pkey", "demand_heatmap", type_="primary")
+    op.drop_column("demand_heatmap", "slot")
+    op.create_primary_key("demand_heatmap_pkey", "demand_heatmap", ["bucket", "cell"])
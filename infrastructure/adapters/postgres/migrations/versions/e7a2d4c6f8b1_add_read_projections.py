@@ -0,0 +1,81 @@
+"""add read projections
+
+Revision ID: e7a2d4c6f8b1
+Revises: c4e1b7a9d2f3
+Create Date: 2026-10-19 21:08:36.150927
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e7a2d4c6f8b1"
+down_revision = "c4e1b7a9d2f3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "courier_view",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("speed", sa.Integer(), nullable=False),
+        sa.Column("x", sa.SmallInteger(), nullable=False),
+        sa.Column("y", sa.SmallInteger(), nullable=False),
+        sa.Column("is_busy", sa.Boolean(), nullable=False),
+        sa.Column("free_volume", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_courier_view_is_busy"), "courier_view", ["is_busy"], unique=False)
+    op.create_table(
+        "active_order_view",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("x", sa.SmallInteger(), nullable=False),
+        sa.Column("y", sa.SmallInteger(), nullable=False),
+        sa.Column("volume", sa.Integer(), nullable=False),
+        sa.Column("order_status", sa.String(length=20), nullable=False),
+        sa.Column("courier_id", sa.UUID(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_active_order_view_order_status"), "active_order_view", ["order_status"], unique=False)
+
+    # Заполняем проекции из существующих данных
+    op.execute(
+        """
+        INSERT INTO courier_view (id, name, speed, x, y, is_busy, free_volume)
+        SELECT
+            c.id,
+            c.name,
+            c.speed,
+            CAST(c.location ->> 'x' AS smallint),
+            CAST(c.location ->> 'y' AS smallint),
+            COUNT(sp.order_id) > 0,
+            COALESCE(SUM(sp.total_volume) FILTER (WHERE sp.id IS NOT NULL AND sp.order_id IS NULL), 0)
+        FROM couriers c
+        LEFT JOIN courier_storage_places csp ON csp.courier_id = c.id
+        LEFT JOIN storage_places sp ON sp.id = csp.storage_place_id
+        GROUP BY c.id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO active_order_view (id, x, y, volume, order_status, courier_id)
+        SELECT
+            o.id,
+            CAST(o.location ->> 'x' AS smallint),
+            CAST(o.location ->> 'y' AS smallint),
+            o.volume,
+            o.order_status,
+            o.courier_id
+        FROM orders o
+        WHERE o.order_status <> 'COMPLETED'
+        """
+    )
+
+
+def downgrade():
+    op.drop_index(op.f("ix_active_order_view_order_status"), table_name="active_order_view")
+    op.drop_table("active_order_view")
+    op.drop_index(op.f("ix_courier_view_is_busy"), table_name="courier_view")
+    op.drop_table("courier_view")
@@ -0,0 +1,45 @@
+"""add dashboard counters
+
+Revision ID: f1c3a5e7b9d2
+Revises: e7a2d4c6f8b1
+Create Date: 2026-10-19 22:41:12.508314
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f1c3a5e7b9d2"
+down_revision = "e7a2d4c6f8b1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "dashboard_counters",
+        sa.Column("name", sa.String(length=32), nullable=False),
+        sa.Column("slot", sa.SmallInteger(), nullable=False),
+        sa.Column("value", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("name", "slot"),
+    )
+
+    # Начальные значения счетчиков по проекциям и таблице заказов
+    op.execute(
+        """
+        INSERT INTO dashboard_counters (name, slot, value)
+        SELECT name, 0, value FROM (
+            SELECT 'orders_' || lower(order_status) AS name, COUNT(*) AS value
+            FROM active_order_view GROUP BY order_status
+            UNION ALL
+            SELECT 'orders_completed', COUNT(*) FROM orders WHERE order_status = 'COMPLETED'
+            UNION ALL
+            SELECT CASE WHEN is_busy THEN 'couriers_busy' ELSE 'couriers_free' END, COUNT(*)
+            FROM courier_view GROUP BY is_busy
+        ) AS actual
+        """
+    )
+
+
+def downgrade():
+    op.drop_table("dashboard_counters")
@@ -0,0 +1,39 @@
+"""add orders created notify
+
+Revision ID: f8a1c3e5b7d9
+Revises: e4b7c9d1f3a6
+Create Date: 2026-10-20 16:05:41.903257
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f8a1c3e5b7d9"
+down_revision = "e4b7c9d1f3a6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # NOTIFY доставляется слушателям при фиксации, одинаковые уведомления транзакции схлопываются в одно
+    op.execute(
+        """
+        CREATE FUNCTION notify_orders_created() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('orders_created', '');
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER orders_created_notify AFTER INSERT ON orders
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_orders_created()
+        """
+    )
+
+
+def downgrade():
+    op.execute("DROP TRIGGER orders_created_notify ON orders")
+    op.execute("DROP FUNCTION notify_orders_created()")
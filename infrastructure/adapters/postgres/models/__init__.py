@@ -5,11 +5,27 @@
 
 from infrastructure.adapters.postgres.models.base import Base
 from infrastructure.adapters.postgres.models.courier_aggregate import CourierModel, StoragePlaceModel
+from infrastructure.adapters.postgres.models.courier_position import CourierPositionModel
+from infrastructure.adapters.postgres.models.geo_cache import GeoCacheModel
 from infrastructure.adapters.postgres.models.order_aggregate import OrderModel
+from infrastructure.adapters.postgres.models.projections import (
+    ActiveOrderViewModel,
+    CourierViewModel,
+    DashboardCounterModel,
+    DemandHeatmapModel,
+)
+from infrastructure.adapters.postgres.models.worker_lease import WorkerLeaseModel
 
 __all__ = [
     "Base",
     "CourierModel",
     "StoragePlaceModel",
+    "CourierPositionModel",
+    "GeoCacheModel",
     "OrderModel",
+    "CourierViewModel",
+    "ActiveOrderViewModel",
+    "DashboardCounterModel",
+    "DemandHeatmapModel",
+    "WorkerLeaseModel",
 ]
@@ -0,0 +1,30 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import UUID as SQLAlchemyUUID
+from sqlalchemy import DateTime, Index, SmallInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infrastructure.adapters.postgres.models.base import Base
+
+
+class CourierPositionModel(Base):
+    """
+    История позиций курьеров (append-only), секционирована по дням по recorded_at.
+
+    Первичного ключа в таблице нет: строки только дописываются, а выборка по времени идет через BRIN-индекс.
+    (courier_id, recorded_at) - ключ только для маппера.
+    """
+
+    __tablename__ = "courier_positions"
+    __table_args__ = (
+        Index("ix_courier_positions_recorded_at", "recorded_at", postgresql_using="brin"),
+        {"postgresql_partition_by": "RANGE (recorded_at)"},
+    )
+
+    courier_id: Mapped[UUID] = mapped_column(SQLAlchemyUUID, nullable=False)
+    x: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    y: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    recorded_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    __mapper_args__ = {"primary_key": [courier_id, recorded_at]}
@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infrastructure.adapters.postgres.models.base import Base
+
+
+class GeoCacheModel(Base):
+    """Кэш геокодирования: нормализованная улица -> координаты. Пустые координаты - улица не найдена."""
+
+    __tablename__ = "geo_cache"
+
+    street: Mapped[str] = mapped_column(String, primary_key=True)
+    x: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    y: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -0,0 +1,61 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import UUID as SQLAlchemyUUID
+from sqlalchemy import BigInteger, Boolean, DateTime, Integer, SmallInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infrastructure.adapters.postgres.models.base import Base
+
+
+class CourierViewModel(Base):
+    """Проекция курьера для чтения: позиция, занятость и свободный объем без join с местами хранения."""
+
+    __tablename__ = "courier_view"
+
+    id: Mapped[UUID] = mapped_column(SQLAlchemyUUID, primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+    speed: Mapped[int] = mapped_column(Integer)
+    x: Mapped[int] = mapped_column(SmallInteger)
+    y: Mapped[int] = mapped_column(SmallInteger)
+    is_busy: Mapped[bool] = mapped_column(Boolean, index=True)
+    free_volume: Mapped[int] = mapped_column(Integer)
+
+
+class ActiveOrderViewModel(Base):
+    """Проекция незавершенных заказов для чтения. Завершенные заказы из проекции удаляются."""
+
+    __tablename__ = "active_order_view"
+
+    id: Mapped[UUID] = mapped_column(SQLAlchemyUUID, primary_key=True)
+    x: Mapped[int] = mapped_column(SmallInteger)
+    y: Mapped[int] = mapped_column(SmallInteger)
+    volume: Mapped[int] = mapped_column(Integer)
+    order_status: Mapped[str] = mapped_column(String(20), index=True)
+    courier_id: Mapped[UUID | None] = mapped_column(SQLAlchemyUUID, nullable=True)
+
+
+class DashboardCounterModel(Base):
+    """
+    Счетчики заказов по статусам и занятых/свободных курьеров.
+    Значение счетчика - сумма по слотам: транзакции обновляют случайный слот и не ждут друг друга на одной строке.
+    """
+
+    __tablename__ = "dashboard_counters"
+
+    name: Mapped[str] = mapped_column(String(32), primary_key=True)
+    slot: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    value: Mapped[int] = mapped_column(BigInteger, default=0)
+
+
+class DemandHeatmapModel(Base):
+    """Количество созданных, назначенных и завершенных заказов по клеткам карты за минуту (UTC)."""
+
+    __tablename__ = "demand_heatmap"
+
+    bucket: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    cell: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    slot: Mapped[int] = mapped_column(SmallInteger, primary_key=True, default=0)
+    created: Mapped[int] = mapped_column(Integer, default=0)
+    assigned: Mapped[int] = mapped_column(Integer, default=0)
+    completed: Mapped[int] = mapped_column(Integer, default=0)
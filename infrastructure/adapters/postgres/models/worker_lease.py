@@ -0,0 +1,18 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import UUID as SQLAlchemyUUID
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infrastructure.adapters.postgres.models.base import Base
+
+
+class WorkerLeaseModel(Base):
+    """Аренда воркера в группе: воркер жив, пока продлевает expires_at."""
+
+    __tablename__ = "worker_leases"
+
+    group_name: Mapped[str] = mapped_column(String, primary_key=True)
+    worker_id: Mapped[UUID] = mapped_column(SQLAlchemyUUID, primary_key=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
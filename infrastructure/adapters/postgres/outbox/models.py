@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, Index, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Mapped, mapped_column
@@ -12,6 +12,10 @@ OutboxBase = declarative_base()
 
 class OutboxEvent(OutboxBase):
     __tablename__ = "outbox_events"
+    __table_args__ = (
+        # Частичный индекс: опрос outbox читает только неотправленные события в порядке создания
+        Index("ix_outbox_events_unsent_created_at", "created_at", postgresql_where=text("is_sent = false")),
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     event_type: Mapped[str] = mapped_column(nullable=False)
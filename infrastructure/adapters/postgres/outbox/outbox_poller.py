@@ -1,44 +1,111 @@
 import asyncio
 import logging
+import time
 from datetime import datetime
 
-from sqlalchemy import select, update
+from sqlalchemy import func, select, update
 
 from core.ports.event_publisher_interface import EventPublisherInterface
 from infrastructure.adapters.postgres.outbox.models import OutboxEvent
 from infrastructure.adapters.postgres.uow import UnitOfWork
 from infrastructure.events.integration_event_registry import event_registry
+from infrastructure.metrics import metrics
 
 
 class OutboxPollingPublisher:
+    """
+    Публикует события из outbox в брокер.
+
+    Интервал опроса и размер пачки подстраиваются под нагрузку:
+    - пока пачки приходят полными, следующий опрос выполняется сразу;
+    - при пустой таблице или ошибке интервал растет экспоненциально до max_poll_interval;
+    - размер пачки увеличивается, пока публикация укладывается в target_publish_latency, и уменьшается иначе.
+    """
+
     def __init__(
         self,
         uow: UnitOfWork,
         event_publisher: EventPublisherInterface,
         poll_interval: float = 0.3,
         batch_size: int = 100,
+        max_poll_interval: float = 5.0,
+        min_batch_size: int = 10,
+        max_batch_size: int = 1000,
+        target_publish_latency: float = 0.5,
+        backlog_report_interval: float = 10.0,
     ):
         self.uow = uow
         self.event_publisher = event_publisher
         self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
         self.batch_size = batch_size
+        self.min_batch_size = min(min_batch_size, batch_size)
+        self.max_batch_size = max(max_batch_size, batch_size)
+        self.target_publish_latency = target_publish_latency
+        self.backlog_report_interval = backlog_report_interval
+        self._current_interval = poll_interval
+        self._last_backlog_report = 0.0
         self._is_running = False
 
     async def start(self):
         self._is_running = True
         while self._is_running:
+            batch_size = self.batch_size
             try:
-                logging.info("[OutboxPoller] polling for events")
-                await self._poll_once()
-            except Exception as e:
-                # log exception, backoff, etc.
-                print(f"[OutboxPoller] error: {e}")
-            await asyncio.sleep(self.poll_interval)
+                published = await self._poll_once()
+            except Exception:
+                logging.exception("[OutboxPoller] failed to publish events")
+                metrics.counter("outbox_relay_errors_total").inc()
+                published = None
+
+            delay = self._next_delay(published, batch_size)
+            await self._report_backlog()
+            # sleep(0) отдает управление циклу событий даже при работе без пауз
+            await asyncio.sleep(delay)
 
     async def stop(self):
         self._is_running = False
 
-    async def _poll_once(self):
+    def _next_delay(self, published: int | None, batch_size: int) -> float:
+        """Вычислить паузу перед следующим опросом. published=None означает ошибку публикации."""
+        if published is not None and published >= batch_size:
+            # Есть бэклог: забираем следующую пачку без паузы
+            self._current_interval = self.poll_interval
+            return 0.0
+
+        if published:
+            self._current_interval = self.poll_interval
+        else:
+            self._current_interval = min(self._current_interval * 2, self.max_poll_interval)
+        return self._current_interval
+
+    def _adjust_batch_size(self, published: int, publish_latency: float) -> None:
+        """Подстроить размер пачки под измеренную задержку публикации."""
+        if publish_latency > self.target_publish_latency:
+            self.batch_size = max(self.min_batch_size, self.batch_size // 2)
+        elif published >= self.batch_size and publish_latency < self.target_publish_latency / 2:
+            self.batch_size = min(self.max_batch_size, self.batch_size * 2)
+
+        metrics.gauge("outbox_relay_batch_size").set(self.batch_size)
+
+    async def _report_backlog(self):
+        now = time.monotonic()
+        if now - self._last_backlog_report < self.backlog_report_interval:
+            return
+        self._last_backlog_report = now
+
+        try:
+            async with self.uow:
+                stmt = select(func.count()).select_from(OutboxEvent).where(OutboxEvent.is_sent.is_(False))
+                backlog = (await self.uow.session.execute(stmt)).scalar_one()
+        except Exception:
+            logging.exception("[OutboxPoller] failed to measure backlog")
+            return
+
+        metrics.gauge("outbox_relay_backlog").set(backlog)
+        logging.info(f"[OutboxPoller] backlog: {backlog} events")
+
+    async def _poll_once(self) -> int:
         async with self.uow:
             # SELECT ... FOR UPDATE SKIP LOCKED
             stmt = (
@@ -53,7 +120,17 @@ class OutboxPollingPublisher:
             events = result.scalars().all()
 
             if not events:
-                return
+                metrics.gauge("outbox_relay_lag_seconds").set(0)
+                return 0
+
+            ids = [e.id for e in events]
+            # created_at хранится без часового пояса во времени сессии БД, поэтому задержку считаем на стороне БД
+            lag = await self.uow.session.execute(
+                select(func.extract("epoch", func.now() - func.min(OutboxEvent.created_at))).where(
+                    OutboxEvent.id.in_(ids)
+                )
+            )
+            metrics.gauge("outbox_relay_lag_seconds").set(float(lag.scalar_one()))
 
             domain_events = []
 
@@ -68,13 +145,19 @@ class OutboxPollingPublisher:
                 domain_events.append(integration_event_data)
 
             # Публикуем в брокер
+            started_at = time.perf_counter()
             await self.event_publisher.publish(domain_events)
+            publish_latency = time.perf_counter() - started_at
+            metrics.histogram("outbox_relay_publish_seconds").observe(publish_latency)
 
             # Обновляем is_sent
-            ids = [e.id for e in events]
             await self.uow.session.execute(
                 update(OutboxEvent).where(OutboxEvent.id.in_(ids)).values(is_sent=True, sent_at=datetime.utcnow())
             )
 
             await self.uow.commit()
+            metrics.counter("outbox_relay_published_total").inc(len(events))
             logging.info(f"[OutboxPoller] {len(events)} events published")
+
+        self._adjust_batch_size(len(events), publish_latency)
+        return len(events)
@@ -0,0 +1,44 @@
+from .counters import (
+    COUNTER_SLOTS,
+    RECONCILE_SLOT,
+    apply_counter_deltas,
+    courier_counter,
+    order_counter_deltas,
+    read_counters,
+    reconcile_counters,
+)
+from .heatmap import (
+    GRID_SIZE,
+    HEATMAP_CELLS,
+    HEATMAP_KINDS,
+    apply_heatmap_deltas,
+    cell_index,
+    cell_location,
+    heatmap_bucket,
+    order_demand_key,
+)
+from .rebuild import REBUILD_STATEMENTS, rebuild_projections
+from .writer import project_courier_locations, project_couriers, project_orders
+
+__all__ = [
+    "COUNTER_SLOTS",
+    "GRID_SIZE",
+    "HEATMAP_CELLS",
+    "HEATMAP_KINDS",
+    "REBUILD_STATEMENTS",
+    "RECONCILE_SLOT",
+    "apply_counter_deltas",
+    "apply_heatmap_deltas",
+    "cell_index",
+    "cell_location",
+    "courier_counter",
+    "heatmap_bucket",
+    "order_counter_deltas",
+    "order_demand_key",
+    "project_courier_locations",
+    "project_couriers",
+    "project_orders",
+    "read_counters",
+    "rebuild_projections",
+    "reconcile_counters",
+]
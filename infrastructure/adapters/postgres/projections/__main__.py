@@ -0,0 +1,29 @@
+"""
+Перестроение проекций courier_view и active_order_view из таблиц записи и пересчет счетчиков дашборда:
+
+    python -m infrastructure.adapters.postgres.projections
+"""
+
+import asyncio
+
+from infrastructure.adapters.postgres.projections.counters import reconcile_counters
+from infrastructure.adapters.postgres.projections.rebuild import rebuild_projections
+from infrastructure.adapters.postgres.session import async_session_maker, engine
+
+
+async def run() -> None:
+    async with async_session_maker() as session:
+        couriers, orders = await rebuild_projections(session)
+        drift = await reconcile_counters(session)
+        await session.commit()
+    await engine.dispose()
+
+    print(f"Projections rebuilt: {couriers} couriers, {orders} active orders, counters drift: {drift}")
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import random
+from collections import Counter
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.domain.events.base import BaseDomainEvent, OrderStatusChangedEvent
+from core.domain.model.order_aggregate.order_status import OrderStatus
+from infrastructure.adapters.postgres.models.projections import DashboardCounterModel
+
+# Транзакции обновляют случайный слот счетчика, чтобы не выстраиваться в очередь на блокировке одной строки
+COUNTER_SLOTS = 8
+# Слот сверки: в него пишет только сверка, поэтому ее upsert не конфликтует с транзакциями записи
+RECONCILE_SLOT = COUNTER_SLOTS
+
+COURIERS_BUSY = "couriers_busy"
+COURIERS_FREE = "couriers_free"
+
+# Фактические значения счетчиков: по проекциям и, для завершенных заказов, по таблице заказов
+ACTUAL_COUNTERS_QUERY = """
+    SELECT 'orders_' || lower(order_status), COUNT(*) FROM active_order_view GROUP BY order_status
+    UNION ALL
+    SELECT 'orders_completed', COUNT(*) FROM orders WHERE order_status = 'COMPLETED'
+    UNION ALL
+    SELECT CASE WHEN is_busy THEN 'couriers_busy' ELSE 'couriers_free' END, COUNT(*) FROM courier_view GROUP BY is_busy
+"""
+
+
+def order_status_counter(status: OrderStatus) -> str:
+    return f"orders_{status.name.value.lower()}"
+
+
+def courier_counter(is_busy: bool) -> str:
+    return COURIERS_BUSY if is_busy else COURIERS_FREE
+
+
+def order_counter_deltas(events: list[BaseDomainEvent]) -> Counter[str]:
+    """Изменения счетчиков заказов по переходам статусов. События уже схлопнуты в пределах транзакции."""
+    deltas: Counter[str] = Counter()
+    for event in events:
+        if not isinstance(event, OrderStatusChangedEvent):
+            continue
+        deltas[order_status_counter(event.order_status)] += 1
+        if event.previous_status is not None:
+            deltas[order_status_counter(event.previous_status)] -= 1
+    return deltas
+
+
+async def apply_counter_deltas(session: AsyncSession, deltas: Counter[str], slot: int | None = None) -> None:
+    """Применить изменения счетчиков в транзакции записи одним upsert. По умолчанию в случайный слот."""
+    # Строки блокируются в порядке имен, поэтому транзакции с общим слотом не ловят взаимную блокировку
+    if slot is None:
+        slot = random.randrange(COUNTER_SLOTS)
+    values = [{"name": name, "slot": slot, "value": delta} for name, delta in sorted(deltas.items()) if delta]
+    if not values:
+        return
+
+    stmt = pg_insert(DashboardCounterModel).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[DashboardCounterModel.name, DashboardCounterModel.slot],
+        set_={"value": DashboardCounterModel.value + stmt.excluded.value},
+    )
+    await session.execute(stmt)
+
+
+async def read_counters(session: AsyncSession) -> dict[str, int]:
+    """Текущие значения счетчиков: сумма по слотам, не больше COUNTER_SLOTS строк на счетчик."""
+    result = await session.execute(
+        select(DashboardCounterModel.name, func.sum(DashboardCounterModel.value)).group_by(DashboardCounterModel.name)
+    )
+    return {name: int(value) for name, value in result.all()}
+
+
+async def reconcile_counters(session: AsyncSession) -> dict[str, int]:
+    """
+    Пересчитать счетчики и исправить расхождение. Возвращает расхождения: фактическое значение минус счетчик.
+    Ожидает транзакцию REPEATABLE READ: счетчики и фактические значения читаются из одного снимка, а расхождение
+    применяется как приращение, поэтому записи, зафиксированные после снимка, не теряются и таблица не блокируется.
+    """
+    counted = await read_counters(session)
+    actual = {name: int(value) for name, value in (await session.execute(text(ACTUAL_COUNTERS_QUERY))).all()}
+
+    drift = {
+        name: actual.get(name, 0) - counted.get(name, 0)
+        for name in counted.keys() | actual.keys()
+        if actual.get(name, 0) != counted.get(name, 0)
+    }
+    await apply_counter_deltas(session, Counter(drift), slot=RECONCILE_SLOT)
+    return drift
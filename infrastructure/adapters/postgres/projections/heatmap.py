@@ -0,0 +1,61 @@
+import random
+from collections import Counter
+from datetime import datetime, timezone
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.domain.model.order_aggregate.order_aggregate import Order
+from core.domain.shared_kernel.location import Location
+from infrastructure.adapters.postgres.models.projections import DemandHeatmapModel
+
+from .counters import COUNTER_SLOTS
+
+# Location ограничена сеткой 10x10, клетка - номер от 0 до 99 по строкам
+GRID_SIZE = 10
+HEATMAP_CELLS = GRID_SIZE * GRID_SIZE
+# Колонки demand_heatmap, совпадают с именами статусов заказа в нижнем регистре
+HEATMAP_KINDS = ("created", "assigned", "completed")
+
+
+def cell_index(location: Location) -> int:
+    return (location.y - 1) * GRID_SIZE + (location.x - 1)
+
+
+def cell_location(cell: int) -> Location:
+    return Location(x=cell % GRID_SIZE + 1, y=cell // GRID_SIZE + 1)
+
+
+def order_demand_key(order: Order) -> tuple[int, str]:
+    """Клетка и колонка тепловой карты для текущего статуса заказа."""
+    return cell_index(order.location), order.order_status.name.value.lower()
+
+
+def heatmap_bucket(moment: datetime) -> datetime:
+    """Минута, в которую попадает момент. В базе время хранится в UTC без часового пояса."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment.replace(second=0, microsecond=0)
+
+
+async def apply_heatmap_deltas(session: AsyncSession, deltas: Counter[tuple[int, str]], bucket: datetime) -> None:
+    """Добавить переходы заказов в минутную корзину тепловой карты одним upsert, в случайный слот корзины."""
+    # Все транзакции минуты пишут в одну корзину: слоты, как у счетчиков, разводят их по разным строкам
+    slot = random.randrange(COUNTER_SLOTS)
+    cells: dict[int, dict] = {}
+    for (cell, kind), delta in deltas.items():
+        if delta:
+            row = cells.setdefault(
+                cell, {"bucket": bucket, "cell": cell, "slot": slot, **dict.fromkeys(HEATMAP_KINDS, 0)}
+            )
+            row[kind] += delta
+    if not cells:
+        return
+
+    # Строки блокируются в порядке клеток, как и в apply_counter_deltas
+    stmt = pg_insert(DemandHeatmapModel).values([cells[cell] for cell in sorted(cells)])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[DemandHeatmapModel.bucket, DemandHeatmapModel.cell, DemandHeatmapModel.slot],
+        set_={kind: getattr(DemandHeatmapModel, kind) + stmt.excluded[kind] for kind in HEATMAP_KINDS},
+    )
+    await session.execute(stmt)
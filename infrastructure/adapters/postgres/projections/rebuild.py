@@ -0,0 +1,45 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Проекции строятся заново из таблиц записи: они источник истины, а история событий в outbox неполная
+REBUILD_STATEMENTS = (
+    "LOCK TABLE courier_view, active_order_view IN ACCESS EXCLUSIVE MODE",
+    "TRUNCATE courier_view, active_order_view",
+    """
+    INSERT INTO courier_view (id, name, speed, x, y, is_busy, free_volume)
+    SELECT
+        c.id,
+        c.name,
+        c.speed,
+        CAST(c.location ->> 'x' AS smallint),
+        CAST(c.location ->> 'y' AS smallint),
+        COUNT(sp.order_id) > 0,
+        COALESCE(SUM(sp.total_volume) FILTER (WHERE sp.id IS NOT NULL AND sp.order_id IS NULL), 0)
+    FROM couriers c
+    LEFT JOIN courier_storage_places csp ON csp.courier_id = c.id
+    LEFT JOIN storage_places sp ON sp.id = csp.storage_place_id
+    GROUP BY c.id
+    """,
+    """
+    INSERT INTO active_order_view (id, x, y, volume, order_status, courier_id)
+    SELECT
+        o.id,
+        CAST(o.location ->> 'x' AS smallint),
+        CAST(o.location ->> 'y' AS smallint),
+        o.volume,
+        o.order_status,
+        o.courier_id
+    FROM orders o
+    WHERE o.order_status <> 'COMPLETED'
+    """,
+)
+
+
+async def rebuild_projections(session: AsyncSession) -> tuple[int, int]:
+    """Перестроить проекции в одной транзакции. Возвращает количество курьеров и активных заказов."""
+    for statement in REBUILD_STATEMENTS:
+        await session.execute(text(statement))
+
+    couriers = (await session.execute(text("SELECT COUNT(*) FROM courier_view"))).scalar_one()
+    orders = (await session.execute(text("SELECT COUNT(*) FROM active_order_view"))).scalar_one()
+    return couriers, orders
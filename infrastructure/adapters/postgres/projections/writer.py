@@ -0,0 +1,97 @@
+from uuid import UUID
+
+from sqlalchemy import UUID as SQLAlchemyUUID
+from sqlalchemy import Integer, any_, bindparam, delete, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.domain.model.courier_aggregate.courier_aggregate import Courier
+from core.domain.model.order_aggregate.order_aggregate import Order
+from core.domain.model.order_aggregate.order_status import OrderStatus
+from core.domain.shared_kernel.location import Location
+from infrastructure.adapters.postgres.models.projections import ActiveOrderViewModel, CourierViewModel
+
+
+async def project_couriers(session: AsyncSession, couriers: list[Courier]) -> None:
+    """Обновить проекцию курьеров в транзакции записи."""
+    if not couriers:
+        return
+
+    values = [
+        {
+            "id": courier.id,
+            "name": courier.name,
+            "speed": courier.speed,
+            "x": courier.location.x,
+            "y": courier.location.y,
+            "is_busy": any(sp.order_id is not None for sp in courier.storage_places),
+            "free_volume": sum(sp.total_volume for sp in courier.storage_places if sp.order_id is None),
+        }
+        for courier in couriers
+    ]
+    stmt = pg_insert(CourierViewModel).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CourierViewModel.id],
+        set_={column: stmt.excluded[column] for column in values[0] if column != "id"},
+    )
+    await session.execute(stmt)
+
+
+async def project_courier_locations(session: AsyncSession, locations: dict[UUID, Location]) -> None:
+    """Обновить позиции курьеров в проекции одним запросом."""
+    if not locations:
+        return
+
+    stmt = text(
+        """
+        UPDATE courier_view
+        SET x = v.x, y = v.y
+        FROM unnest(CAST(:ids AS uuid[]), CAST(:xs AS integer[]), CAST(:ys AS integer[])) AS v(id, x, y)
+        WHERE courier_view.id = v.id
+        """
+    ).bindparams(
+        bindparam("ids", type_=ARRAY(SQLAlchemyUUID)),
+        bindparam("xs", type_=ARRAY(Integer)),
+        bindparam("ys", type_=ARRAY(Integer)),
+    )
+    await session.execute(
+        stmt,
+        {
+            "ids": list(locations),
+            "xs": [location.x for location in locations.values()],
+            "ys": [location.y for location in locations.values()],
+        },
+    )
+
+
+async def project_orders(session: AsyncSession, orders: list[Order]) -> None:
+    """Обновить проекцию заказов в транзакции записи: активные - upsert, завершенные - удалить."""
+    completed_ids = [order.id for order in orders if order.order_status == OrderStatus.completed()]
+    active = [order for order in orders if order.order_status != OrderStatus.completed()]
+
+    if completed_ids:
+        await session.execute(
+            delete(ActiveOrderViewModel).where(
+                ActiveOrderViewModel.id == any_(bindparam("order_ids", completed_ids, type_=ARRAY(SQLAlchemyUUID)))
+            )
+        )
+
+    if active:
+        values = [
+            {
+                "id": order.id,
+                "x": order.location.x,
+                "y": order.location.y,
+                "volume": order.volume,
+                "order_status": order.order_status.name,
+                "courier_id": order.courier_id,
+            }
+            for order in active
+        ]
+        stmt = pg_insert(ActiveOrderViewModel).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ActiveOrderViewModel.id],
+            set_={column: stmt.excluded[column] for column in values[0] if column != "id"},
+        )
+        await session.execute(stmt)
@@ -1,21 +1,32 @@
+from collections import Counter
 from uuid import UUID, uuid4
 
-from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy import UUID as SQLAlchemyUUID
+from sqlalchemy import Integer, any_, bindparam, delete, func, insert, select, text, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.domain.model.courier_aggregate.courier_aggregate import Courier
+from core.domain.shared_kernel.location import Location
 from core.ports.courier_repository_interface import CourierRepositoryInterface
 from infrastructure.adapters.postgres.models.courier_aggregate import (
     CourierModel,
     CourierStoragePlaceModel,
     StoragePlaceModel,
 )
+from infrastructure.adapters.postgres.projections import courier_counter, project_courier_locations, project_couriers
 
 
 class CourierRepository(CourierRepositoryInterface):
     def __init__(self, session: AsyncSession):
         super().__init__()
         self.session = session
+        # Изменения счетчиков занятых/свободных курьеров, применяются при фиксации UoW
+        self.counter_deltas: Counter[str] = Counter()
+
+    def pop_counter_deltas(self) -> Counter[str]:
+        deltas, self.counter_deltas = self.counter_deltas, Counter()
+        return deltas
 
     async def add_courier(self, courier: Courier) -> Courier:
         # Первый flush: добавляем курьера одним запросом
@@ -46,6 +57,8 @@ class CourierRepository(CourierRepositoryInterface):
             await self.session.execute(stmt)
 
         await self.session.refresh(courier_model, ["storage_places"])
+        await project_couriers(self.session, [courier])
+        self.counter_deltas[courier_counter(self._is_busy(courier))] += 1
         return courier_model.to_domain_object()
 
     async def update_courier(self, courier: Courier) -> None:
@@ -60,6 +73,7 @@ class CourierRepository(CourierRepositoryInterface):
 
         # Получаем существующие места хранения
         existing_storage_places = {sp.id: sp for sp in existing_courier.storage_places}
+        was_busy = any(sp.order_id is not None for sp in existing_storage_places.values())
         new_storage_places = {sp.id: sp for sp in courier.storage_places} if courier.storage_places else {}
 
         # Определяем какие связи нужно добавить, а какие удалить
@@ -113,11 +127,28 @@ class CourierRepository(CourierRepositoryInterface):
                     await self.session.execute(update_query)
 
         await self.session.refresh(existing_courier, ["storage_places"])
+        await project_couriers(self.session, [courier])
+        is_busy = self._is_busy(courier)
+        if is_busy != was_busy:
+            self.counter_deltas[courier_counter(is_busy)] += 1
+            self.counter_deltas[courier_counter(was_busy)] -= 1
 
     async def get_courier(self, courier_id: UUID) -> Courier | None:
         courier_model = await self._get_courier_model(courier_id)
         return courier_model.to_domain_object() if courier_model else None
 
+    async def get_couriers(self, courier_ids: list[UUID]) -> list[Courier]:
+        if not courier_ids:
+            return []
+
+        query = (
+            select(CourierModel)
+            .where(CourierModel.id == any_(bindparam("courier_ids", list(courier_ids), type_=ARRAY(SQLAlchemyUUID))))
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(query)
+        return [courier_model.to_domain_object() for courier_model in result.unique().scalars().all()]
+
     async def get_all_free_couriers(self) -> list[Courier]:
         query = (
             select(CourierModel)
@@ -130,6 +161,57 @@ class CourierRepository(CourierRepositoryInterface):
         free_couriers = result.unique().scalars().all()
         return [courier_model.to_domain_object() for courier_model in free_couriers]
 
+    async def update_locations(self, locations: dict[UUID, Location]) -> None:
+        await self._update_locations(locations)
+
+    async def update_free_courier_locations(self, locations: dict[UUID, Location]) -> set[UUID]:
+        # Курьер мог получить заказ после чтения свободных курьеров: позицию занятого курьера не трогаем
+        return await self._update_locations(
+            locations,
+            """
+            AND NOT EXISTS (
+                SELECT 1 FROM courier_storage_places csp JOIN storage_places sp ON sp.id = csp.storage_place_id
+                WHERE csp.courier_id = couriers.id AND sp.order_id IS NOT NULL
+            )
+            """,
+        )
+
+    async def _update_locations(self, locations: dict[UUID, Location], condition: str = "") -> set[UUID]:
+        if not locations:
+            return set()
+
+        # Один UPDATE ... FROM unnest(...) вместо запроса на каждого курьера
+        stmt = text(
+            f"""
+            UPDATE couriers
+            SET location = json_build_object('x', v.x, 'y', v.y), updated_at = now()
+            FROM unnest(CAST(:ids AS uuid[]), CAST(:xs AS integer[]), CAST(:ys AS integer[])) AS v(id, x, y)
+            WHERE couriers.id = v.id {condition}
+            RETURNING couriers.id
+            """
+        ).bindparams(
+            bindparam("ids", type_=ARRAY(SQLAlchemyUUID)),
+            bindparam("xs", type_=ARRAY(Integer)),
+            bindparam("ys", type_=ARRAY(Integer)),
+        )
+        result = await self.session.execute(
+            stmt,
+            {
+                "ids": list(locations),
+                "xs": [location.x for location in locations.values()],
+                "ys": [location.y for location in locations.values()],
+            },
+        )
+        updated = set(result.scalars().all())
+        await project_courier_locations(
+            self.session, {courier_id: location for courier_id, location in locations.items() if courier_id in updated}
+        )
+        return updated
+
+    @staticmethod
+    def _is_busy(courier: Courier) -> bool:
+        return any(sp.order_id is not None for sp in courier.storage_places or [])
+
     async def _get_courier_model(self, courier_id: UUID) -> CourierModel | None:
         """Вспомогательный метод для получения модели курьера с загруженными связями."""
         query = select(CourierModel).filter(CourierModel.id == courier_id).execution_options(populate_existing=True)
@@ -1,19 +1,30 @@
+from collections import Counter
 from uuid import UUID
 
-from sqlalchemy import insert, select
+from sqlalchemy import UUID as SQLAlchemyUUID
+from sqlalchemy import String, any_, bindparam, cast, func, insert, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.domain.events.base import OrderStatusChangedEvent
 from core.domain.model.order_aggregate.order_aggregate import Order
-from core.domain.model.order_aggregate.order_status import OrderStatusEnum
+from core.domain.model.order_aggregate.order_status import OrderStatus, OrderStatusEnum
 from core.ports.order_repository_interface import OrderRepositoryInterface
 from infrastructure.adapters.postgres.models.order_aggregate import OrderModel
+from infrastructure.adapters.postgres.projections import order_demand_key, project_orders
 
 
 class OrderRepository(OrderRepositoryInterface):
     def __init__(self, session: AsyncSession):
         super().__init__()
         self.session = session
+        # Переходы заказов по клеткам карты для demand_heatmap, применяются при фиксации UoW
+        self.heatmap_deltas: Counter[tuple[int, str]] = Counter()
+
+    def pop_heatmap_deltas(self) -> Counter[tuple[int, str]]:
+        deltas, self.heatmap_deltas = self.heatmap_deltas, Counter()
+        return deltas
 
     async def add_order(self, order: Order) -> Order:
         # Создаем заказ одним запросом
@@ -27,15 +38,50 @@ class OrderRepository(OrderRepositoryInterface):
         stmt = insert(OrderModel).values(order_values).returning(OrderModel)
         result = await self.session.execute(stmt)
         order_model = result.unique().scalar_one()
+        await project_orders(self.session, [order])
+        self.heatmap_deltas[order_demand_key(order)] += 1
         self.register_event(OrderStatusChangedEvent(order_id=order.id, order_status=order.order_status))
         return order_model.to_domain_object()
 
+    async def add_orders(self, orders: list[Order]) -> list[Order]:
+        if not orders:
+            return []
+
+        # Вставляем все заказы одним запросом, конфликтующие по id пропускаются
+        orders_values = [
+            {
+                "id": order.id,
+                "location": order.location.model_dump(),
+                "volume": order.volume,
+                "order_status": order.order_status.name,
+                "courier_id": order.courier_id,
+            }
+            for order in orders
+        ]
+        stmt = (
+            pg_insert(OrderModel)
+            .values(orders_values)
+            .on_conflict_do_nothing(index_elements=[OrderModel.id])
+            .returning(OrderModel.id)
+        )
+        result = await self.session.execute(stmt)
+        inserted_ids = set(result.scalars().all())
+
+        added_orders = [order for order in orders if order.id in inserted_ids]
+        await project_orders(self.session, added_orders)
+        for order in added_orders:
+            self.heatmap_deltas[order_demand_key(order)] += 1
+            self.register_event(OrderStatusChangedEvent(order_id=order.id, order_status=order.order_status))
+        return added_orders
+
     async def update_order(self, order: Order) -> None:
         # Получаем существующий заказ
         order_model = await self._get_order_model(order.id)
         if not order_model:
             raise ValueError(f"Order with id {order.id} not found")
 
+        previous_status = OrderStatus(name=OrderStatusEnum(order_model.order_status))
+
         # Обновляем поля заказа
         order_model.location = order.location.model_dump()
         order_model.volume = order.volume
@@ -43,12 +89,30 @@ class OrderRepository(OrderRepositoryInterface):
         order_model.courier_id = order.courier_id
 
         await self.session.flush()
-        self.register_event(OrderStatusChangedEvent(order_id=order.id, order_status=order.order_status))
+        await project_orders(self.session, [order])
+        if previous_status != order.order_status:
+            self.heatmap_deltas[order_demand_key(order)] += 1
+            self.register_event(
+                OrderStatusChangedEvent(
+                    order_id=order.id, order_status=order.order_status, previous_status=previous_status
+                )
+            )
 
     async def get_order(self, order_id: UUID) -> Order | None:
         order_model = await self._get_order_model(order_id)
         return order_model.to_domain_object() if order_model else None
 
+    async def get_existing_order_ids(self, order_ids: list[UUID]) -> set[UUID]:
+        if not order_ids:
+            return set()
+
+        # WHERE id = ANY(:order_ids) - один параметр-массив вместо IN со списком параметров
+        query = select(OrderModel.id).where(
+            OrderModel.id == any_(bindparam("order_ids", list(order_ids), type_=ARRAY(SQLAlchemyUUID)))
+        )
+        result = await self.session.execute(query)
+        return set(result.scalars().all())
+
     async def get_one_created_order(self) -> Order | None:
         query = (
             select(OrderModel)
@@ -60,12 +124,16 @@ class OrderRepository(OrderRepositoryInterface):
         order_model = result.unique().scalar_one_or_none()
         return order_model.to_domain_object() if order_model else None
 
-    async def get_all_assigned_orders(self) -> list[Order]:
+    async def get_all_assigned_orders(self, shard: int = 0, shard_count: int = 1) -> list[Order]:
         query = (
             select(OrderModel)
             .filter(OrderModel.order_status == OrderStatusEnum.ASSIGNED)
             .execution_options(populate_existing=True)
         )
+        if shard_count > 1:
+            # Шард определяется хэшем курьера: все заказы курьера попадают в один шард
+            courier_hash = func.hashtext(cast(OrderModel.courier_id, String)).op("&")(0x7FFFFFFF)
+            query = query.filter(courier_hash % shard_count == shard)
         result = await self.session.execute(query)
         order_models = result.unique().scalars().all()
         return [order_model.to_domain_object() for order_model in order_models]
@@ -1,6 +1,6 @@
 from typing import AsyncContextManager, Callable
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from infrastructure.config.settings import get_settings
 
@@ -23,3 +23,8 @@ async_session_maker = async_sessionmaker(
 def get_db_session() -> Callable[[], AsyncContextManager[AsyncSession]]:
     """Возвращает фабрику сессий."""
     return async_session_maker
+
+
+def get_db_engine() -> AsyncEngine:
+    """Возвращает движок БД."""
+    return engine
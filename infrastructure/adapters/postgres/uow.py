@@ -1,9 +1,17 @@
+from datetime import datetime, timezone
 from typing import AsyncContextManager, Callable, Optional, cast
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.domain.events.base import BaseDomainEvent
 from core.ports.event_publisher_interface import EventPublisherInterface
 from core.ports.unit_of_work import UnitOfWork as UnitOfWorkInterface
+from infrastructure.adapters.postgres.projections import (
+    apply_counter_deltas,
+    apply_heatmap_deltas,
+    heatmap_bucket,
+    order_counter_deltas,
+)
 from infrastructure.adapters.postgres.repositories.courier_repository import CourierRepository
 from infrastructure.adapters.postgres.repositories.order_repository import OrderRepository
 
@@ -39,14 +47,17 @@ class UnitOfWork(UnitOfWorkInterface):
             if hasattr(self, "_session") and self._session is not None:
                 await self._session.close()
                 self._session = None
+            # Репозитории привязаны к закрытой сессии: при повторном входе они создаются заново
+            self._order_repository = None
+            self._courier_repository = None
+            self._repositories = []
 
     async def commit(self):
         if not self._session:
             raise RuntimeError("Session not initialized")
 
-        domain_events = []
-        for repo in self._repositories:
-            domain_events.extend(repo.get_events())
+        domain_events = self.collect_events()
+        await self._apply_counters(domain_events)
 
         if self.event_publisher.requires_commit_after_publish:
             await self.event_publisher.publish(domain_events, session=self._session)
@@ -58,8 +69,24 @@ class UnitOfWork(UnitOfWorkInterface):
     async def rollback(self):
         if not self._session:
             raise RuntimeError("Session not initialized")
+        if self._courier_repository is not None:
+            self._courier_repository.pop_counter_deltas()
+        if self._order_repository is not None:
+            self._order_repository.pop_heatmap_deltas()
         await self._session.rollback()
 
+    async def _apply_counters(self, domain_events: list[BaseDomainEvent]) -> None:
+        """Обновить счетчики статусов и тепловую карту спроса в той же транзакции, что и изменения агрегатов."""
+        session = cast(AsyncSession, self._session)
+        deltas = order_counter_deltas(domain_events)
+        if self._courier_repository is not None:
+            deltas.update(self._courier_repository.pop_counter_deltas())
+        await apply_counter_deltas(session, deltas)
+
+        if self._order_repository is not None:
+            heatmap_deltas = self._order_repository.pop_heatmap_deltas()
+            await apply_heatmap_deltas(session, heatmap_deltas, heatmap_bucket(datetime.now(timezone.utc)))
+
     @property
     def courier_repository(self) -> CourierRepository:
         if not self._session:
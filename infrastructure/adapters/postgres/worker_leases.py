@@ -0,0 +1,59 @@
+from datetime import timedelta
+from typing import AsyncContextManager, Callable
+from uuid import uuid4
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.adapters.postgres.models.worker_lease import WorkerLeaseModel
+
+
+class PostgresWorkerLeases:
+    """
+    Учет живых воркеров группы в таблице worker_leases.
+
+    Воркер продлевает аренду на ttl секунд при каждом запуске задачи. Аренда упавшего воркера истекает,
+    и остальные узнают об этом не позже чем через ttl. Время берется из часов базы, а не реплик.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncContextManager[AsyncSession]], group: str, ttl: float):
+        self._session_factory = session_factory
+        self.group = group
+        self.ttl = ttl
+        self.worker_id = uuid4()
+
+    async def renew(self) -> int:
+        """Продлить свою аренду и вернуть число живых воркеров группы, включая себя."""
+        expires_at = func.now() + timedelta(seconds=self.ttl)
+        stmt = pg_insert(WorkerLeaseModel).values(
+            group_name=self.group, worker_id=self.worker_id, expires_at=expires_at
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[WorkerLeaseModel.group_name, WorkerLeaseModel.worker_id],
+            set_={"expires_at": stmt.excluded.expires_at},
+        )
+
+        async with self._session_factory() as session:
+            await session.execute(stmt)
+            await session.execute(
+                delete(WorkerLeaseModel).where(
+                    WorkerLeaseModel.group_name == self.group, WorkerLeaseModel.expires_at <= func.now()
+                )
+            )
+            live = (
+                await session.execute(
+                    select(func.count()).select_from(WorkerLeaseModel).where(WorkerLeaseModel.group_name == self.group)
+                )
+            ).scalar_one()
+            await session.commit()
+        return live
+
+    async def release(self) -> None:
+        async with self._session_factory() as session:
+            await session.execute(
+                delete(WorkerLeaseModel).where(
+                    WorkerLeaseModel.group_name == self.group, WorkerLeaseModel.worker_id == self.worker_id
+                )
+            )
+            await session.commit()
@@ -1,8 +1,35 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class GeoServiceSettings(BaseSettings):
     host: str = "localhost"
     port: int = 5004
+    # Количество постоянных соединений с сервисом
+    pool_size: int = 2
+    # Дедлайн одного запроса, в секундах
+    timeout: float = 1.0
+
+    # Второй эндпоинт для хеджированных запросов, без него хеджирование выключено
+    hedge_host: str | None = None
+    hedge_port: int = 5004
+    # Задержка хеджа до накопления статистики и квантиль задержек, после которого отправляется хедж
+    hedge_delay: float = 0.05
+    hedge_quantile: float = 0.95
+
+    # Предохранитель: число ошибок подряд до размыкания и время до пробного запроса, в секундах
+    breaker_failure_threshold: int = 5
+    breaker_reset_timeout: float = 10.0
+
+    # Локальная таблица улиц (python -m infrastructure.adapters.geo_table), проверяется до кэша и сети
+    table_path: str | None = None
+
+    # Кэш геокодирования: memory - только в процессе, postgres - дополнительно в таблице geo_cache
+    cache_storage: Literal["memory", "postgres"] = "memory"
+    cache_size: int = 10000
+    cache_ttl: float = 86400
+    # Время хранения ответа "улица не найдена"
+    cache_negative_ttl: float = 300
 
-    model_config = SettingsConfigDict(env_file=".env", env_prefix="GEO_SERVICE", extra="allow")
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="GEO_SERVICE_", extra="allow")
@@ -1,8 +1,11 @@
+from typing import Any, Dict, Literal
+
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class KafkaSettings(BaseSettings):
-    BROKERS: str = ""
+    BROKERS: str = "localhost:9092"
     SECURITY_PROTOCOL: str = ""
     SASL_MECHANISM: str = "PLAIN"
     SASL_PLAIN_USERNAME: str = ""
@@ -12,4 +15,76 @@ class KafkaSettings(BaseSettings):
     ORDER_STATUS_CHANGED_TOPIC: str = "order.status.changed"
     BASKET_CONFIRMED_GROUP_ID: str = "basket-confirmed-group"
 
+    # Режим обработки basket.confirmed:
+    # single - по одному сообщению, batch - пачкой сообщений в одной транзакции,
+    # pipeline - пачкой через конвейер декодирование -> геокодирование -> сохранение,
+    # concurrent - до BASKET_CONFIRMED_CONCURRENCY сообщений одновременно с сохранением порядка по ключу
+    BASKET_CONFIRMED_CONSUMER_MODE: Literal["single", "batch", "pipeline", "concurrent"] = "single"
+    BASKET_CONFIRMED_BATCH_SIZE: int = 100
+    BASKET_CONFIRMED_BATCH_TIMEOUT_MS: int = 200
+    BASKET_CONFIRMED_GEOCODE_CONCURRENCY: int = 16
+    BASKET_CONFIRMED_PERSIST_BATCH_SIZE: int = 50
+    BASKET_CONFIRMED_PERSIST_FLUSH_MS: int = 50
+    BASKET_CONFIRMED_PIPELINE_QUEUE_SIZE: int = 100
+    BASKET_CONFIRMED_CONCURRENCY: int = 16
+
+    # Формат сообщений: application/json или application/x-protobuf.
+    # Входящие сообщения декодируются по заголовку content-type, значение ниже используется при его отсутствии
+    BASKET_CONFIRMED_DEFAULT_CONTENT_TYPE: str = "application/json"
+    ORDER_STATUS_CHANGED_CONTENT_TYPE: str = "application/json"
+    # Разбирать из basket.confirmed только поля, нужные для создания заказа.
+    # False включает полную валидацию события (позиции, период доставки) для отладки
+    BASKET_CONFIRMED_LEAN_DECODING: bool = True
+
+    # Телеметрия курьеров: сообщения {courier_id, x, y, ts}, ключ сообщения - courier_id
+    COURIER_LOCATIONS_ENABLED: bool = False
+    COURIER_LOCATIONS_TOPIC: str = "courier.locations"
+    COURIER_LOCATIONS_GROUP_ID: str = "courier-locations-group"
+    COURIER_LOCATIONS_BATCH_SIZE: int = 1000
+    COURIER_LOCATIONS_BATCH_TIMEOUT_MS: int = 100
+
+    # Producer
+    PRODUCER_ACKS: str = "all"
+    PRODUCER_ENABLE_IDEMPOTENCE: bool = True
+    # gzip не требует дополнительных библиотек, lz4 и zstd требуют установленных lz4 / zstandard
+    PRODUCER_COMPRESSION_TYPE: str | None = "gzip"
+    PRODUCER_LINGER_MS: int = 10
+    PRODUCER_MAX_BATCH_SIZE: int = 64 * 1024
+    PRODUCER_REQUEST_TIMEOUT_MS: int = 40000
+
     model_config = SettingsConfigDict(env_file=".env", env_prefix="kafka_", extra="allow")
+
+    @model_validator(mode="after")
+    def check_idempotence_acks(self) -> "KafkaSettings":
+        # Идемпотентный producer в aiokafka работает только с acks=all
+        if self.PRODUCER_ENABLE_IDEMPOTENCE and self.PRODUCER_ACKS != "all":
+            raise ValueError("PRODUCER_ENABLE_IDEMPOTENCE requires PRODUCER_ACKS=all")
+        return self
+
+    @property
+    def bootstrap_servers(self) -> list[str]:
+        return [broker.strip() for broker in self.BROKERS.split(",") if broker.strip()]
+
+    def get_security_config(self) -> Dict[str, Any]:
+        """Получить параметры аутентификации для клиентов aiokafka."""
+        if not self.SECURITY_PROTOCOL:
+            return {}
+        return {
+            "security_protocol": self.SECURITY_PROTOCOL,
+            "sasl_mechanism": self.SASL_MECHANISM,
+            "sasl_plain_username": self.SASL_PLAIN_USERNAME,
+            "sasl_plain_password": self.SASL_PLAIN_PASSWORD,
+        }
+
+    def get_producer_config(self) -> Dict[str, Any]:
+        """Получить конфигурацию для AIOKafkaProducer."""
+        return {
+            "bootstrap_servers": self.bootstrap_servers,
+            "acks": int(self.PRODUCER_ACKS) if self.PRODUCER_ACKS.isdigit() else self.PRODUCER_ACKS,
+            "enable_idempotence": self.PRODUCER_ENABLE_IDEMPOTENCE,
+            "compression_type": self.PRODUCER_COMPRESSION_TYPE or None,
+            "linger_ms": self.PRODUCER_LINGER_MS,
+            "max_batch_size": self.PRODUCER_MAX_BATCH_SIZE,
+            "request_timeout_ms": self.PRODUCER_REQUEST_TIMEOUT_MS,
+            **self.get_security_config(),
+        }
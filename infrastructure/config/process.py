@@ -0,0 +1,76 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class ProcessSettings(BaseSettings):
+    """
+    Настройки ролей процессов: HTTP API, воркер диспетчеризации и outbox relay.
+    Каждая роль запускается отдельной точкой входа из api/entrypoints и масштабируется независимо.
+    """
+
+    # HTTP API
+    API_HOST: str = "0.0.0.0"
+    API_PORT: int = 8000
+    API_WORKERS: int = 1
+    # Запускать фоновые задачи и outbox relay внутри процесса API (режим "все в одном" для локальной разработки).
+    # По умолчанию выключено: иначе каждый воркер uvicorn поднимает свой планировщик, producer и outbox relay.
+    # Включается при запуске через main.py
+    API_RUN_BACKGROUND_JOBS: bool = False
+    # Принимать basket.confirmed в процессах API
+    API_CONSUME_KAFKA: bool = True
+
+    # Метрики процессов без HTTP API отдаются по GET /metrics на API_HOST и этих портах, None - не отдавать
+    DISPATCHER_WORKER_METRICS_PORT: int | None = 9101
+    OUTBOX_RELAY_METRICS_PORT: int | None = 9102
+
+    # Воркер диспетчеризации, интервалы в секундах
+    # Назначение заказов идет подряд, пока есть заказы, а без работы интервал растет до ASSIGN_ORDERS_MAX_INTERVAL
+    ASSIGN_ORDERS_INTERVAL: float = 2.0
+    ASSIGN_ORDERS_MAX_INTERVAL: float = 8.0
+    # Создание заказа будит назначение сразу, в том числе в dispatcher_worker (NOTIFY orders_created при вставке).
+    # Уведомления за ASSIGN_ORDERS_DEBOUNCE_MS схлопываются в один запуск
+    ASSIGN_ORDERS_DEBOUNCE_MS: int = 10
+    MOVE_COURIERS_INTERVAL: float = 2.0
+    # Каждую периодическую задачу выполняет только одна реплика (pg_try_advisory_lock)
+    LEADER_ELECTION_ENABLED: bool = True
+    # Шардирование перемещения курьеров: при MOVE_COURIERS_SHARDS > 1 шарды делятся поровну между живыми
+    # репликами. Реплика жива, пока продлевает аренду; шарды упавшей реплики разбираются
+    # не позже чем через MOVE_COURIERS_WORKER_LEASE_TTL секунд
+    MOVE_COURIERS_SHARDS: int = 1
+    MOVE_COURIERS_WORKER_LEASE_TTL: float = 10.0
+    # Позиции курьеров хранятся в памяти воркера и сохраняются в базу раз в COURIER_STATE_FLUSH_INTERVAL.
+    # Назначение заказов и перемещение курьеров выполняет один лидер, шардирование не используется.
+    # Раз в COURIER_STATE_RESYNC_INTERVAL добираются заказы, назначенные вне воркера
+    COURIER_STATE_ENGINE_ENABLED: bool = False
+    COURIER_STATE_FLUSH_INTERVAL: float = 10.0
+    COURIER_STATE_RESYNC_INTERVAL: float = 60.0
+
+    # Телеметрия курьеров: последние позиции копятся в процессе API и записываются пачкой с этим интервалом
+    COURIER_LOCATIONS_FLUSH_INTERVAL_MS: int = 200
+
+    # История позиций курьеров (courier_positions) пишется пачками раз в COURIER_POSITIONS_FLUSH_INTERVAL_MS.
+    # Дневные секции создаются на COURIER_POSITIONS_PARTITIONS_AHEAD дней вперед
+    # и удаляются через COURIER_POSITIONS_RETENTION_DAYS дней
+    COURIER_POSITIONS_HISTORY_ENABLED: bool = True
+    COURIER_POSITIONS_FLUSH_INTERVAL_MS: int = 1000
+    COURIER_POSITIONS_PARTITIONS_AHEAD: int = 2
+    COURIER_POSITIONS_RETENTION_DAYS: int = 7
+
+    # Счетчики дашборда обновляются при записи и сверяются с проекциями раз в DASHBOARD_COUNTERS_RECONCILE_INTERVAL
+    DASHBOARD_COUNTERS_RECONCILE_INTERVAL: float = 300.0
+
+    # Тепловая карта спроса: окно до DEMAND_HEATMAP_WINDOW_MINUTES минут в памяти процесса,
+    # дочитывается из demand_heatmap не чаще раза в DEMAND_HEATMAP_REFRESH_INTERVAL секунд.
+    # Минутные корзины в базе хранятся DEMAND_HEATMAP_RETENTION_MINUTES минут
+    DEMAND_HEATMAP_WINDOW_MINUTES: int = 60
+    DEMAND_HEATMAP_REFRESH_INTERVAL: float = 5.0
+    DEMAND_HEATMAP_RETENTION_MINUTES: int = 1440
+
+    # Свободные курьеры с интервалом MOVE_COURIERS_INTERVAL сдвигаются к REPOSITION_HOTSPOTS клеткам
+    # с наибольшим числом заказов за REPOSITION_WINDOW_MINUTES минут. Доля REPOSITION_RESERVE_FRACTION
+    # свободных курьеров остается на месте
+    REPOSITION_IDLE_COURIERS_ENABLED: bool = False
+    REPOSITION_RESERVE_FRACTION: float = 0.3
+    REPOSITION_WINDOW_MINUTES: int = 15
+    REPOSITION_HOTSPOTS: int = 5
+
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="PROCESS_", extra="allow")
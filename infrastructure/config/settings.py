@@ -5,6 +5,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from infrastructure.config.database import DatabaseSettings
 from infrastructure.config.geo_service import GeoServiceSettings
 from infrastructure.config.kafka import KafkaSettings
+from infrastructure.config.process import ProcessSettings
 
 
 class Settings(BaseSettings):
@@ -14,6 +15,7 @@ class Settings(BaseSettings):
     database: DatabaseSettings = DatabaseSettings()
     geo_service: GeoServiceSettings = GeoServiceSettings()
     kafka: KafkaSettings = KafkaSettings()
+    process: ProcessSettings = ProcessSettings()
 
     # Здесь могут быть другие настройки приложения
     # например, для API, кэширования, очередей и т.д.
@@ -2,23 +2,47 @@ from typing import AsyncContextManager, Callable
 
 from aiokafka import AIOKafkaProducer
 from dependency_injector import containers, providers
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from core.application.use_cases.commands.assign_orders import AssignOrdersUseCase
 from core.application.use_cases.commands.create_courier import CreateCourierUseCase
 from core.application.use_cases.commands.create_order import CreateOrderUseCase
+from core.application.use_cases.commands.create_orders_batch import CreateOrdersBatchUseCase
+from core.application.use_cases.commands.ingest_courier_locations import IngestCourierLocationsUseCase
 from core.application.use_cases.commands.move_couriers import MoveCouriersUseCase
+from core.application.use_cases.commands.reposition_idle_couriers import RepositionIdleCouriersUseCase
 from core.application.use_cases.queries.get_all_busy_couriers import GetAllBusyCouriersUseCase
 from core.application.use_cases.queries.get_all_couriers import GetAllCouriersUseCase
+from core.application.use_cases.queries.get_courier_track import GetCourierTrackUseCase
+from core.application.use_cases.queries.get_dashboard_stats import GetDashboardStatsUseCase
+from core.application.use_cases.queries.get_demand_heatmap import GetDemandHeatmapUseCase
 from core.application.use_cases.queries.get_not_completed_orders import GetNotCompletedOrdersUseCase
 from core.domain.services.dispatch_service import Dispatcher
+from core.domain.services.repositioning_service import RepositioningPlanner
+from core.ports.assignment_trigger_interface import AssignmentTriggerInterface
 from core.ports.event_publisher_interface import EventPublisherInterface
+from core.ports.geo_service_interface import GeoServiceInterface
+from infrastructure.adapters.geo_cache import CachedGeoService
+from infrastructure.adapters.geo_table import GeoTable, LocalTableGeoService
 from infrastructure.adapters.grpc.geo.client import GRPCGeoService
+from infrastructure.adapters.grpc.geo.resilient import CircuitBreaker, ResilientGeoService
+from infrastructure.adapters.in_process import (
+    CourierLocationBuffer,
+    CourierPositionHistory,
+    DemandHeatmap,
+    InMemoryCourierState,
+)
 from infrastructure.adapters.kafka.event_publisher import KafkaEventPublisher, get_kafka_producer
+from infrastructure.adapters.postgres.assignment_trigger import PostgresAssignmentTrigger
+from infrastructure.adapters.postgres.courier_position_store import PostgresCourierPositionStore
+from infrastructure.adapters.postgres.demand_heatmap_store import PostgresDemandHeatmapStore
+from infrastructure.adapters.postgres.geo_cache_store import PostgresGeoCacheStore
+from infrastructure.adapters.postgres.leader_election import AdvisoryLockLeaderElection
 from infrastructure.adapters.postgres.outbox.outbox_poller import OutboxPollingPublisher
 from infrastructure.adapters.postgres.outbox.outbox_publisher import OutboxPublisher
-from infrastructure.adapters.postgres.session import get_db_session
+from infrastructure.adapters.postgres.session import get_db_engine, get_db_session
 from infrastructure.adapters.postgres.uow import UnitOfWork as PostgresUnitOfWork
+from infrastructure.adapters.postgres.worker_leases import PostgresWorkerLeases
 from infrastructure.config.settings import Settings, get_settings
 
 
@@ -32,6 +56,20 @@ class Container(containers.DeclarativeContainer):
         get_db_session
     )
 
+    db_engine: providers.Provider[AsyncEngine] = providers.Singleton(get_db_engine)
+
+    # Выбор лидера для периодических задач, name передается при вызове
+    leader_election = providers.Factory(
+        AdvisoryLockLeaderElection,
+        engine=db_engine,
+    )
+
+    # Аренды воркеров для деления шардов между живыми репликами, group и ttl передаются при вызове
+    worker_leases = providers.Factory(
+        PostgresWorkerLeases,
+        session_factory=db_session_factory,
+    )
+
     # Kafka
     kafka_producer: providers.Singleton[AIOKafkaProducer] = providers.Singleton(get_kafka_producer)
 
@@ -44,11 +82,63 @@ class Container(containers.DeclarativeContainer):
         OutboxPublisher,
     )
 
-    # Geo Service
-    geo_service = providers.Factory(
+    # Geo Service: один экземпляр на процесс, чтобы переиспользовать соединения
+    grpc_geo_service = providers.Singleton(
         GRPCGeoService,
         host=config().geo_service.host,
         port=config().geo_service.port,
+        pool_size=config().geo_service.pool_size,
+        timeout=config().geo_service.timeout,
+    )
+
+    grpc_geo_service_hedge = (
+        providers.Singleton(
+            GRPCGeoService,
+            host=config().geo_service.hedge_host,
+            port=config().geo_service.hedge_port,
+            pool_size=config().geo_service.pool_size,
+            timeout=config().geo_service.timeout,
+        )
+        if config().geo_service.hedge_host
+        else providers.Object(None)
+    )
+
+    upstream_geo_service = providers.Singleton(
+        ResilientGeoService,
+        primary=grpc_geo_service,
+        hedge=grpc_geo_service_hedge,
+        breaker=providers.Factory(
+            CircuitBreaker,
+            failure_threshold=config().geo_service.breaker_failure_threshold,
+            reset_timeout=config().geo_service.breaker_reset_timeout,
+        ),
+        hedge_delay=config().geo_service.hedge_delay,
+        hedge_quantile=config().geo_service.hedge_quantile,
+    )
+
+    geo_cache_store = providers.Selector(
+        config.provided.geo_service.cache_storage,
+        memory=providers.Object(None),
+        postgres=providers.Singleton(PostgresGeoCacheStore, session_factory=db_session_factory),
+    )
+
+    cached_geo_service: providers.Provider[GeoServiceInterface] = providers.Singleton(
+        CachedGeoService,
+        geo_service=upstream_geo_service,
+        store=geo_cache_store,
+        max_size=config().geo_service.cache_size,
+        ttl=config().geo_service.cache_ttl,
+        negative_ttl=config().geo_service.cache_negative_ttl,
+    )
+
+    geo_service: providers.Provider[GeoServiceInterface] = (
+        providers.Singleton(
+            LocalTableGeoService,
+            table=providers.Singleton(GeoTable, path=config().geo_service.table_path),
+            fallback=cached_geo_service,
+        )
+        if config().geo_service.table_path
+        else cached_geo_service
     )
 
     # Unit of Work
@@ -58,27 +148,123 @@ class Container(containers.DeclarativeContainer):
         event_publisher=outbox_publisher,
     )
 
+    # Пробуждение назначения заказов при создании заказа, в том числе в другом процессе (LISTEN/NOTIFY)
+    assignment_trigger: providers.Provider[AssignmentTriggerInterface] = providers.Singleton(
+        PostgresAssignmentTrigger,
+        engine=db_engine,
+        debounce=config().process.ASSIGN_ORDERS_DEBOUNCE_MS / 1000,
+    )
+
+    # История позиций курьеров: буфер процесса, запись пачками вне транзакций
+    courier_position_store = providers.Singleton(
+        PostgresCourierPositionStore,
+        session_factory=db_session_factory,
+    )
+
+    courier_position_history = (
+        providers.Singleton(
+            CourierPositionHistory,
+            store=courier_position_store,
+        )
+        if config().process.COURIER_POSITIONS_HISTORY_ENABLED
+        else providers.Object(None)
+    )
+
+    # Тепловая карта спроса: минутные корзины пишет UoW, процесс держит окно в памяти
+    demand_heatmap_store = providers.Singleton(
+        PostgresDemandHeatmapStore,
+        session_factory=db_session_factory,
+    )
+
+    demand_heatmap = providers.Singleton(
+        DemandHeatmap,
+        store=demand_heatmap_store,
+        buckets=config().process.DEMAND_HEATMAP_WINDOW_MINUTES,
+        refresh_interval=config().process.DEMAND_HEATMAP_REFRESH_INTERVAL,
+    )
+
+    # Состояние перемещения курьеров в памяти процесса (PROCESS_COURIER_STATE_ENGINE_ENABLED)
+    courier_state = (
+        providers.Singleton(
+            InMemoryCourierState,
+            uow_factory=unit_of_work.provider,
+            position_history=courier_position_history,
+        )
+        if config().process.COURIER_STATE_ENGINE_ENABLED
+        else providers.Object(None)
+    )
+
+    # Последние позиции курьеров из телеметрии до записи в базу
+    courier_location_buffer = providers.Singleton(
+        CourierLocationBuffer,
+        uow_factory=unit_of_work.provider,
+    )
+
     # Domain Services
     dispatcher = providers.Factory(
         Dispatcher,
     )
 
+    repositioning_planner = providers.Factory(
+        RepositioningPlanner,
+    )
+
     # Use Cases
     assign_orders_use_case = providers.Factory(
         AssignOrdersUseCase,
         uow=unit_of_work,
         dispatcher=dispatcher,
+        courier_state=courier_state,
     )
 
     create_order_use_case = providers.Factory(
         CreateOrderUseCase,
         uow=unit_of_work,
         geo_service=geo_service,
+        assignment_trigger=assignment_trigger,
+    )
+
+    create_orders_batch_use_case = providers.Factory(
+        CreateOrdersBatchUseCase,
+        uow=unit_of_work,
+        geo_service=geo_service,
+        assignment_trigger=assignment_trigger,
+        geocode_concurrency=config().kafka.BASKET_CONFIRMED_GEOCODE_CONCURRENCY,
     )
 
     move_couriers_use_case = providers.Factory(
         MoveCouriersUseCase,
         uow=unit_of_work,
+        position_history=courier_position_history,
+    )
+
+    reposition_idle_couriers_use_case = providers.Factory(
+        RepositionIdleCouriersUseCase,
+        uow=unit_of_work,
+        heatmap=demand_heatmap,
+        planner=repositioning_planner,
+        position_history=courier_position_history,
+    )
+
+    ingest_courier_locations_use_case = providers.Factory(
+        IngestCourierLocationsUseCase,
+        location_buffer=courier_location_buffer,
+        position_history=courier_position_history,
+    )
+
+    get_courier_track_use_case = providers.Factory(
+        GetCourierTrackUseCase,
+        uow=unit_of_work,
+    )
+
+    get_dashboard_stats_use_case = providers.Factory(
+        GetDashboardStatsUseCase,
+        uow=unit_of_work,
+    )
+
+    get_demand_heatmap_use_case = providers.Factory(
+        GetDemandHeatmapUseCase,
+        heatmap=demand_heatmap,
     )
 
     get_not_completed_orders_use_case = providers.Factory(
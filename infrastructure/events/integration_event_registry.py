@@ -6,10 +6,12 @@ from core.domain.events.base import BaseDomainEvent
 event_registry: Dict[str, dict] = {}
 
 
-def register_event(*, topic: str):
+def register_event(*, topic: str, key: str | None = None, content_type: str = "application/json"):
     """
     Декоратор для регистрации события.
     Используется в инфраструктуре, применим в домене.
+    key - имя поля события, значение которого используется как ключ сообщения (партиционирование).
+    content_type - формат сериализации события при публикации.
     """
 
     def decorator(cls: Type[BaseDomainEvent]):
@@ -17,6 +19,8 @@ def register_event(*, topic: str):
         event_registry[event_type] = {
             "model": cls,
             "topic": topic,
+            "key": key,
+            "content_type": content_type,
         }
         return cls
 
@@ -1,6 +1,8 @@
-from pydantic import ConfigDict
+from pydantic import ConfigDict, Field
 
 from core.domain.events.base import OrderStatusChangedEvent
+from core.domain.model.order_aggregate.order_status import OrderStatus
+from infrastructure.adapters.kafka.order_status_changed import Contract_pb2
 from infrastructure.config.settings import get_settings
 from infrastructure.events.integration_event_registry import register_event
 
@@ -12,10 +14,25 @@ def to_camel(string: str) -> str:
     return parts[0] + "".join(word.capitalize() for word in parts[1:])
 
 
-@register_event(topic=settings.kafka.ORDER_STATUS_CHANGED_TOPIC)
+# Ключ по order_id: все события заказа попадают в одну партицию и читаются по порядку
+@register_event(
+    topic=settings.kafka.ORDER_STATUS_CHANGED_TOPIC,
+    key="order_id",
+    content_type=settings.kafka.ORDER_STATUS_CHANGED_CONTENT_TYPE,
+)
 class IntegrationOrderStatusChangedEvent(OrderStatusChangedEvent):
+    # Предыдущий статус нужен только внутри сервиса и не входит в контракт интеграционного события
+    previous_status: OrderStatus | None = Field(None, exclude=True)
+
     @classmethod
     def get_event_type(cls) -> str:
         return "OrderStatusChangedEvent"
 
     model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+    def to_protobuf(self) -> Contract_pb2.OrderStatusChangedIntegrationEvent:
+        # Номера статусов в контракте совпадают с порядковыми номерами OrderStatusEnum
+        return Contract_pb2.OrderStatusChangedIntegrationEvent(
+            orderId=str(self.order_id),
+            orderStatus=self.order_status.name.value_number,
+        )
@@ -0,0 +1,112 @@
+from bisect import bisect_left
+from typing import Any, Dict, Tuple
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class Counter:
+    """Монотонно возрастающий счетчик."""
+
+    def __init__(self):
+        self.value: float = 0
+
+    def inc(self, amount: float = 1) -> None:
+        if amount < 0:
+            raise ValueError("Counter can only be incremented")
+        self.value += amount
+
+
+class Gauge:
+    """Текущее значение величины (глубина очереди, лаг и т.д.)."""
+
+    def __init__(self):
+        self.value: float = 0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.value -= amount
+
+
+class Histogram:
+    """Гистограмма с фиксированными границами корзин."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum: float = 0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative = 0
+        buckets = {}
+        for bound, bucket_count in zip((*self.buckets, float("inf")), self.bucket_counts):
+            cumulative += bucket_count
+            buckets[str(bound)] = cumulative
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+
+class MetricsRegistry:
+    """
+    Внутрипроцессный реестр метрик.
+    Метрика идентифицируется именем и набором меток.
+    """
+
+    def __init__(self):
+        self._counters: Dict[MetricKey, Counter] = {}
+        self._gauges: Dict[MetricKey, Gauge] = {}
+        self._histograms: Dict[MetricKey, Histogram] = {}
+
+    @staticmethod
+    def _key(name: str, labels: Dict[str, Any]) -> MetricKey:
+        return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def counter(self, name: str, **labels: Any) -> Counter:
+        return self._counters.setdefault(self._key(name, labels), Counter())
+
+    def gauge(self, name: str, **labels: Any) -> Gauge:
+        return self._gauges.setdefault(self._key(name, labels), Gauge())
+
+    def histogram(self, name: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, **labels: Any) -> Histogram:
+        key = self._key(name, labels)
+        if key not in self._histograms:
+            self._histograms[key] = Histogram(buckets)
+        return self._histograms[key]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Получить значения всех метрик в виде словаря."""
+        result: Dict[str, Any] = {}
+        for key, counter in self._counters.items():
+            result[self._format_key(key)] = counter.value
+        for key, gauge in self._gauges.items():
+            result[self._format_key(key)] = gauge.value
+        for key, histogram in self._histograms.items():
+            result[self._format_key(key)] = histogram.snapshot()
+        return result
+
+    def clear(self) -> None:
+        self._counters.clear()
+        self._gauges.clear()
+        self._histograms.clear()
+
+    @staticmethod
+    def _format_key(key: MetricKey) -> str:
+        name, labels = key
+        if not labels:
+            return name
+        return name + "{" + ",".join(f"{label}={value}" for label, value in labels) + "}"
+
+
+# Глобальный реестр метрик процесса
+metrics = MetricsRegistry()
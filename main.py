@@ -1,7 +1,11 @@
+import os
+
 import uvicorn
 
 
 def start_uvicorn():
+    # Локальный запуск "все в одном": фоновые задачи и outbox relay в том же процессе, что и API
+    os.environ.setdefault("PROCESS_API_RUN_BACKGROUND_JOBS", "true")
     uvicorn.run("api.main:app", host="127.0.0.1", port=8082, reload=True)
 
 
@@ -1,4 +1,5 @@
 import asyncio
+from contextlib import nullcontext
 from typing import AsyncGenerator, Generator
 from unittest.mock import AsyncMock, Mock
 
@@ -13,18 +14,27 @@ from testcontainers.postgres import PostgresContainer
 
 from core.application.use_cases.commands.assign_orders import AssignOrdersUseCase
 from core.application.use_cases.commands.create_order import CreateOrderUseCase
+from core.application.use_cases.commands.create_orders_batch import CreateOrdersBatchUseCase
 from core.application.use_cases.commands.move_couriers import MoveCouriersUseCase
+from core.application.use_cases.commands.reposition_idle_couriers import RepositionIdleCouriersUseCase
 from core.application.use_cases.queries.get_all_busy_couriers import GetAllBusyCouriersUseCase
+from core.application.use_cases.queries.get_courier_track import GetCourierTrackUseCase
+from core.application.use_cases.queries.get_dashboard_stats import GetDashboardStatsUseCase
+from core.application.use_cases.queries.get_demand_heatmap import GetDemandHeatmapUseCase
 from core.application.use_cases.queries.get_not_completed_orders import GetNotCompletedOrdersUseCase
 from core.domain.services.dispatch_service import Dispatcher
+from core.domain.services.repositioning_service import RepositioningPlanner
 from core.ports.event_publisher_interface import EventPublisherInterface
+from infrastructure.adapters.in_process import DemandHeatmap
 from infrastructure.adapters.kafka.event_publisher import KafkaEventPublisher
+from infrastructure.adapters.postgres.demand_heatmap_store import PostgresDemandHeatmapStore
 from infrastructure.di.container import Container
-from tests.fixtures.mocks import MockGeoService, TestUnitOfWork
+from tests.fixtures.mocks import MockGeoService, TestUnitOfWork, delivered_message
 
 pytest_plugins = [
     # dicts
     "tests.fixtures.base",
+    "tests.fixtures.geo",
 ]
 
 
@@ -37,7 +47,9 @@ class TestContainer(Container):
     # Переопределяем kafka_producer и event_publisher для тестов
     kafka_producer = providers.Factory(
         lambda: Mock(
-            start=AsyncMock(return_value=None), stop=AsyncMock(return_value=None), send=AsyncMock(return_value=None)
+            start=AsyncMock(return_value=None),
+            stop=AsyncMock(return_value=None),
+            send=AsyncMock(side_effect=delivered_message),
         )
     )
 
@@ -53,6 +65,13 @@ class TestContainer(Container):
         event_publisher=kafka_event_publisher,
     )
 
+    # Тепловая карта спроса читает корзины через тестовую сессию и не кэширует их
+    demand_heatmap_store = providers.Singleton(
+        PostgresDemandHeatmapStore,
+        session_factory=providers.Callable(lambda session: lambda: nullcontext(session), db_session),
+    )
+    demand_heatmap = providers.Singleton(DemandHeatmap, store=demand_heatmap_store, refresh_interval=0)
+
     # Сервисы
     dispatcher = providers.Factory(Dispatcher)
     geo_service = providers.Singleton(MockGeoService)
@@ -69,6 +88,13 @@ class TestContainer(Container):
         uow=unit_of_work,
     )
 
+    reposition_idle_couriers_use_case = providers.Factory(
+        RepositionIdleCouriersUseCase,
+        uow=unit_of_work,
+        heatmap=demand_heatmap,
+        planner=providers.Factory(RepositioningPlanner),
+    )
+
     get_all_busy_couriers_use_case = providers.Factory(
         GetAllBusyCouriersUseCase,
         uow=unit_of_work,
@@ -79,12 +105,33 @@ class TestContainer(Container):
         uow=unit_of_work,
     )
 
+    get_courier_track_use_case = providers.Factory(
+        GetCourierTrackUseCase,
+        uow=unit_of_work,
+    )
+
+    get_dashboard_stats_use_case = providers.Factory(
+        GetDashboardStatsUseCase,
+        uow=unit_of_work,
+    )
+
+    get_demand_heatmap_use_case = providers.Factory(
+        GetDemandHeatmapUseCase,
+        heatmap=demand_heatmap,
+    )
+
     create_order_use_case = providers.Factory(
         CreateOrderUseCase,
         uow=unit_of_work,
         geo_service=geo_service,
     )
 
+    create_orders_batch_use_case = providers.Factory(
+        CreateOrdersBatchUseCase,
+        uow=unit_of_work,
+        geo_service=geo_service,
+    )
+
 
 @pytest.fixture(scope="session")
 def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
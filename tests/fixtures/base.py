@@ -6,6 +6,7 @@ from core.domain.model.courier_aggregate.courier_aggregate import Courier
 from core.domain.model.order_aggregate.order_aggregate import Order
 from core.domain.services.dispatch_service import Dispatcher
 from core.domain.shared_kernel.location import Location
+from tests.fixtures.mocks import FakeUnitOfWork
 
 # TODO: при расширении доменной модели и увеличении фикстур можно делить по доменам
 
@@ -70,3 +71,9 @@ def order_location() -> Location:
 def dispatch_order(order_location: Location, default_order_volume: int) -> Order:
     """Заказ для тестов диспетчера с особой локацией."""
     return Order.create(order_id=uuid4(), location=order_location, volume=default_order_volume)
+
+
+@pytest.fixture
+def fake_uow() -> FakeUnitOfWork:
+    """UoW без базы для тестов адаптеров, работающих через uow_factory."""
+    return FakeUnitOfWork()
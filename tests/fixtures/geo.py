@@ -0,0 +1,52 @@
+import asyncio
+from typing import Callable
+
+import pytest
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
+from grpclib.server import Server
+
+from infrastructure.adapters.grpc.geo import Contract_pb2
+from infrastructure.adapters.grpc.geo.Contract_grpc import GeoBase
+
+
+class FakeGeo(GeoBase):
+    """Локальный Geo сервис: x - длина улицы, y - 1."""
+
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.peers = set()
+
+    async def GetGeolocation(self, stream) -> None:
+        request = await stream.recv_message()
+        self.peers.add(stream.peer.addr())
+        if request.Street == "Несуществующая":
+            raise GRPCError(Status.NOT_FOUND, "Street not found")
+        await asyncio.sleep(self.delay)
+        await stream.send_message(
+            Contract_pb2.GetGeolocationReply(Location=Contract_pb2.Location(x=len(request.Street), y=1))
+        )
+
+
+@pytest.fixture
+def fake_geo() -> Callable[..., FakeGeo]:
+    """Фабрика обработчиков локального Geo сервиса."""
+    return FakeGeo
+
+
+@pytest.fixture
+async def geo_server():
+    """Запуск обработчика на свободном порту. Возвращает порт, серверы останавливаются после теста."""
+    servers = []
+
+    async def start(handler: FakeGeo) -> int:
+        server = Server([handler])
+        await server.start("127.0.0.1", 0)
+        servers.append(server)
+        return server._server.sockets[0].getsockname()[1]
+
+    yield start
+
+    for server in servers:
+        server.close()
+        await server.wait_closed()
@@ -0,0 +1,11 @@
+from uuid import uuid4
+
+from api.adapters.kafka.basket_confirmed.schemas import BasketConfirmedEvent
+
+
+def basket_confirmed_message(basket_id=None, street="Тестовая") -> bytes:
+    """JSON-тело basket.confirmed на основе примера из схемы события."""
+    example = dict(BasketConfirmedEvent.model_config["json_schema_extra"]["example"])
+    example["BasketId"] = str(basket_id or uuid4())
+    example["Address"] = {**example["Address"], "Street": street}
+    return BasketConfirmedEvent.model_validate(example).model_dump_json(by_alias=True).encode("utf-8")
@@ -1,3 +1,6 @@
+import asyncio
+from unittest.mock import AsyncMock
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.domain.shared_kernel.location import Location
@@ -6,6 +9,29 @@ from infrastructure.adapters.postgres.repositories.order_repository import Order
 from infrastructure.adapters.postgres.uow import UnitOfWork
 
 
+def delivered_message(*args, **kwargs) -> asyncio.Future:
+    """Имитирует AIOKafkaProducer.send: возвращает уже завершенную доставку."""
+    delivery = asyncio.get_event_loop().create_future()
+    delivery.set_result(None)
+    return delivery
+
+
+class FakeUnitOfWork:
+    """UoW без базы: репозитории - AsyncMock, commits считает успешно завершенные транзакции."""
+
+    def __init__(self):
+        self.courier_repository = AsyncMock()
+        self.order_repository = AsyncMock()
+        self.commits = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.commits += 1
+
+
 class MockGeoService:
     """Мок-сервис для работы с геолокацией."""
 
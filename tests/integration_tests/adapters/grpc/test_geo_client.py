@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from core.domain.shared_kernel.location import Location
+from core.ports.geo_service_interface import StreetNotFoundError
+from infrastructure.adapters.grpc.geo.client import GRPCGeoService
+
+
+@pytest.mark.asyncio
+async def test_geo_service_reuses_pooled_connections(geo_server, fake_geo):
+    handler = fake_geo()
+    port = await geo_server(handler)
+    geo_service = GRPCGeoService(host="127.0.0.1", port=port, pool_size=2)
+
+    locations = [await geo_service.get_location(street) for street in ["a", "bb", "ccc", "dddd", "eeeee"]]
+    geo_service.close()
+
+    assert locations[1] == Location(x=2, y=1)
+    # Пять запросов прошли по двум соединениям пула
+    assert len(handler.peers) == 2
+
+
+@pytest.mark.asyncio
+async def test_geo_service_applies_call_deadline(geo_server, fake_geo):
+    port = await geo_server(fake_geo(delay=1))
+    geo_service = GRPCGeoService(host="127.0.0.1", port=port, timeout=0.05)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await geo_service.get_location("Тверская")
+    geo_service.close()
+
+
+@pytest.mark.asyncio
+async def test_geo_service_maps_not_found(geo_server, fake_geo):
+    port = await geo_server(fake_geo())
+    geo_service = GRPCGeoService(host="127.0.0.1", port=port)
+
+    with pytest.raises(StreetNotFoundError):
+        await geo_service.get_location("Несуществующая")
+    geo_service.close()
@@ -0,0 +1,64 @@
+import asyncio
+import socket
+
+import pytest
+
+from core.domain.shared_kernel.location import Location
+from core.ports.geo_service_interface import StreetNotFoundError
+from infrastructure.adapters.grpc.geo.client import GRPCGeoService
+from infrastructure.adapters.grpc.geo.resilient import CircuitBreaker, CircuitOpenError, ResilientGeoService
+
+
+def unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_to_second_endpoint(geo_server, fake_geo):
+    primary = GRPCGeoService(host="127.0.0.1", port=await geo_server(fake_geo(delay=1)))
+    hedge = GRPCGeoService(host="127.0.0.1", port=await geo_server(fake_geo()))
+    geo_service = ResilientGeoService(primary, hedge=hedge, hedge_delay=0.02)
+
+    location = await asyncio.wait_for(geo_service.get_location("Тверская"), timeout=0.5)
+    geo_service.close()
+
+    assert location == Location(x=8, y=1)
+
+
+@pytest.mark.asyncio
+async def test_not_found_is_not_hedged_and_keeps_circuit_closed(geo_server, fake_geo):
+    primary = GRPCGeoService(host="127.0.0.1", port=await geo_server(fake_geo()))
+    breaker = CircuitBreaker(failure_threshold=1)
+    geo_service = ResilientGeoService(primary, breaker=breaker)
+
+    with pytest.raises(StreetNotFoundError):
+        await geo_service.get_location("Несуществующая")
+    geo_service.close()
+
+    assert not breaker.is_open
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_failures_and_recovers(geo_server, fake_geo):
+    port = unused_port()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.1)
+    geo_service = ResilientGeoService(GRPCGeoService(host="127.0.0.1", port=port), breaker=breaker)
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            await geo_service.get_location("Тверская")
+    with pytest.raises(CircuitOpenError):
+        await geo_service.get_location("Тверская")
+
+    # Сервис поднялся: после reset_timeout пробный запрос закрывает предохранитель
+    geo_service.close()
+    geo_service = ResilientGeoService(
+        GRPCGeoService(host="127.0.0.1", port=await geo_server(fake_geo())), breaker=breaker
+    )
+    await asyncio.sleep(0.1)
+
+    assert await geo_service.get_location("Тверская") == Location(x=8, y=1)
+    assert not breaker.is_open
+    geo_service.close()
@@ -0,0 +1,73 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from core.domain.events.base import OrderStatusChangedEvent
+from core.domain.model.order_aggregate.order_status import OrderStatus
+from infrastructure.adapters.kafka.event_publisher import KafkaEventPublisher
+from infrastructure.config.kafka import KafkaSettings
+from tests.fixtures.mocks import delivered_message
+
+
+@pytest.fixture
+def kafka_producer():
+    return Mock(send=AsyncMock(side_effect=delivered_message))
+
+
+@pytest.mark.asyncio
+async def test_publisher_keys_order_events_by_order_id(kafka_producer):
+    publisher = KafkaEventPublisher(kafka_producer=kafka_producer)
+    order_id = uuid4()
+
+    await publisher.publish([OrderStatusChangedEvent(order_id=order_id, order_status=OrderStatus.created())])
+
+    kafka_producer.send.assert_awaited_once()
+    topic, _ = kafka_producer.send.call_args.args
+    assert topic == "order.status.changed"
+    assert kafka_producer.send.call_args.kwargs["key"] == str(order_id).encode("utf-8")
+
+
+@pytest.mark.asyncio
+async def test_publisher_waits_for_delivery_of_whole_batch(kafka_producer):
+    loop = asyncio.get_event_loop()
+    deliveries = [loop.create_future() for _ in range(2)]
+    kafka_producer.send = AsyncMock(side_effect=deliveries)
+    publisher = KafkaEventPublisher(kafka_producer=kafka_producer)
+    events = [OrderStatusChangedEvent(order_id=uuid4(), order_status=OrderStatus.created()) for _ in range(2)]
+
+    publish = asyncio.create_task(publisher.publish(events))
+    await asyncio.sleep(0)
+    assert not publish.done()
+
+    deliveries[0].set_result(None)
+    deliveries[1].set_exception(RuntimeError("Broker unavailable"))
+
+    with pytest.raises(RuntimeError, match="Broker unavailable"):
+        await publish
+
+
+def test_producer_config_is_built_from_settings():
+    settings = KafkaSettings(
+        BROKERS="kafka-1:9092, kafka-2:9092",
+        PRODUCER_ACKS="1",
+        PRODUCER_ENABLE_IDEMPOTENCE=False,
+        PRODUCER_COMPRESSION_TYPE="zstd",
+        PRODUCER_LINGER_MS=20,
+    )
+
+    config = settings.get_producer_config()
+
+    assert config["bootstrap_servers"] == ["kafka-1:9092", "kafka-2:9092"]
+    assert config["acks"] == 1
+    assert config["enable_idempotence"] is False
+    assert config["compression_type"] == "zstd"
+    assert config["linger_ms"] == 20
+    assert "security_protocol" not in config
+
+
+def test_idempotent_producer_requires_acks_all():
+    with pytest.raises(ValidationError, match="PRODUCER_ENABLE_IDEMPOTENCE requires PRODUCER_ACKS=all"):
+        KafkaSettings(PRODUCER_ACKS="1", PRODUCER_ENABLE_IDEMPOTENCE=True)
@@ -0,0 +1,33 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from core.domain.model.order_aggregate.order_aggregate import Order
+from core.domain.shared_kernel.location import Location
+from infrastructure.adapters.postgres.assignment_trigger import PostgresAssignmentTrigger
+from infrastructure.adapters.postgres.repositories.order_repository import OrderRepository
+
+
+@pytest.mark.asyncio
+async def test_order_inserted_by_another_process_wakes_trigger(engine: AsyncEngine):
+    trigger = PostgresAssignmentTrigger(engine, debounce=0)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    order = Order.create(order_id=uuid4(), location=Location.create(2, 2), volume=1)
+    try:
+        # Первое ожидание подписывается на канал
+        assert await trigger.wait(timeout=0.01) is False
+
+        # Заказ вставляется через другое соединение, как в процессе API
+        async with session_factory() as session:
+            await OrderRepository(session).add_order(order)
+            await session.commit()
+
+        assert await trigger.wait(timeout=5) is True
+    finally:
+        await trigger.close()
+        async with session_factory() as session:
+            await session.execute(text("DELETE FROM active_order_view WHERE id = :id"), {"id": order.id})
+            await session.execute(text("DELETE FROM orders WHERE id = :id"), {"id": order.id})
+            await session.commit()
@@ -0,0 +1,70 @@
+from contextlib import nullcontext
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.application.use_cases.queries.get_courier_track import GetCourierTrackQuery, TrackPoint
+from core.domain.shared_kernel.location import Location
+from infrastructure.adapters.in_process import CourierPositionHistory
+from infrastructure.adapters.postgres.courier_position_store import PostgresCourierPositionStore, partition_name
+from infrastructure.di.container import Container
+
+
+@pytest.fixture
+def store(db_session_with_commit: AsyncSession) -> PostgresCourierPositionStore:
+    return PostgresCourierPositionStore(session_factory=lambda: nullcontext(db_session_with_commit))
+
+
+@pytest.mark.asyncio
+async def test_partitions_are_created_ahead_and_dropped_after_retention(store: PostgresCourierPositionStore):
+    today = date(2030, 1, 10)
+
+    created = await store.ensure_partitions(today, days_ahead=2)
+    assert created == [partition_name(today + timedelta(days=offset)) for offset in range(3)]
+    assert await store.ensure_partitions(today, days_ahead=2) == []
+
+    dropped = await store.drop_partitions_before(today + timedelta(days=1))
+    assert dropped == [partition_name(today)]
+
+
+@pytest.mark.asyncio
+async def test_courier_track_is_returned_in_time_order(store: PostgresCourierPositionStore, test_container: Container):
+    courier_id = uuid4()
+    started_at = datetime(2030, 1, 10, 12, 0, tzinfo=timezone.utc)
+    await store.ensure_partitions(started_at.date(), days_ahead=0)
+
+    history = CourierPositionHistory(store)
+    for step in (2, 0, 1, 5):
+        history.record(courier_id, Location(x=step + 1, y=1), started_at + timedelta(seconds=step))
+    history.record(uuid4(), Location(x=9, y=9), started_at)
+    assert await history.flush() == 5
+
+    track = await test_container.get_courier_track_use_case().handle(
+        GetCourierTrackQuery(courier_id=courier_id, since=started_at, until=started_at + timedelta(seconds=5))
+    )
+
+    assert track == [
+        TrackPoint(x=step + 1, y=1, recorded_at=started_at + timedelta(seconds=step)) for step in (0, 1, 2)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_default_partition_rows_are_moved_and_expired(
+    store: PostgresCourierPositionStore, db_session_with_commit: AsyncSession
+):
+    day = date(2031, 3, 1)
+    recorded_at = datetime(2031, 3, 1, 12, 0, tzinfo=timezone.utc)
+    await store.append([(uuid4(), 1, 1, recorded_at), (uuid4(), 2, 2, recorded_at - timedelta(days=3))])
+
+    assert await store.ensure_partitions(day, days_ahead=0) == [partition_name(day)]
+    moved = await db_session_with_commit.execute(text(f"SELECT count(*) FROM {partition_name(day)}"))
+    assert moved.scalar_one() == 1
+
+    assert await store.delete_default_before(day) == 1
+    remaining = await db_session_with_commit.execute(
+        text("SELECT count(*) FROM courier_positions_default WHERE recorded_at >= '2031-01-01'")
+    )
+    assert remaining.scalar_one() == 0
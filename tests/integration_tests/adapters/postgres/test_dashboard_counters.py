@@ -0,0 +1,63 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.application.use_cases.queries.get_dashboard_stats import DashboardStats, GetDashboardStatsQuery
+from core.domain.model.courier_aggregate.courier_aggregate import Courier
+from core.domain.model.order_aggregate.order_aggregate import Order
+from core.domain.model.order_aggregate.order_status import OrderStatusEnum
+from core.domain.shared_kernel.location import Location
+from infrastructure.adapters.postgres.projections import RECONCILE_SLOT, reconcile_counters
+from infrastructure.di.container import Container
+
+
+async def get_stats(test_container: Container) -> DashboardStats:
+    return await test_container.get_dashboard_stats_use_case().handle(GetDashboardStatsQuery())
+
+
+@pytest.mark.asyncio
+async def test_counters_follow_order_and_courier_transitions(test_container: Container):
+    courier = Courier.create(name="Courier", speed=2, location=Location.create(1, 1))
+    order = Order.create(order_id=uuid4(), location=Location.create(5, 5), volume=3)
+    async with test_container.unit_of_work() as uow:
+        await uow.courier_repository.add_courier(courier)
+        await uow.order_repository.add_order(order)
+
+    stats = await get_stats(test_container)
+    assert stats.orders_by_status[OrderStatusEnum.CREATED] == 1
+    assert (stats.busy_couriers, stats.free_couriers) == (0, 1)
+
+    async with test_container.unit_of_work() as uow:
+        courier.take_order(order)
+        await uow.courier_repository.update_courier(courier)
+        await uow.order_repository.update_order(order)
+
+    stats = await get_stats(test_container)
+    assert stats.orders_by_status == {
+        OrderStatusEnum.CREATED: 0,
+        OrderStatusEnum.ASSIGNED: 1,
+        OrderStatusEnum.COMPLETED: 0,
+    }
+    assert (stats.busy_couriers, stats.free_couriers) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_reconcile_corrects_drift(test_container: Container, db_session_with_commit: AsyncSession):
+    courier = Courier.create(name="Courier", speed=2, location=Location.create(1, 1))
+    async with test_container.unit_of_work() as uow:
+        await uow.courier_repository.add_courier(courier)
+
+    await db_session_with_commit.execute(
+        text("UPDATE dashboard_counters SET value = value + 5 WHERE name = 'couriers_free'")
+    )
+
+    assert await reconcile_counters(db_session_with_commit) == {"couriers_free": -5}
+    assert await reconcile_counters(db_session_with_commit) == {}
+    assert (await get_stats(test_container)).free_couriers == 1
+    corrections = await db_session_with_commit.execute(
+        text("SELECT value FROM dashboard_counters WHERE name = 'couriers_free' AND slot = :slot"),
+        {"slot": RECONCILE_SLOT},
+    )
+    assert corrections.scalar_one() == -5
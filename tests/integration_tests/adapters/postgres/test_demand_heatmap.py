@@ -0,0 +1,47 @@
+from collections import Counter
+from contextlib import nullcontext
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.application.use_cases.queries.get_demand_heatmap import GetDemandHeatmapQuery
+from core.domain.model.courier_aggregate.courier_aggregate import Courier
+from core.domain.model.order_aggregate.order_aggregate import Order
+from core.domain.shared_kernel.location import Location
+from infrastructure.adapters.postgres.demand_heatmap_store import PostgresDemandHeatmapStore
+from infrastructure.adapters.postgres.projections import apply_heatmap_deltas
+from infrastructure.di.container import Container
+
+
+@pytest.mark.asyncio
+async def test_heatmap_counts_order_transitions_per_cell(test_container: Container):
+    courier = Courier.create(name="Courier", speed=2, location=Location.create(1, 1))
+    orders = [Order.create(order_id=uuid4(), location=Location.create(3, 7), volume=1) for _ in range(2)]
+    async with test_container.unit_of_work() as uow:
+        await uow.courier_repository.add_courier(courier)
+        await uow.order_repository.add_orders(orders)
+
+    async with test_container.unit_of_work() as uow:
+        courier.take_order(orders[0])
+        await uow.courier_repository.update_courier(courier)
+        await uow.order_repository.update_order(orders[0])
+
+    grid = await test_container.get_demand_heatmap_use_case().handle(GetDemandHeatmapQuery(window_minutes=5))
+
+    assert grid.created[6][2] == 2
+    assert grid.assigned[6][2] == 1
+    assert sum(map(sum, grid.created)) == 2
+    assert sum(map(sum, grid.completed)) == 0
+
+
+@pytest.mark.asyncio
+async def test_store_sums_bucket_slots(db_session_with_commit: AsyncSession):
+    bucket = datetime(2031, 3, 1, 12, 0)
+    for slot in range(3):
+        await apply_heatmap_deltas(db_session_with_commit, Counter({(7, "created"): slot + 1}), bucket)
+
+    store = PostgresDemandHeatmapStore(session_factory=lambda: nullcontext(db_session_with_commit))
+
+    assert await store.read_since(bucket) == [(bucket, 7, 6, 0, 0)]
@@ -0,0 +1,23 @@
+import time
+from contextlib import nullcontext
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.domain.shared_kernel.location import Location
+from infrastructure.adapters.geo_cache import GeoCacheEntry
+from infrastructure.adapters.postgres.geo_cache_store import PostgresGeoCacheStore
+
+
+@pytest.mark.asyncio
+async def test_geo_cache_store_roundtrip(db_session_with_commit: AsyncSession):
+    store = PostgresGeoCacheStore(session_factory=lambda: nullcontext(db_session_with_commit))
+    expires_at = int(time.time()) + 60
+
+    await store.put("тверская", GeoCacheEntry(Location(x=1, y=2), expires_at))
+    await store.put("несуществующая", GeoCacheEntry(None, expires_at))
+    await store.put("тверская", GeoCacheEntry(Location(x=3, y=4), expires_at))
+
+    assert await store.get("тверская") == GeoCacheEntry(Location(x=3, y=4), expires_at)
+    assert await store.get("несуществующая") == GeoCacheEntry(None, expires_at)
+    assert await store.get("арбат") is None
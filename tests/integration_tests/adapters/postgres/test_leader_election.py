@@ -0,0 +1,35 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from infrastructure.adapters.postgres.leader_election import AdvisoryLockLeaderElection
+
+
+@pytest.mark.asyncio
+async def test_only_one_replica_is_leader_per_job(engine: AsyncEngine):
+    first = AdvisoryLockLeaderElection(engine, "assign_orders")
+    second = AdvisoryLockLeaderElection(engine, "assign_orders")
+    other_job = AdvisoryLockLeaderElection(engine, "move_couriers")
+
+    assert await first.is_leader()
+    assert await first.is_leader()
+    assert not await second.is_leader()
+    assert await other_job.is_leader()
+
+    await first.release()
+    await other_job.release()
+    assert await second.is_leader()
+    await second.release()
+
+
+@pytest.mark.asyncio
+async def test_leadership_fails_over_when_connection_drops(engine: AsyncEngine):
+    leader = AdvisoryLockLeaderElection(engine, "assign_orders")
+    follower = AdvisoryLockLeaderElection(engine, "assign_orders")
+    assert await leader.is_leader()
+
+    # Разрыв соединения лидера: Postgres снимает блокировку
+    await leader._connection.invalidate()
+
+    assert await follower.is_leader()
+    assert not await leader.is_leader()
+    await follower.release()
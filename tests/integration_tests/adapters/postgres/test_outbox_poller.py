@@ -3,7 +3,7 @@ from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import select, text
 
 from core.domain.events.base import BaseDomainEvent, OrderStatusChangedEvent
 from core.domain.model.order_aggregate.order_status import OrderStatus
@@ -12,6 +12,7 @@ from infrastructure.adapters.postgres.outbox.outbox_poller import OutboxPollingP
 from infrastructure.adapters.postgres.outbox.outbox_publisher import OutboxPublisher
 from infrastructure.di.container import Container
 from infrastructure.events.integration_events import IntegrationOrderStatusChangedEvent
+from infrastructure.metrics import metrics
 
 
 @pytest.fixture
@@ -132,3 +133,77 @@ async def test_outbox_poller_processes_multiple_events(test_container: Container
             assert payload.order_status == OrderStatus.created()
             assert event.is_sent
             assert event.sent_at is not None
+
+
+@pytest.mark.asyncio
+async def test_outbox_poller_measures_lag_in_database_time_zone(test_container: Container, mock_event_publisher):
+    # Arrange: created_at пишется во времени сессии, отличном от UTC
+    uow = test_container.unit_of_work()
+    async with uow as uow:
+        await uow.session.execute(text("SET LOCAL TIME ZONE 'Asia/Vladivostok'"))
+        events: list[BaseDomainEvent] = [OrderStatusChangedEvent(order_id=uuid4(), order_status=OrderStatus.created())]
+        await OutboxPublisher().publish(events, session=uow.session)
+
+    async with uow as uow:
+        await uow.session.execute(text("SET LOCAL TIME ZONE 'Asia/Vladivostok'"))
+        poller = OutboxPollingPublisher(uow=uow, event_publisher=mock_event_publisher, poll_interval=0.1, batch_size=10)
+
+        # Act
+        await poller._poll_once()
+
+    # Assert
+    assert 0 <= metrics.snapshot()["outbox_relay_lag_seconds"] < 60
+
+
+@pytest.mark.asyncio
+async def test_outbox_poller_returns_zero_when_outbox_is_empty(test_container: Container, mock_event_publisher):
+    async with test_container.unit_of_work() as uow:
+        poller = OutboxPollingPublisher(uow=uow, event_publisher=mock_event_publisher, poll_interval=0.1, batch_size=10)
+
+        published = await poller._poll_once()
+
+        assert published == 0
+        mock_event_publisher.publish.assert_not_called()
+
+
+def test_outbox_poller_polls_without_delay_while_batches_are_full(mock_event_publisher):
+    poller = OutboxPollingPublisher(uow=AsyncMock(), event_publisher=mock_event_publisher, poll_interval=0.1)
+
+    assert poller._next_delay(published=100, batch_size=100) == 0.0
+
+
+def test_outbox_poller_backs_off_exponentially_when_idle_or_failing(mock_event_publisher):
+    poller = OutboxPollingPublisher(
+        uow=AsyncMock(), event_publisher=mock_event_publisher, poll_interval=0.1, max_poll_interval=0.5
+    )
+
+    delays = [poller._next_delay(published=0, batch_size=100) for _ in range(3)]
+    delays.append(poller._next_delay(published=None, batch_size=100))
+
+    assert delays == [0.2, 0.4, 0.5, 0.5]
+    # Частичная пачка сбрасывает интервал к минимальному
+    assert poller._next_delay(published=5, batch_size=100) == 0.1
+
+
+def test_outbox_poller_adjusts_batch_size_by_publish_latency(mock_event_publisher):
+    poller = OutboxPollingPublisher(
+        uow=AsyncMock(),
+        event_publisher=mock_event_publisher,
+        batch_size=100,
+        min_batch_size=25,
+        max_batch_size=200,
+        target_publish_latency=0.5,
+    )
+
+    poller._adjust_batch_size(published=100, publish_latency=0.1)
+    assert poller.batch_size == 200
+
+    poller._adjust_batch_size(published=200, publish_latency=0.1)
+    assert poller.batch_size == 200
+
+    poller._adjust_batch_size(published=200, publish_latency=1.0)
+    assert poller.batch_size == 100
+
+    for _ in range(3):
+        poller._adjust_batch_size(published=100, publish_latency=1.0)
+    assert poller.batch_size == 25
@@ -0,0 +1,62 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.domain.model.courier_aggregate.courier_aggregate import Courier
+from core.domain.model.order_aggregate.order_aggregate import Order
+from core.domain.shared_kernel.location import Location
+from infrastructure.adapters.postgres.models.projections import ActiveOrderViewModel, CourierViewModel
+from infrastructure.adapters.postgres.projections import rebuild_projections
+from infrastructure.di.container import Container
+
+
+@pytest.mark.asyncio
+async def test_projections_follow_repository_writes(test_container: Container, db_session_with_commit: AsyncSession):
+    courier = Courier.create(name="Courier", speed=2, location=Location.create(1, 1))
+    order = Order.create(order_id=uuid4(), location=Location.create(5, 5), volume=3)
+
+    async with test_container.unit_of_work() as uow:
+        await uow.courier_repository.add_courier(courier)
+        await uow.order_repository.add_order(order)
+
+    async with test_container.unit_of_work() as uow:
+        courier.take_order(order)
+        await uow.courier_repository.update_courier(courier)
+        await uow.order_repository.update_order(order)
+        await uow.courier_repository.update_locations({courier.id: Location(x=4, y=1)})
+
+    courier_view = await db_session_with_commit.get(CourierViewModel, courier.id, populate_existing=True)
+    assert (courier_view.x, courier_view.y, courier_view.is_busy) == (4, 1, True)
+    assert courier_view.free_volume == 0
+
+    order_view = await db_session_with_commit.get(ActiveOrderViewModel, order.id, populate_existing=True)
+    assert order_view.courier_id == courier.id
+
+    async with test_container.unit_of_work() as uow:
+        courier.location = order.location
+        courier.complete_order(order)
+        await uow.order_repository.update_order(order)
+        await uow.courier_repository.update_courier(courier)
+
+    assert (await db_session_with_commit.execute(select(ActiveOrderViewModel.id))).all() == []
+    courier_view = await db_session_with_commit.get(CourierViewModel, courier.id, populate_existing=True)
+    assert courier_view.is_busy is False
+
+
+@pytest.mark.asyncio
+async def test_rebuild_restores_projections_from_write_tables(
+    test_container: Container, db_session_with_commit: AsyncSession
+):
+    courier = Courier.create(name="Courier", speed=2, location=Location.create(2, 3))
+    order = Order.create(order_id=uuid4(), location=Location.create(5, 5), volume=3)
+    async with test_container.unit_of_work() as uow:
+        await uow.courier_repository.add_courier(courier)
+        await uow.order_repository.add_order(order)
+
+    await db_session_with_commit.execute(text("TRUNCATE courier_view, active_order_view"))
+
+    assert await rebuild_projections(db_session_with_commit) == (1, 1)
+    courier_view = await db_session_with_commit.get(CourierViewModel, courier.id, populate_existing=True)
+    assert (courier_view.x, courier_view.y, courier_view.is_busy, courier_view.free_volume) == (2, 3, False, 10)
@@ -60,7 +60,7 @@ async def test_uow_does_not_publish_events_on_rollback(test_container: Container
 
 
 @pytest.mark.asyncio
-async def test_uow_publishes_multiple_events_in_order(test_container: Container, mock_event_publisher):
+async def test_uow_coalesces_order_events_within_transaction(test_container: Container, mock_event_publisher):
     # Arrange
     test_container.kafka_event_publisher.override(mock_event_publisher)
     order_id = uuid4()
@@ -75,7 +75,7 @@ async def test_uow_publishes_multiple_events_in_order(test_container: Container,
         )
 
         await uow.courier_repository.add_courier(courier)
-        # Создаем заказ и назначаем курьера - должно быть два события
+        # Создаем заказ и назначаем курьера - публикуется только итоговое состояние заказа
         order = Order.create(order_id=order_id, location=Location.create(x=5, y=5), volume=1)
         await uow.order_repository.add_order(order)
 
@@ -85,16 +85,44 @@ async def test_uow_publishes_multiple_events_in_order(test_container: Container,
     # Assert
     mock_event_publisher.publish.assert_called_once()
     published_events = mock_event_publisher.publish.call_args[0][0]
-    assert len(published_events) == 2
-
-    # Проверяем первое событие - создание заказа
-    first_event = published_events[0]
-    assert isinstance(first_event, OrderStatusChangedEvent)
-    assert first_event.order_id == order_id
-    assert first_event.order_status == OrderStatus.created()
-
-    # Проверяем второе событие - назначение курьера
-    second_event = published_events[1]
-    assert isinstance(second_event, OrderStatusChangedEvent)
-    assert second_event.order_id == order_id
-    assert second_event.order_status == OrderStatus.assigned()
+    assert len(published_events) == 1
+
+    event = published_events[0]
+    assert isinstance(event, OrderStatusChangedEvent)
+    assert event.order_id == order_id
+    assert event.order_status == OrderStatus.assigned()
+    assert event.previous_status is None
+
+
+@pytest.mark.asyncio
+async def test_uow_preserves_order_between_aggregates(test_container: Container, mock_event_publisher):
+    # Arrange
+    test_container.kafka_event_publisher.override(mock_event_publisher)
+    first_order = Order.create(order_id=uuid4(), location=Location.create(x=5, y=5), volume=1)
+    second_order = Order.create(order_id=uuid4(), location=Location.create(x=6, y=6), volume=1)
+
+    async with test_container.unit_of_work() as uow:
+        await uow.order_repository.add_order(first_order)
+        await uow.order_repository.add_order(second_order)
+
+    mock_event_publisher.publish.reset_mock()
+
+    # Act
+    async with test_container.unit_of_work() as uow:
+        courier = Courier.create(name="Test Courier", location=Location.create(x=1, y=1), speed=10)
+        await uow.courier_repository.add_courier(courier)
+
+        # Обновление без смены статуса не порождает событие
+        await uow.order_repository.update_order(first_order)
+
+        second_order.assign(courier.id)
+        await uow.order_repository.update_order(second_order)
+
+        first_order.assign(courier.id)
+        await uow.order_repository.update_order(first_order)
+
+    # Assert
+    published_events = mock_event_publisher.publish.call_args[0][0]
+    assert [event.order_id for event in published_events] == [second_order.id, first_order.id]
+    assert all(event.previous_status == OrderStatus.created() for event in published_events)
+    assert all(event.order_status == OrderStatus.assigned() for event in published_events)
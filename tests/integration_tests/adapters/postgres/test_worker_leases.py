@@ -0,0 +1,44 @@
+from contextlib import nullcontext
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.adapters.postgres.worker_leases import PostgresWorkerLeases
+
+
+@pytest.mark.asyncio
+async def test_worker_leases_count_live_workers(db_session_with_commit: AsyncSession):
+    def session_factory():
+        return nullcontext(db_session_with_commit)
+
+    first = PostgresWorkerLeases(session_factory, group="move_couriers", ttl=60)
+    second = PostgresWorkerLeases(session_factory, group="move_couriers", ttl=60)
+    other_group = PostgresWorkerLeases(session_factory, group="other", ttl=60)
+
+    assert await first.renew() == 1
+    assert await second.renew() == 2
+    assert await first.renew() == 2
+    assert await other_group.renew() == 1
+
+    await second.release()
+    assert await first.renew() == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_not_counted(db_session_with_commit: AsyncSession):
+    def session_factory():
+        return nullcontext(db_session_with_commit)
+
+    alive = PostgresWorkerLeases(session_factory, group="move_couriers", ttl=60)
+    crashed = PostgresWorkerLeases(session_factory, group="move_couriers", ttl=60)
+    await crashed.renew()
+    assert await alive.renew() == 2
+
+    # Упавший воркер перестал продлевать аренду
+    await db_session_with_commit.execute(
+        text("UPDATE worker_leases SET expires_at = now() - interval '1 second' WHERE worker_id = :worker_id"),
+        {"worker_id": crashed.worker_id},
+    )
+
+    assert await alive.renew() == 1
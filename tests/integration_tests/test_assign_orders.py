@@ -34,9 +34,10 @@ async def test_assign_orders_job(test_container: Container):
         await uow.commit()
 
     # Act
-    await assign_orders.handle(AssignOrdersCommand())
+    assigned = await assign_orders.handle(AssignOrdersCommand())
 
     # Assert
+    assert assigned == 1
     async with uow:
         # Order should be assigned to courier
         updated_order = await uow.order_repository.get_order(order.id)
@@ -0,0 +1,54 @@
+from typing import AsyncGenerator, Callable
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from api.adapters.kafka.basket_confirmed.pipeline import BasketConfirmedIngestionPipeline
+from core.application.use_cases.commands.create_orders_batch import CreateOrdersBatchUseCase
+from infrastructure.adapters.postgres.models.order_aggregate import OrderModel
+from infrastructure.adapters.postgres.outbox.outbox_publisher import OutboxPublisher
+from infrastructure.adapters.postgres.projections import read_counters
+from infrastructure.adapters.postgres.uow import UnitOfWork
+from tests.fixtures.messages import basket_confirmed_message
+from tests.fixtures.mocks import MockGeoService
+
+
+@pytest.fixture
+async def session_factory(engine: AsyncEngine) -> AsyncGenerator[Callable[[], AsyncSession], None]:
+    """Настоящие сессии на каждый UoW: данные фиксируются и удаляются после теста."""
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    yield session_factory
+    async with session_factory() as session:
+        await session.execute(
+            text("TRUNCATE orders, active_order_view, outbox_events, dashboard_counters, demand_heatmap CASCADE")
+        )
+        await session.commit()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("shared_use_case", [False, True])
+async def test_pipeline_commits_orders_of_every_flush(session_factory, shared_use_case: bool):
+    def create_use_case() -> CreateOrdersBatchUseCase:
+        return CreateOrdersBatchUseCase(
+            uow=UnitOfWork(session_factory=session_factory, event_publisher=OutboxPublisher()),
+            geo_service=MockGeoService(),
+        )
+
+    # Общий use case повторно входит в один UoW: репозитории не должны писать через закрытую сессию
+    shared = create_use_case()
+    pipeline = BasketConfirmedIngestionPipeline(
+        geo_service=MockGeoService(),
+        create_orders_batch_use_case_factory=(lambda: shared) if shared_use_case else create_use_case,
+        geocode_concurrency=1,
+        persist_batch_size=1,
+    )
+    basket_ids = [uuid4() for _ in range(2)]
+
+    assert await pipeline.process([basket_confirmed_message(basket_id) for basket_id in basket_ids]) == 2
+
+    async with session_factory() as session:
+        order_ids = await session.scalars(select(OrderModel.id).where(OrderModel.id.in_(basket_ids)))
+        assert set(order_ids) == set(basket_ids)
+        assert (await read_counters(session))["orders_created"] == 2
@@ -140,3 +140,51 @@ async def test_get_free_couriers(db_session_with_commit):
     assert courier1.id in courier_ids
     assert courier2.id in courier_ids
     assert courier3.id not in courier_ids
+
+
+@pytest.mark.asyncio
+async def test_update_locations(db_session_with_commit):
+    """Тест пакетного обновления местоположений курьеров."""
+    # Arrange
+    repository = CourierRepository(db_session_with_commit)
+    couriers = [Courier.create(name=f"Test Courier {i}", location=Location.create(x=1, y=1), speed=1) for i in range(3)]
+    for courier in couriers:
+        await repository.add_courier(courier)
+
+    # Act
+    await repository.update_locations(
+        {couriers[0].id: Location.create(x=2, y=1), couriers[1].id: Location.create(x=5, y=7)}
+    )
+
+    # Assert
+    updated = {courier.id: courier for courier in await repository.get_couriers([c.id for c in couriers])}
+    assert updated[couriers[0].id].location == Location.create(x=2, y=1)
+    assert updated[couriers[1].id].location == Location.create(x=5, y=7)
+    assert updated[couriers[2].id].location == Location.create(x=1, y=1)
+
+
+@pytest.mark.asyncio
+async def test_update_free_courier_locations_skips_busy_couriers(db_session_with_commit):
+    """Тест обновления местоположений только свободных курьеров."""
+    # Arrange
+    repository = CourierRepository(db_session_with_commit)
+    free_courier = Courier.create(name="Free Courier", location=Location.create(x=1, y=1), speed=1)
+    busy_courier = Courier.create(name="Busy Courier", location=Location.create(x=1, y=1), speed=1)
+    order = await OrderRepository(db_session_with_commit).add_order(
+        Order.create(order_id=uuid4(), location=Location.create(x=8, y=8), volume=5)
+    )
+    await repository.add_courier(free_courier)
+    await repository.add_courier(busy_courier)
+    busy_courier.take_order(order)
+    await repository.update_courier(busy_courier)
+
+    # Act
+    updated = await repository.update_free_courier_locations(
+        {free_courier.id: Location.create(x=2, y=1), busy_courier.id: Location.create(x=2, y=1)}
+    )
+
+    # Assert
+    assert updated == {free_courier.id}
+    couriers = {courier.id: courier for courier in await repository.get_couriers([free_courier.id, busy_courier.id])}
+    assert couriers[free_courier.id].location == Location.create(x=2, y=1)
+    assert couriers[busy_courier.id].location == Location.create(x=1, y=1)
@@ -1,3 +1,4 @@
+from unittest.mock import Mock
 from uuid import uuid4
 
 import pytest
@@ -25,3 +26,18 @@ async def test_create_order_persisted_to_database(test_container: Container):
         assert saved_order.volume == 25
         assert saved_order.order_status.name == OrderStatusEnum.CREATED
         assert saved_order.courier_id is None
+
+
+@pytest.mark.asyncio
+async def test_create_order_wakes_assignment(test_container: Container):
+    """Тест что созданный заказ будит назначение заказов."""
+    # Arrange
+    assignment_trigger = Mock()
+    create_order_use_case = test_container.create_order_use_case(assignment_trigger=assignment_trigger)
+    command = CreateOrderCommand(basket_id=uuid4(), street="Test Address", volume=5)
+
+    # Act
+    await create_order_use_case.handle(command)
+
+    # Assert
+    assignment_trigger.notify.assert_called_once()
@@ -0,0 +1,75 @@
+from uuid import uuid4
+
+import pytest
+
+from core.application.use_cases.commands.create_order import CreateOrderCommand
+from core.application.use_cases.commands.create_orders_batch import CreateOrdersBatchCommand
+from core.domain.model.order_aggregate.order_aggregate import Order
+from core.domain.shared_kernel.location import Location
+from infrastructure.di.container import Container
+
+
+@pytest.mark.asyncio
+async def test_create_orders_batch_persists_new_orders(test_container: Container):
+    """Тест что пачка заказов сохраняется одной транзакцией."""
+    # Arrange
+    uow = test_container.unit_of_work()
+    use_case = test_container.create_orders_batch_use_case()
+    commands = [CreateOrderCommand(basket_id=uuid4(), street=f"Street {i}", volume=i + 1) for i in range(3)]
+
+    # Act
+    created = await use_case.handle(CreateOrdersBatchCommand(orders=commands))
+
+    # Assert
+    assert created == 3
+    async with uow:
+        existing_ids = await uow.order_repository.get_existing_order_ids([command.basket_id for command in commands])
+        assert existing_ids == {command.basket_id for command in commands}
+
+
+@pytest.mark.asyncio
+async def test_create_orders_batch_skips_duplicates_and_existing_orders(test_container: Container):
+    """Тест что повторы внутри пачки и уже существующие заказы не создаются повторно."""
+    # Arrange
+    uow = test_container.unit_of_work()
+    use_case = test_container.create_orders_batch_use_case()
+    existing_order = Order.create(order_id=uuid4(), location=Location.create(x=1, y=1), volume=1)
+    async with uow:
+        await uow.order_repository.add_order(existing_order)
+
+    new_basket_id = uuid4()
+    commands = [
+        CreateOrderCommand(basket_id=existing_order.id, street="Existing", volume=1),
+        CreateOrderCommand(basket_id=new_basket_id, street="New", volume=2),
+        CreateOrderCommand(basket_id=new_basket_id, street="New", volume=2),
+    ]
+
+    # Act
+    created = await use_case.handle(CreateOrdersBatchCommand(orders=commands))
+
+    # Assert
+    assert created == 1
+    async with uow:
+        new_order = await uow.order_repository.get_order(new_basket_id)
+        assert new_order is not None
+        assert new_order.volume == 2
+
+
+@pytest.mark.asyncio
+async def test_add_orders_ignores_conflicting_ids(test_container: Container):
+    """Тест что массовая вставка пропускает заказы с существующим id и не публикует для них события."""
+    # Arrange
+    uow = test_container.unit_of_work()
+    existing_order = Order.create(order_id=uuid4(), location=Location.create(x=1, y=1), volume=1)
+    new_order = Order.create(order_id=uuid4(), location=Location.create(x=2, y=2), volume=1)
+    async with uow:
+        await uow.order_repository.add_order(existing_order)
+
+    # Act
+    async with uow:
+        added_orders = await uow.order_repository.add_orders([existing_order, new_order])
+        events = uow.order_repository.events[:]
+
+    # Assert
+    assert [order.id for order in added_orders] == [new_order.id]
+    assert [event.order_id for event in events] == [new_order.id]
@@ -1,8 +1,9 @@
+from unittest.mock import Mock
 from uuid import uuid4
 
 import pytest
 
-from core.application.use_cases.commands.move_couriers import MoveCouriersCommand
+from core.application.use_cases.commands.move_couriers import MoveCouriersCommand, MoveCouriersUseCase
 from core.domain.model.courier_aggregate.courier_aggregate import Courier
 from core.domain.model.order_aggregate.order_aggregate import Order
 from core.domain.model.order_aggregate.order_status import OrderStatus
@@ -35,9 +36,10 @@ async def test_move_couriers_job(test_container: Container):
         await uow.commit()
 
     # Act
-    await move_couriers.handle(MoveCouriersCommand())
+    moved = await move_couriers.handle(MoveCouriersCommand())
 
     # Assert
+    assert moved == 1
     async with uow:
         # Check courier moved towards order
         updated_courier = await uow.courier_repository.get_courier(courier.id)
@@ -87,3 +89,25 @@ async def test_move_couriers_job_completes_order_when_arrived(test_container: Co
         updated_order = await uow.order_repository.get_order(order.id)
         assert updated_order is not None
         assert updated_order.order_status == OrderStatus.completed()
+
+
+@pytest.mark.asyncio
+async def test_move_couriers_records_position_history(test_container: Container):
+    uow = test_container.unit_of_work()
+    position_history = Mock()
+    move_couriers = MoveCouriersUseCase(uow=uow, position_history=position_history)
+
+    async with uow:
+        courier = Courier.create(name="Test Courier", speed=1, location=Location.create(x=1, y=1))
+        await uow.courier_repository.add_courier(courier)
+        order = Order.create(order_id=uuid4(), location=Location.create(x=5, y=5), volume=1)
+        order.assign(courier.id)
+        await uow.order_repository.add_order(order)
+        await uow.commit()
+
+    await move_couriers.handle(MoveCouriersCommand())
+
+    position_history.record.assert_called_once()
+    courier_id, location, _ = position_history.record.call_args.args
+    assert courier_id == courier.id
+    assert location == Location.create(x=2, y=1)
@@ -169,6 +169,29 @@ async def test_get_all_assigned_orders(db_session_with_commit):
         assert order.courier_id == courier.id
 
 
+@pytest.mark.asyncio
+async def test_get_all_assigned_orders_by_shard(db_session_with_commit):
+    """Тест разбиения назначенных заказов на шарды по курьеру."""
+    # Arrange
+    repository = OrderRepository(db_session_with_commit)
+    courier_repository = CourierRepository(db_session_with_commit)
+    order_ids_by_courier = {}
+    for i in range(8):
+        courier = Courier.create(name=f"Courier {i}", location=Location.create(x=1, y=1), speed=1)
+        await courier_repository.add_courier(courier)
+        order = Order.create(order_id=uuid4(), location=Location.create(x=5, y=5), volume=1)
+        order.assign(courier.id)
+        await repository.add_order(order)
+        order_ids_by_courier[courier.id] = order.id
+
+    # Act
+    shards = [await repository.get_all_assigned_orders(shard, shard_count=3) for shard in range(3)]
+
+    # Assert: шарды не пересекаются и вместе покрывают все заказы
+    sharded_ids = [order.id for shard in shards for order in shard]
+    assert sorted(sharded_ids) == sorted(order_ids_by_courier.values())
+
+
 @pytest.mark.asyncio
 async def test_get_order_not_found(db_session_with_commit):
     """Тест получения несуществующего заказа."""
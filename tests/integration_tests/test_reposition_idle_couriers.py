@@ -0,0 +1,31 @@
+from uuid import uuid4
+
+import pytest
+
+from core.application.use_cases.commands.reposition_idle_couriers import RepositionIdleCouriersCommand
+from core.domain.model.courier_aggregate.courier_aggregate import Courier
+from core.domain.model.order_aggregate.order_aggregate import Order
+from core.domain.shared_kernel.location import Location
+from infrastructure.di.container import Container
+
+
+@pytest.mark.asyncio
+async def test_idle_courier_moves_towards_demand_hotspot(test_container: Container):
+    idle_courier = Courier.create(name="Idle Courier", speed=2, location=Location.create(1, 1))
+    reserve_courier = Courier.create(name="Reserve Courier", speed=2, location=Location.create(1, 10))
+    hotspot = Location.create(9, 1)
+    async with test_container.unit_of_work() as uow:
+        await uow.courier_repository.add_courier(idle_courier)
+        await uow.courier_repository.add_courier(reserve_courier)
+        await uow.order_repository.add_orders(
+            [Order.create(order_id=uuid4(), location=hotspot, volume=1) for _ in range(4)]
+        )
+
+    moved = await test_container.reposition_idle_couriers_use_case().handle(
+        RepositionIdleCouriersCommand(reserve_fraction=0.5)
+    )
+
+    assert moved == 1
+    async with test_container.unit_of_work() as uow:
+        assert (await uow.courier_repository.get_courier(idle_courier.id)).location == Location.create(3, 1)
+        assert (await uow.courier_repository.get_courier(reserve_courier.id)).location == Location.create(1, 10)
@@ -0,0 +1,110 @@
+import asyncio
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from api.adapters.kafka.basket_confirmed.codec import decode_basket_confirmed
+from api.adapters.kafka.basket_confirmed.pipeline import BasketConfirmedIngestionPipeline
+from core.domain.shared_kernel.location import Location
+from tests.fixtures.messages import basket_confirmed_message
+
+
+@pytest.fixture
+def use_case():
+    async def handle(command):
+        return len(command.orders)
+
+    return AsyncMock(handle=AsyncMock(side_effect=handle), get_existing_order_ids=AsyncMock(return_value=set()))
+
+
+@pytest.mark.asyncio
+async def test_pipeline_geocodes_concurrently(use_case):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def get_location(street: str) -> Location:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return Location.create(1, 1)
+
+    pipeline = BasketConfirmedIngestionPipeline(
+        geo_service=AsyncMock(get_location=AsyncMock(side_effect=get_location)),
+        create_orders_batch_use_case_factory=lambda: use_case,
+        geocode_concurrency=4,
+    )
+
+    created = await pipeline.process([basket_confirmed_message() for _ in range(8)])
+
+    assert created == 8
+    assert max_in_flight == 4
+    persisted = [order for call in use_case.handle.call_args_list for order in call.args[0].orders]
+    assert all(order.location == Location.create(1, 1) for order in persisted)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_persists_in_batches_and_skips_duplicates(use_case):
+    pipeline = BasketConfirmedIngestionPipeline(
+        geo_service=AsyncMock(get_location=AsyncMock(return_value=Location.create(2, 2))),
+        create_orders_batch_use_case_factory=lambda: use_case,
+        geocode_concurrency=2,
+        persist_batch_size=2,
+    )
+    duplicated_basket_id = uuid4()
+    messages = [basket_confirmed_message(duplicated_basket_id) for _ in range(2)]
+    messages += [basket_confirmed_message() for _ in range(4)]
+
+    created = await pipeline.process(messages)
+
+    assert created == 5
+    assert all(len(call.args[0].orders) <= 2 for call in use_case.handle.call_args_list)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_does_not_geocode_existing_orders(use_case):
+    geo_service = AsyncMock(get_location=AsyncMock(return_value=Location.create(3, 3)))
+    pipeline = BasketConfirmedIngestionPipeline(
+        geo_service=geo_service, create_orders_batch_use_case_factory=lambda: use_case
+    )
+    existing_basket_ids = [uuid4() for _ in range(3)]
+    use_case.get_existing_order_ids.return_value = set(existing_basket_ids)
+    messages = [basket_confirmed_message(basket_id) for basket_id in existing_basket_ids]
+    messages.append(basket_confirmed_message())
+
+    created = await pipeline.process(messages)
+
+    assert created == 1
+    assert geo_service.get_location.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_pipeline_propagates_geocoding_errors(use_case):
+    pipeline = BasketConfirmedIngestionPipeline(
+        geo_service=AsyncMock(get_location=AsyncMock(side_effect=RuntimeError("Geo service unavailable"))),
+        create_orders_batch_use_case_factory=lambda: use_case,
+        geocode_concurrency=2,
+        queue_size=1,
+    )
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        await pipeline.process([basket_confirmed_message() for _ in range(10)])
+
+    assert exc_info.group_contains(RuntimeError, match="Geo service unavailable")
+    use_case.handle.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_pipeline_skips_messages_the_decoder_rejects(use_case):
+    def decoder(message: bytes):
+        return None if message == b"invalid" else decode_basket_confirmed(message)
+
+    pipeline = BasketConfirmedIngestionPipeline(
+        geo_service=AsyncMock(get_location=AsyncMock(return_value=Location.create(2, 2))),
+        create_orders_batch_use_case_factory=lambda: use_case,
+        decoder=decoder,
+    )
+
+    assert await pipeline.process([b"invalid", basket_confirmed_message(), b"invalid"]) == 1
@@ -0,0 +1,134 @@
+import json
+from uuid import uuid4
+
+import pytest
+from aiokafka import ConsumerRecord
+from pydantic import ValidationError
+
+from api.adapters.kafka.basket_confirmed import Contract_pb2 as basket_confirmed_pb2
+from api.adapters.kafka.basket_confirmed.codec import (
+    decode_basket_confirmed,
+    decode_basket_confirmed_record,
+    decode_valid_basket_confirmed_record,
+)
+from core.domain.model.order_aggregate.order_status import OrderStatus
+from infrastructure.adapters.kafka.codec import (
+    JSON_CONTENT_TYPE,
+    PROTOBUF_CONTENT_TYPE,
+    encode_integration_event,
+    get_content_type,
+)
+from infrastructure.adapters.kafka.order_status_changed import Contract_pb2 as order_status_changed_pb2
+from infrastructure.events.integration_events import IntegrationOrderStatusChangedEvent
+from infrastructure.metrics import metrics
+from tests.fixtures.messages import basket_confirmed_message
+
+
+def make_record(value: bytes, headers: list[tuple[str, bytes]]) -> ConsumerRecord:
+    return ConsumerRecord(
+        topic="basket.confirmed",
+        partition=0,
+        offset=0,
+        timestamp=0,
+        timestamp_type=0,
+        key=None,
+        value=value,
+        checksum=None,
+        serialized_key_size=0,
+        serialized_value_size=len(value),
+        headers=headers,
+    )
+
+
+def test_decode_basket_confirmed_protobuf():
+    basket_id = uuid4()
+    body = basket_confirmed_pb2.BasketConfirmedIntegrationEvent(
+        basketId=str(basket_id),
+        address=basket_confirmed_pb2.Address(street="Тверская"),
+        Volume=5,
+    ).SerializeToString()
+
+    command = decode_basket_confirmed(body, PROTOBUF_CONTENT_TYPE)
+
+    assert command.basket_id == basket_id
+    assert command.street == "Тверская"
+    assert command.volume == 5
+
+
+def test_decode_record_selects_format_by_header():
+    basket_id = uuid4()
+    json_body = basket_confirmed_message(basket_id, street="Тверская")
+    from_json = decode_basket_confirmed_record(make_record(json_body, []), JSON_CONTENT_TYPE)
+
+    protobuf_body = basket_confirmed_pb2.BasketConfirmedIntegrationEvent(
+        basketId=str(basket_id), address=basket_confirmed_pb2.Address(street="Тверская"), Volume=from_json.volume
+    ).SerializeToString()
+    from_protobuf = decode_basket_confirmed_record(
+        make_record(protobuf_body, [("content-type", b"application/x-protobuf")]), JSON_CONTENT_TYPE
+    )
+
+    assert from_json == from_protobuf
+
+
+def test_get_content_type_ignores_parameters_and_empty_header():
+    assert get_content_type([("Content-Type", b"application/json; charset=utf-8")], "x") == JSON_CONTENT_TYPE
+    assert get_content_type([("content-type", b"")], PROTOBUF_CONTENT_TYPE) == PROTOBUF_CONTENT_TYPE
+
+
+@pytest.mark.parametrize("order_status", [OrderStatus.created(), OrderStatus.assigned(), OrderStatus.completed()])
+def test_order_status_changed_protobuf_roundtrip(order_status):
+    event = IntegrationOrderStatusChangedEvent(order_id=uuid4(), order_status=order_status)
+
+    message = order_status_changed_pb2.OrderStatusChangedIntegrationEvent.FromString(
+        encode_integration_event(event, PROTOBUF_CONTENT_TYPE)
+    )
+
+    assert message.orderId == str(event.order_id)
+    assert order_status_changed_pb2.OrderStatus.Name(message.orderStatus) == f"ORDER_STATUS_{order_status.name.name}"
+
+
+def test_encode_unsupported_content_type():
+    event = IntegrationOrderStatusChangedEvent(order_id=uuid4(), order_status=OrderStatus.created())
+
+    with pytest.raises(ValueError):
+        encode_integration_event(event, "text/plain")
+
+
+def test_lean_decoding_skips_fields_not_needed_for_order():
+    example = json.loads(basket_confirmed_message())
+    example["Items"] = [{"Price": "not a number"}]
+    del example["DeliveryPeriod"]
+    body = json.dumps(example).encode("utf-8")
+
+    command = decode_basket_confirmed(body, JSON_CONTENT_TYPE, lean=True)
+
+    assert command.street == example["Address"]["Street"]
+    assert command.volume == example["Volume"]
+    with pytest.raises(ValidationError):
+        decode_basket_confirmed(body, JSON_CONTENT_TYPE, lean=False)
+
+
+@pytest.mark.parametrize("volume", [0, -3])
+def test_decode_basket_confirmed_protobuf_rejects_non_positive_volume(volume):
+    body = basket_confirmed_pb2.BasketConfirmedIntegrationEvent(
+        basketId=str(uuid4()), address=basket_confirmed_pb2.Address(street="Тверская"), Volume=volume
+    ).SerializeToString()
+
+    with pytest.raises(ValidationError):
+        decode_basket_confirmed(body, PROTOBUF_CONTENT_TYPE)
+
+
+@pytest.mark.parametrize(
+    "value, headers",
+    [
+        (b"not json", []),
+        (basket_confirmed_message(), [("content-type", b"text/plain")]),
+        (b"\xff\xff", [("content-type", b"application/x-protobuf")]),
+    ],
+)
+def test_decode_valid_record_skips_invalid_records(value, headers):
+    invalid = metrics.counter("basket_confirmed_invalid_total")
+    skipped_before = invalid.value
+
+    assert decode_valid_basket_confirmed_record(make_record(value, headers), JSON_CONTENT_TYPE) is None
+    assert invalid.value == skipped_before + 1
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from api.adapters.kafka.lanes import KeyedLanesExecutor
+
+
+@pytest.mark.asyncio
+async def test_lanes_preserve_order_within_key():
+    processed = []
+
+    async def handler(item):
+        key, index = item
+        # Первое сообщение ключа "a" медленное: второе не должно его обогнать
+        await asyncio.sleep(0.02 if item == ("a", 0) else 0)
+        processed.append(item)
+
+    items = [("a", 0), ("b", 0), ("a", 1), ("b", 1)]
+
+    await KeyedLanesExecutor(max_concurrency=4).run(items, key=lambda item: item[0], handler=handler)
+
+    assert [item for item in processed if item[0] == "a"] == [("a", 0), ("a", 1)]
+    assert [item for item in processed if item[0] == "b"] == [("b", 0), ("b", 1)]
+    # Полоса "b" не ждет медленную полосу "a"
+    assert processed.index(("b", 1)) < processed.index(("a", 0))
+
+
+@pytest.mark.asyncio
+async def test_lanes_limit_concurrency():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(item):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    await KeyedLanesExecutor(max_concurrency=3).run(list(range(10)), key=lambda item: item, handler=handler)
+
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_lanes_propagate_handler_errors():
+    async def handler(item):
+        if item == 2:
+            raise RuntimeError("Handler failed")
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        await KeyedLanesExecutor(max_concurrency=2).run([1, 2, 3], key=lambda item: item, handler=handler)
+
+    assert exc_info.group_contains(RuntimeError, match="Handler failed")
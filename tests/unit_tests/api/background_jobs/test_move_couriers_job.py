@@ -0,0 +1,109 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from api.adapters.background_jobs.move_couriers_job import ShardedMoveCouriersJob
+
+
+class FakeLeaderElection:
+    """Общая таблица блокировок вместо Postgres."""
+
+    locks: dict[str, object] = {}
+
+    def __init__(self, owner: object, name: str):
+        self.owner = owner
+        self.name = name
+
+    @property
+    def holds_lock(self) -> bool:
+        return self.locks.get(self.name) is self.owner
+
+    async def is_leader(self) -> bool:
+        return self.locks.setdefault(self.name, self.owner) is self.owner
+
+    async def release(self) -> None:
+        if self.holds_lock:
+            del self.locks[self.name]
+
+
+class FakeWorkerLeases:
+    """Общий список живых воркеров вместо worker_leases."""
+
+    live: set[object] = set()
+
+    def __init__(self, owner: object):
+        self.owner = owner
+
+    async def renew(self) -> int:
+        self.live.add(self.owner)
+        return len(self.live)
+
+    async def release(self) -> None:
+        self.live.discard(self.owner)
+
+
+def make_job(owner: object, use_case: Mock, shard_count: int = 4) -> ShardedMoveCouriersJob:
+    return ShardedMoveCouriersJob(
+        use_case_factory=lambda: use_case,
+        leader_election_factory=lambda name: FakeLeaderElection(owner, name),
+        worker_leases=FakeWorkerLeases(owner),
+        shard_count=shard_count,
+    )
+
+
+async def settle(jobs: list[ShardedMoveCouriersJob], rounds: int = 3) -> list[list[int]]:
+    """Несколько тиков всех воркеров по очереди, пока шарды не перераспределятся."""
+    owned = []
+    for _ in range(rounds):
+        owned = [await job.acquire_shards() for job in jobs]
+    return owned
+
+
+@pytest.fixture(autouse=True)
+def clear_locks():
+    FakeLeaderElection.locks.clear()
+    FakeWorkerLeases.live.clear()
+
+
+@pytest.mark.asyncio
+async def test_shards_are_split_between_workers():
+    use_case = Mock(handle=AsyncMock(return_value=1))
+    first = make_job("first", use_case)
+    second = make_job("second", use_case)
+
+    # Первый воркер один и берет все шарды, с появлением второго отпускает половину
+    await first.execute()
+    assert await second.acquire_shards() == []
+
+    assert await settle([first, second]) == [[0, 1], [2, 3]]
+    handled = sorted((call.args[0].shard, call.args[0].shard_count) for call in use_case.handle.await_args_list)
+    assert handled == [(0, 4), (1, 4), (2, 4), (3, 4)]
+
+
+@pytest.mark.asyncio
+async def test_shards_of_stopped_worker_are_taken_over_when_survivors_are_at_their_share():
+    use_case = Mock(handle=AsyncMock(return_value=1))
+    jobs = [make_job(owner, use_case, shard_count=6) for owner in ("first", "second", "third")]
+    assert await settle(jobs) == [[0, 1], [2, 3], [4, 5]]
+
+    # Падение воркера: блокировки сняты вместе с соединением, аренда еще не истекла
+    for election in jobs[2].shard_elections:
+        await election.release()
+    assert await settle(jobs[:2]) == [[0, 1], [2, 3]]
+
+    # Аренда истекла: доля выживших растет, шарды упавшего разобраны
+    FakeWorkerLeases.live.discard("third")
+    owned = await settle(jobs[:2])
+    assert sorted(shard for shards in owned for shard in shards) == [0, 1, 2, 3, 4, 5]
+    assert [len(shards) for shards in owned] == [3, 3]
+
+
+@pytest.mark.asyncio
+async def test_failed_shard_does_not_stop_others():
+    use_case = Mock(handle=AsyncMock(side_effect=[RuntimeError("db error"), 1, 1, 1]))
+    job = make_job("worker", use_case)
+
+    moved = await job.execute()
+
+    assert use_case.handle.await_count == 4
+    assert moved == 3
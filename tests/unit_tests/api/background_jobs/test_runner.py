@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from api.adapters.background_jobs.runner import PeriodicJobRunner
+from infrastructure.adapters.in_process import InProcessAssignmentTrigger
+from infrastructure.metrics import metrics
+
+
+@pytest.fixture(autouse=True)
+def clear_metrics():
+    metrics.clear()
+
+
+@pytest.mark.asyncio
+async def test_runner_never_overlaps_and_counts_overruns():
+    running = 0
+    max_running = 0
+
+    async def slow_job() -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.03)
+        running -= 1
+        return 1
+
+    runner = PeriodicJobRunner("slow", slow_job, interval=0.01)
+    runner.start()
+    await asyncio.sleep(0.1)
+    await runner.stop()
+
+    snapshot = metrics.snapshot()
+    assert max_running == 1
+    assert snapshot["job_overruns_total{job=slow}"] == snapshot["job_runs_total{job=slow}"] >= 2
+    assert snapshot["job_duration_seconds{job=slow}"]["count"] >= 2
+
+
+def test_adaptive_runner_runs_back_to_back_with_backlog_and_relaxes_when_idle():
+    runner = PeriodicJobRunner("assign", lambda: None, interval=1, adaptive=True, max_interval=4)
+
+    assert runner._next_delay(1, 0.1) == 0
+    assert [runner._next_delay(0, 0.1) for _ in range(4)] == [1, 2, 4, 4]
+    assert runner._next_delay(1, 0.1) == 0
+    assert runner._next_delay(0, 0.1) == 1
+
+
+def test_fixed_rate_runner_subtracts_duration():
+    runner = PeriodicJobRunner("move", lambda: None, interval=2)
+
+    assert runner._next_delay(5, 0.5) == 1.5
+    assert runner._next_delay(5, 3) == 0
+
+
+@pytest.mark.asyncio
+async def test_runner_survives_job_errors():
+    async def failing_job() -> int:
+        raise RuntimeError("db error")
+
+    runner = PeriodicJobRunner("failing", failing_job, interval=1)
+
+    assert await runner.run_once() is None
+    assert metrics.snapshot()["job_errors_total{job=failing}"] == 1
+
+
+@pytest.mark.asyncio
+async def test_trigger_wakes_idle_runner_and_coalesces_notifications():
+    trigger = InProcessAssignmentTrigger(debounce=0.01)
+    runs = 0
+
+    async def assign_job() -> int:
+        nonlocal runs
+        runs += 1
+        return 0
+
+    runner = PeriodicJobRunner("assign", assign_job, interval=10, adaptive=True, wake_trigger=trigger)
+    runner.start()
+    await asyncio.sleep(0.01)
+    assert runs == 1
+
+    for _ in range(5):
+        trigger.notify()
+    await asyncio.sleep(0.05)
+    await runner.stop()
+
+    assert runs == 2
+    assert metrics.snapshot()["job_wakeups_total{job=assign}"] == 1
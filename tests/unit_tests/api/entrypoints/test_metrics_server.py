@@ -0,0 +1,34 @@
+import asyncio
+import json
+
+import pytest
+
+from api.entrypoints.base import start_metrics_server
+from infrastructure.metrics import metrics
+
+
+async def get(port: int, path: str) -> tuple[bytes, bytes]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return head.split(b"\r\n")[0], body
+
+
+@pytest.mark.asyncio
+async def test_metrics_server_serves_process_metrics():
+    metrics.counter("job_errors_total", job="assign_orders").inc()
+    server = await start_metrics_server("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        status, body = await get(port, "/metrics")
+        assert status == b"HTTP/1.1 200 OK"
+        assert json.loads(body) == json.loads(json.dumps(metrics.snapshot()))
+
+        status, _ = await get(port, "/other")
+        assert status == b"HTTP/1.1 404 Not Found"
+    finally:
+        server.close()
+        await server.wait_closed()
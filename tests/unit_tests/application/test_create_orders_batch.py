@@ -0,0 +1,51 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from core.application.use_cases.commands.create_order import CreateOrderCommand
+from core.application.use_cases.commands.create_orders_batch import CreateOrdersBatchCommand, CreateOrdersBatchUseCase
+from core.domain.shared_kernel.location import Location
+from tests.fixtures.mocks import FakeUnitOfWork
+
+
+class TrackingUnitOfWork(FakeUnitOfWork):
+    """Помнит, открыта ли транзакция."""
+
+    def __init__(self):
+        super().__init__()
+        self.active = False
+
+    async def __aenter__(self):
+        self.active = True
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.active = False
+        await super().__aexit__(exc_type, exc_val, exc_tb)
+
+
+@pytest.mark.asyncio
+async def test_locations_are_resolved_outside_transaction_with_bounded_concurrency():
+    uow = TrackingUnitOfWork()
+    uow.order_repository.get_existing_order_ids.return_value = set()
+    uow.order_repository.add_orders.side_effect = lambda orders: orders
+    in_flight = 0
+    max_in_flight = 0
+
+    class GeoService:
+        async def get_location(self, street: str) -> Location:
+            nonlocal in_flight, max_in_flight
+            assert not uow.active
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return Location.create(2, 2)
+
+    use_case = CreateOrdersBatchUseCase(uow=uow, geo_service=GeoService(), geocode_concurrency=3)
+    commands = [CreateOrderCommand(basket_id=uuid4(), street=f"Street {i}", volume=1) for i in range(10)]
+
+    assert await use_case.handle(CreateOrdersBatchCommand(orders=commands)) == 10
+    assert max_in_flight == 3
+    uow.order_repository.add_orders.assert_awaited_once()
@@ -0,0 +1,50 @@
+from uuid import uuid4
+
+from core.domain.events.base import BaseDomainEvent, OrderStatusChangedEvent
+from core.domain.events.coalescing import coalesce_events
+from core.domain.model.order_aggregate.order_status import OrderStatus
+
+
+def status_changed(order_id, previous_status, order_status) -> OrderStatusChangedEvent:
+    return OrderStatusChangedEvent(order_id=order_id, previous_status=previous_status, order_status=order_status)
+
+
+def test_coalesce_keeps_last_state_and_first_previous_state():
+    order_id = uuid4()
+    events = [
+        status_changed(order_id, None, OrderStatus.created()),
+        status_changed(order_id, OrderStatus.created(), OrderStatus.assigned()),
+    ]
+
+    result = coalesce_events(events)
+
+    assert result == [status_changed(order_id, None, OrderStatus.assigned())]
+
+
+def test_coalesce_drops_transitions_returning_to_initial_state():
+    order_id = uuid4()
+    events = [
+        status_changed(order_id, OrderStatus.created(), OrderStatus.assigned()),
+        status_changed(order_id, OrderStatus.assigned(), OrderStatus.created()),
+    ]
+
+    assert coalesce_events(events) == []
+
+
+def test_coalesce_orders_aggregates_by_last_change():
+    first_id, second_id = uuid4(), uuid4()
+    events = [
+        status_changed(first_id, None, OrderStatus.created()),
+        status_changed(second_id, None, OrderStatus.created()),
+        status_changed(first_id, OrderStatus.created(), OrderStatus.assigned()),
+    ]
+
+    result = coalesce_events(events)
+
+    assert [event.order_id for event in result] == [second_id, first_id]
+
+
+def test_coalesce_keeps_events_without_key():
+    events = [BaseDomainEvent(), BaseDomainEvent()]
+
+    assert len(coalesce_events(events)) == 2
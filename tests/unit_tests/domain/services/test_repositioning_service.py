@@ -0,0 +1,60 @@
+import pytest
+
+from benchmarks.repositioning import average_time_to_pickup
+from core.domain.model.courier_aggregate.courier_aggregate import Courier
+from core.domain.services.repositioning_service import RepositioningPlanner
+from core.domain.shared_kernel.location import Location
+
+
+@pytest.fixture
+def planner() -> RepositioningPlanner:
+    return RepositioningPlanner()
+
+
+def make_couriers(*locations: Location) -> list[Courier]:
+    return [Courier.create(name=f"Courier {i}", speed=1, location=location) for i, location in enumerate(locations)]
+
+
+def test_plan_keeps_reserve_in_place(planner: RepositioningPlanner):
+    couriers = make_couriers(*(Location.create(1, y) for y in range(1, 11)))
+
+    plan = planner.plan(couriers, [(Location.create(10, 10), 40)], reserve_fraction=0.3)
+
+    assert len(plan) == 7
+    assert {target for _, target in plan} == {Location.create(10, 10)}
+    # К клетке идут ближайшие курьеры
+    assert {courier.location.y for courier, _ in plan} == set(range(4, 11))
+
+
+def test_plan_splits_couriers_by_demand(planner: RepositioningPlanner):
+    couriers = make_couriers(*(Location.create(5, 5) for _ in range(4)))
+    hot, warm = Location.create(2, 2), Location.create(9, 9)
+
+    plan = planner.plan(couriers, [(hot, 24), (warm, 8)], reserve_fraction=0)
+
+    targets = [target for _, target in plan]
+    assert targets.count(hot) == 3
+    assert targets.count(warm) == 1
+
+
+def test_plan_does_not_crowd_cell_with_low_demand(planner: RepositioningPlanner):
+    couriers = make_couriers(*(Location.create(5, 5) for _ in range(6)))
+
+    plan = planner.plan(couriers, [(Location.create(1, 1), planner.ORDERS_PER_COURIER)], reserve_fraction=0)
+
+    assert len(plan) == 1
+
+
+def test_plan_without_hotspots_or_with_full_reserve_is_empty(planner: RepositioningPlanner):
+    couriers = make_couriers(Location.create(1, 1), Location.create(2, 2))
+
+    assert planner.plan(couriers, [], reserve_fraction=0) == []
+    assert planner.plan(couriers, [(Location.create(5, 5), 1)], reserve_fraction=1) == []
+
+
+@pytest.mark.asyncio
+async def test_repositioning_lowers_average_time_to_pickup():
+    baseline = await average_time_to_pickup(reserve_fraction=None)
+    repositioned = await average_time_to_pickup(reserve_fraction=0.3)
+
+    assert repositioned < baseline * 0.9
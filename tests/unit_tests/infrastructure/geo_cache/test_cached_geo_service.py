@@ -0,0 +1,143 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core.domain.shared_kernel.location import Location
+from core.ports.geo_service_interface import StreetNotFoundError
+from infrastructure.adapters.geo_cache import CachedGeoService, GeoCacheEntry, GeoCacheStore
+
+
+class InMemoryGeoCacheStore(GeoCacheStore):
+    def __init__(self):
+        self.entries: dict[str, GeoCacheEntry] = {}
+        self.reads = 0
+
+    async def get(self, street: str) -> GeoCacheEntry | None:
+        self.reads += 1
+        await asyncio.sleep(0)
+        return self.entries.get(street)
+
+    async def put(self, street: str, entry: GeoCacheEntry) -> None:
+        self.entries[street] = entry
+
+
+@pytest.fixture
+def geo_service():
+    return AsyncMock(get_location=AsyncMock(return_value=Location(x=3, y=4)))
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_skips_geo_service(geo_service):
+    cached = CachedGeoService(geo_service)
+
+    first = await cached.get_location("Тверская")
+    second = await cached.get_location("  тверская ")
+
+    assert first == second == Location(x=3, y=4)
+    geo_service.get_location.assert_awaited_once_with("Тверская")
+
+
+@pytest.mark.asyncio
+async def test_unknown_street_is_cached_negatively(geo_service):
+    geo_service.get_location.side_effect = StreetNotFoundError("not found")
+    cached = CachedGeoService(geo_service)
+
+    for _ in range(2):
+        with pytest.raises(StreetNotFoundError):
+            await cached.get_location("Несуществующая")
+
+    assert geo_service.get_location.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_and_lru_eviction(geo_service):
+    cached = CachedGeoService(geo_service, max_size=1, ttl=0)
+
+    await cached.get_location("a")
+    await cached.get_location("a")
+    assert geo_service.get_location.await_count == 2
+
+    cached = CachedGeoService(geo_service, max_size=1)
+    await cached.get_location("a")
+    await cached.get_location("b")
+    await cached.get_location("a")
+    assert geo_service.get_location.await_count == 5
+
+
+@pytest.mark.asyncio
+async def test_shared_store_survives_restart(geo_service):
+    store = InMemoryGeoCacheStore()
+
+    await CachedGeoService(geo_service, store=store).get_location("Тверская")
+    location = await CachedGeoService(geo_service, store=store).get_location("Тверская")
+
+    assert location == Location(x=3, y=4)
+    geo_service.get_location.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_store_failure_falls_back_to_geo_service(geo_service):
+    store = AsyncMock(
+        spec=GeoCacheStore, get=AsyncMock(side_effect=ConnectionError), put=AsyncMock(side_effect=ConnectionError)
+    )
+
+    location = await CachedGeoService(geo_service, store=store).get_location("Тверская")
+
+    assert location == Location(x=3, y=4)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_request(geo_service):
+    release = asyncio.Event()
+
+    async def get_location(street: str) -> Location:
+        await release.wait()
+        return Location(x=3, y=4)
+
+    geo_service.get_location.side_effect = get_location
+    cached = CachedGeoService(geo_service)
+
+    lookups = [asyncio.create_task(cached.get_location(street)) for street in ["Тверская", "тверская", "Тверская "]]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*lookups) == [Location(x=3, y=4)] * 3
+    geo_service.get_location.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookup_errors_are_shared_but_not_cached(geo_service):
+    release = asyncio.Event()
+
+    async def get_location(street: str) -> Location:
+        await release.wait()
+        raise ConnectionError("geo service unavailable")
+
+    geo_service.get_location.side_effect = get_location
+    cached = CachedGeoService(geo_service)
+
+    lookups = [asyncio.create_task(cached.get_location("Тверская")) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*lookups, return_exceptions=True)
+
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert geo_service.get_location.await_count == 1
+
+    geo_service.get_location.side_effect = None
+    assert await cached.get_location("Тверская") == Location(x=3, y=4)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_store_read(geo_service):
+    store = InMemoryGeoCacheStore()
+    await CachedGeoService(geo_service, store=store).get_location("Тверская")
+    store.reads = 0
+    cached = CachedGeoService(geo_service, store=store)
+
+    locations = await asyncio.gather(*(cached.get_location("Тверская") for _ in range(5)))
+
+    assert locations == [Location(x=3, y=4)] * 5
+    assert store.reads == 1
+    geo_service.get_location.assert_awaited_once()
@@ -0,0 +1,53 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core.domain.shared_kernel.location import Location
+from infrastructure.adapters.geo_table import GeoTable, LocalTableGeoService, build_geo_table
+
+
+@pytest.fixture
+def table_path(tmp_path):
+    path = str(tmp_path / "geo_table.bin")
+    rows = [(f"Улица {i}", i % 10 + 1, i % 7 + 1) for i in range(1000)]
+    rows.append(("Тверская", 1, 1))
+    rows.append(("  тверская ", 3, 4))
+    build_geo_table(rows, path)
+    return path
+
+
+def test_geo_table_lookup(table_path):
+    table = GeoTable(table_path)
+
+    assert len(table) == 1001
+    assert table.lookup("Тверская") == Location(x=3, y=4)
+    assert table.lookup("Улица 123") == Location(x=4, y=5)
+    assert table.lookup("Арбат") is None
+    table.close()
+
+
+def test_geo_table_rejects_unknown_file(tmp_path):
+    path = tmp_path / "broken.bin"
+    path.write_bytes(b"\x00" * 64)
+
+    with pytest.raises(ValueError):
+        GeoTable(str(path))
+
+
+@pytest.mark.parametrize("x, y", [(0, 1), (11, 1), (1, -1), (1, 70000)])
+def test_build_geo_table_rejects_out_of_grid_locations(tmp_path, x, y):
+    path = tmp_path / "geo_table.bin"
+
+    with pytest.raises(ValueError, match="Invalid location"):
+        build_geo_table([("Тверская", 1, 1), ("Арбат", x, y)], str(path))
+    assert not path.exists()
+
+
+@pytest.mark.asyncio
+async def test_local_table_geo_service_falls_back_on_miss(table_path):
+    fallback = AsyncMock(get_location=AsyncMock(return_value=Location(x=9, y=9)))
+    geo_service = LocalTableGeoService(GeoTable(table_path), fallback=fallback)
+
+    assert await geo_service.get_location("Тверская") == Location(x=3, y=4)
+    assert await geo_service.get_location("Арбат") == Location(x=9, y=9)
+    fallback.get_location.assert_awaited_once_with("Арбат")
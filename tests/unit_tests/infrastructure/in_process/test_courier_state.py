@@ -0,0 +1,124 @@
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from core.domain.model.courier_aggregate.courier_aggregate import Courier
+from core.domain.model.order_aggregate.order_aggregate import Order
+from core.domain.model.order_aggregate.order_status import OrderStatus
+from core.domain.shared_kernel.location import Location
+from infrastructure.adapters.in_process import InMemoryCourierState
+
+
+def make_assignment(courier_location: Location, order_location: Location, speed: int = 1) -> tuple[Courier, Order]:
+    courier = Courier.create(name="Test Courier", speed=speed, location=courier_location)
+    order = Order.create(order_id=uuid4(), location=order_location, volume=1)
+    courier.take_order(order)
+    return courier, order
+
+
+@pytest.fixture
+def courier_state(fake_uow):
+    return InMemoryCourierState(uow_factory=Mock(return_value=fake_uow))
+
+
+@pytest.mark.asyncio
+async def test_tick_moves_in_memory_and_flush_coalesces_ticks(courier_state, fake_uow):
+    courier, order = make_assignment(Location.create(1, 1), Location.create(5, 5))
+    courier_state.track_assignment(courier, order)
+
+    assert await courier_state.tick() == 1
+    assert await courier_state.tick() == 1
+
+    # Тики не обращаются к базе
+    fake_uow.courier_repository.get_courier.assert_not_awaited()
+    assert fake_uow.commits == 0
+
+    assert await courier_state.flush() == 1
+    fake_uow.courier_repository.update_locations.assert_awaited_once_with({courier.id: Location(x=3, y=1)})
+    assert await courier_state.flush() == 0
+
+
+@pytest.mark.asyncio
+async def test_arrival_completes_order_in_transaction(courier_state, fake_uow):
+    courier, order = make_assignment(Location.create(1, 1), Location.create(1, 3), speed=2)
+    fake_uow.courier_repository.get_courier.return_value = courier
+    fake_uow.order_repository.get_order.return_value = order
+    courier_state.track_assignment(courier, order)
+
+    await courier_state.tick()
+
+    assert order.order_status == OrderStatus.completed()
+    assert courier.location == Location(x=1, y=3)
+    fake_uow.order_repository.update_order.assert_awaited_once_with(order)
+    fake_uow.courier_repository.update_courier.assert_awaited_once_with(courier)
+    assert fake_uow.commits == 1
+
+    # Позиция записана вместе с доставкой, курьер свободен
+    assert await courier_state.flush() == 0
+    assert await courier_state.tick() == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_positions_dirty(courier_state, fake_uow):
+    courier, order = make_assignment(Location.create(1, 1), Location.create(5, 5))
+    courier_state.track_assignment(courier, order)
+    await courier_state.tick()
+    fake_uow.courier_repository.update_locations.side_effect = ConnectionError("db is down")
+
+    with pytest.raises(ConnectionError):
+        await courier_state.flush()
+
+    fake_uow.courier_repository.update_locations.side_effect = None
+    assert await courier_state.flush() == 1
+
+
+@pytest.mark.asyncio
+async def test_load_tracks_assigned_orders_and_keeps_memory_positions(courier_state, fake_uow):
+    courier, order = make_assignment(Location.create(1, 1), Location.create(5, 5))
+    courier_state.track_assignment(courier, order)
+    await courier_state.tick()
+
+    other_courier, other_order = make_assignment(Location.create(9, 9), Location.create(9, 5))
+    fake_uow.order_repository.get_all_assigned_orders.return_value = [order, other_order]
+    fake_uow.courier_repository.get_couriers.return_value = [other_courier]
+
+    await courier_state.load()
+
+    assert courier_state.is_loaded
+    fake_uow.courier_repository.get_couriers.assert_awaited_once_with([other_courier.id])
+    assert await courier_state.tick() == 2
+    await courier_state.flush()
+    fake_uow.courier_repository.update_locations.assert_awaited_once_with(
+        {courier.id: Location(x=3, y=1), other_courier.id: Location(x=9, y=8)}
+    )
+
+
+@pytest.mark.asyncio
+async def test_load_drops_orders_no_longer_assigned(courier_state, fake_uow):
+    courier, order = make_assignment(Location.create(1, 1), Location.create(5, 5))
+    courier_state.track_assignment(courier, order)
+    fake_uow.order_repository.get_all_assigned_orders.return_value = []
+
+    await courier_state.load()
+
+    assert await courier_state.tick() == 0
+
+
+@pytest.mark.asyncio
+async def test_order_that_cannot_be_completed_is_not_retracked(courier_state, fake_uow):
+    courier, order = make_assignment(Location.create(1, 1), Location.create(1, 2))
+    # В базе у курьера нет этого заказа: доставка невозможна, заказ остается назначенным
+    fake_uow.courier_repository.get_courier.return_value = Courier.create(
+        name="Other Courier", speed=1, location=Location.create(1, 1)
+    )
+    fake_uow.order_repository.get_order.return_value = order
+    courier_state.track_assignment(courier, order)
+
+    await courier_state.tick()
+    fake_uow.order_repository.get_all_assigned_orders.return_value = [order]
+    await courier_state.load()
+
+    assert await courier_state.tick() == 0
+    fake_uow.order_repository.update_order.assert_not_awaited()
+    assert fake_uow.courier_repository.get_courier.await_count == 1
@@ -0,0 +1,91 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from core.domain.shared_kernel.location import Location
+from infrastructure.adapters.in_process import DemandHeatmap
+from infrastructure.adapters.in_process.demand_heatmap import REFRESH_GRACE_MINUTES, from_minute
+from infrastructure.adapters.postgres.projections import cell_index
+
+NOW = 29_000_000
+
+
+def bucket_row(minute: int, location: Location, created: int = 0, assigned: int = 0, completed: int = 0) -> tuple:
+    return from_minute(minute), cell_index(location), created, assigned, completed
+
+
+@pytest.fixture
+def store():
+    return Mock(read_since=AsyncMock(return_value=[]))
+
+
+@pytest.fixture
+def heatmap(store):
+    return DemandHeatmap(store, buckets=10, refresh_interval=0)
+
+
+@pytest.mark.asyncio
+async def test_window_sums_minute_buckets_per_cell(heatmap, store):
+    hot, cold = Location(x=2, y=3), Location(x=9, y=9)
+    store.read_since.return_value = [
+        bucket_row(NOW - 5, hot, created=2),
+        bucket_row(NOW, hot, created=1, assigned=1),
+        bucket_row(NOW, cold, completed=4),
+    ]
+
+    await heatmap.refresh(NOW)
+
+    store.read_since.assert_awaited_once_with(from_minute(NOW - 9))
+    assert heatmap.window("created", 10, NOW)[cell_index(hot)] == 3
+    assert heatmap.window("created", 1, NOW)[cell_index(hot)] == 1
+    assert heatmap.window("completed", 10, NOW)[cell_index(cold)] == 4
+    assert sum(heatmap.window("assigned", 10, NOW)) == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_reads_only_new_buckets_and_expires_old_ones(heatmap, store):
+    location = Location(x=5, y=5)
+    store.read_since.return_value = [bucket_row(NOW, location, created=1)]
+    await heatmap.refresh(NOW)
+
+    # Текущая минута пополнилась, и началась новая
+    store.read_since.return_value = [bucket_row(NOW, location, created=3), bucket_row(NOW + 1, location, created=1)]
+    await heatmap.refresh(NOW + 1)
+
+    store.read_since.assert_awaited_with(from_minute(NOW - REFRESH_GRACE_MINUTES))
+    assert heatmap.window("created", 2, NOW + 1)[cell_index(location)] == 4
+
+    # Через 10 минут корзина NOW занята новой минутой и вышла из окна
+    store.read_since.return_value = [bucket_row(NOW + 10, location, created=2)]
+    await heatmap.refresh(NOW + 10)
+    assert heatmap.window("created", 10, NOW + 10)[cell_index(location)] == 3
+
+
+@pytest.mark.asyncio
+async def test_hotspots_are_sorted_by_created_orders(heatmap, store):
+    store.read_since.return_value = [
+        bucket_row(NOW, Location(x=1, y=1), created=1),
+        bucket_row(NOW, Location(x=4, y=7), created=5),
+        bucket_row(NOW, Location(x=10, y=10), assigned=9),
+    ]
+    heatmap._current_minute = lambda: NOW
+
+    assert await heatmap.hotspots(window_minutes=5, limit=5) == [(Location(x=4, y=7), 5), (Location(x=1, y=1), 1)]
+
+
+def test_window_is_limited_by_buckets(heatmap):
+    with pytest.raises(ValueError):
+        heatmap.window("created", 11, NOW)
+
+
+@pytest.mark.asyncio
+async def test_refresh_picks_up_late_commits_to_synced_minutes(heatmap, store):
+    location = Location(x=5, y=5)
+    await heatmap.refresh(NOW)
+    await heatmap.refresh(NOW + 1)
+
+    # Транзакция выбрала корзину NOW, но зафиксировалась уже после двух обновлений
+    store.read_since.return_value = [bucket_row(NOW, location, created=1)]
+    await heatmap.refresh(NOW + 2)
+
+    assert heatmap.window("created", 3, NOW + 2)[cell_index(location)] == 1
@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from core.domain.shared_kernel.location import Location
+from infrastructure.adapters.in_process import CourierLocationBuffer
+
+NOW = datetime(2025, 7, 6, 6, 25, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def location_buffer(fake_uow):
+    return CourierLocationBuffer(uow_factory=Mock(return_value=fake_uow))
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_latest_location_per_courier_in_one_update(location_buffer, fake_uow):
+    first, second = uuid4(), uuid4()
+    location_buffer.add(first, Location(x=1, y=1), NOW)
+    location_buffer.add(first, Location(x=3, y=3), NOW + timedelta(seconds=2))
+    location_buffer.add(first, Location(x=2, y=2), NOW + timedelta(seconds=1))
+    location_buffer.add(second, Location(x=5, y=5), NOW)
+
+    assert await location_buffer.flush() == 2
+
+    fake_uow.courier_repository.update_locations.assert_awaited_once_with(
+        {first: Location(x=3, y=3), second: Location(x=5, y=5)}
+    )
+    assert await location_buffer.flush() == 0
+
+
+@pytest.mark.asyncio
+async def test_location_older_than_flushed_is_dropped(location_buffer):
+    courier_id = uuid4()
+    location_buffer.add(courier_id, Location(x=3, y=3), NOW)
+    await location_buffer.flush()
+
+    assert not location_buffer.add(courier_id, Location(x=1, y=1), NOW - timedelta(seconds=1))
+    assert location_buffer.add(courier_id, Location(x=4, y=3), NOW + timedelta(seconds=1))
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_newer_locations(location_buffer, fake_uow):
+    courier_id = uuid4()
+    location_buffer.add(courier_id, Location(x=1, y=1), NOW)
+
+    async def fail_after_new_ping(locations):
+        location_buffer.add(courier_id, Location(x=2, y=1), NOW + timedelta(seconds=1))
+        raise ConnectionError("db is down")
+
+    fake_uow.courier_repository.update_locations.side_effect = fail_after_new_ping
+    with pytest.raises(ConnectionError):
+        await location_buffer.flush()
+
+    fake_uow.courier_repository.update_locations.side_effect = None
+    assert await location_buffer.flush() == 1
+    fake_uow.courier_repository.update_locations.assert_awaited_with({courier_id: Location(x=2, y=1)})
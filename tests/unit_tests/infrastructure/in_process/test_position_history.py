@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from core.domain.shared_kernel.location import Location
+from infrastructure.adapters.in_process import CourierPositionHistory
+
+NOW = datetime(2025, 7, 6, 9, 25, tzinfo=timezone(timedelta(hours=3)))
+
+
+@pytest.fixture
+def store():
+    return Mock(append=AsyncMock())
+
+
+@pytest.mark.asyncio
+async def test_flush_appends_buffered_positions_in_one_batch(store):
+    history = CourierPositionHistory(store)
+    courier_id = uuid4()
+    history.record(courier_id, Location(x=1, y=1), NOW)
+    history.record(courier_id, Location(x=2, y=1), NOW + timedelta(seconds=2))
+
+    assert await history.flush() == 2
+
+    # Время приводится к UTC без часового пояса
+    store.append.assert_awaited_once_with(
+        [(courier_id, 1, 1, datetime(2025, 7, 6, 6, 25)), (courier_id, 2, 1, datetime(2025, 7, 6, 6, 25, 2))]
+    )
+    assert await history.flush() == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_positions_up_to_max_buffer(store):
+    history = CourierPositionHistory(store, max_buffer=2)
+    courier_id = uuid4()
+    for x in (1, 2, 3):
+        history.record(courier_id, Location(x=x, y=1), NOW + timedelta(seconds=x))
+    store.append.side_effect = ConnectionError("db is down")
+
+    with pytest.raises(ConnectionError):
+        await history.flush()
+
+    assert len(history) == 2
+    store.append.side_effect = None
+    await history.flush()
+    assert [row[1] for row in store.append.await_args.args[0]] == [2, 3]
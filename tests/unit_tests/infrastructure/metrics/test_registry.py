@@ -0,0 +1,44 @@
+import pytest
+
+from infrastructure.metrics import MetricsRegistry
+
+
+def test_registry_returns_same_metric_for_same_name_and_labels():
+    registry = MetricsRegistry()
+
+    registry.counter("jobs_total", job="assign").inc()
+    registry.counter("jobs_total", job="assign").inc(2)
+    registry.counter("jobs_total", job="move").inc()
+
+    snapshot = registry.snapshot()
+    assert snapshot["jobs_total{job=assign}"] == 3
+    assert snapshot["jobs_total{job=move}"] == 1
+
+
+def test_counter_cannot_be_decremented():
+    registry = MetricsRegistry()
+
+    with pytest.raises(ValueError):
+        registry.counter("jobs_total").inc(-1)
+
+
+def test_gauge_holds_last_value():
+    registry = MetricsRegistry()
+
+    registry.gauge("backlog").set(10)
+    registry.gauge("backlog").set(3)
+
+    assert registry.snapshot()["backlog"] == 3
+
+
+def test_histogram_counts_observations_cumulatively():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", buckets=(0.1, 1.0))
+
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    snapshot = registry.snapshot()["latency_seconds"]
+    assert snapshot["count"] == 4
+    assert snapshot["sum"] == pytest.approx(2.65)
+    assert snapshot["buckets"] == {"0.1": 2, "1.0": 3, "inf": 4}
@@ -0,0 +1,32 @@
+from uuid import uuid4
+
+from core.domain.events.base import OrderStatusChangedEvent
+from core.domain.events.coalescing import coalesce_events
+from core.domain.model.order_aggregate.order_status import OrderStatus
+from infrastructure.adapters.postgres.projections import order_counter_deltas
+
+
+def test_order_counter_deltas_follow_status_transitions():
+    created_id, assigned_id = uuid4(), uuid4()
+    events = [
+        OrderStatusChangedEvent(order_id=created_id, order_status=OrderStatus.created()),
+        OrderStatusChangedEvent(
+            order_id=assigned_id, order_status=OrderStatus.completed(), previous_status=OrderStatus.assigned()
+        ),
+    ]
+
+    assert order_counter_deltas(events) == {"orders_created": 1, "orders_assigned": -1, "orders_completed": 1}
+
+
+def test_order_created_and_assigned_in_one_transaction_counts_once():
+    order_id = uuid4()
+    events = coalesce_events(
+        [
+            OrderStatusChangedEvent(order_id=order_id, order_status=OrderStatus.created()),
+            OrderStatusChangedEvent(
+                order_id=order_id, order_status=OrderStatus.assigned(), previous_status=OrderStatus.created()
+            ),
+        ]
+    )
+
+    assert +order_counter_deltas(events) == {"orders_assigned": 1}